@@ -0,0 +1,91 @@
+"""Login latency and bulk password migration throughput over a freshly seeded dataset.
+
+To run: python -m benchmarks.bench_credentials
+"""
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from benchmarks.harness import seed_dataset
+from breeze.services.auth_service import AuthService
+from breeze.utils.credential_utils import get_work_factor, is_hashed
+
+# A small private dataset: the seeder writes plaintext passwords, so every block below
+# starts from real plaintext rather than from whatever data/users.json currently holds
+DATASET = dict(patients=20, mhwps=4, years=0.1, moods_per_day=1, journals_per_day=0.3)
+REHASH_ROUNDS = 3
+
+
+def load_plaintext_passwords(seeded_path):
+    """Returns username -> plaintext password, as written by the seeder."""
+    with open(seeded_path) as file:
+        return {user["username"]: user["password"] for user in json.load(file)["users"]}
+
+
+def copy_dataset(seeded_path, target_dir, name):
+    """Copies the plaintext dataset, so each block starts from a fresh file."""
+    target_path = os.path.join(target_dir, name)
+    shutil.copyfile(seeded_path, target_path)
+    return target_path
+
+
+def time_logins(auth_service, passwords, repeats=5):
+    """Times verify_credentials for every user, returning latencies in milliseconds."""
+    latencies = []
+    for _ in range(repeats):
+        for username, password in passwords.items():
+            user = auth_service.get_user_by_username(username)
+            start = time.perf_counter()
+            assert auth_service.verify_credentials(user, password)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label, latencies):
+    print(
+        f"{label:<32} n={len(latencies):<6} "
+        f"median={statistics.median(latencies):8.3f} ms  "
+        f"max={max(latencies):8.3f} ms"
+    )
+
+
+def main():
+    print(f"Work factor: {get_work_factor()} PBKDF2 iterations\n")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        seeded_path = seed_dataset(os.path.join(tmp_dir, "seeded.json"), **DATASET)
+        passwords = load_plaintext_passwords(seeded_path)
+
+        # Bulk migration of every plaintext password, with a single save.
+        auth_service = AuthService(copy_dataset(seeded_path, tmp_dir, "migration.json"))
+        start = time.perf_counter()
+        migrated = auth_service.migrate_plaintext_passwords()
+        elapsed = time.perf_counter() - start
+        print(
+            f"Bulk migration: {migrated} users in {elapsed:.3f} s "
+            f"({migrated / elapsed if elapsed else 0:.1f} users/s)\n"
+        )
+
+        # Cold logins pay for the key derivation, warm logins then hit the session cache.
+        hashed_path = copy_dataset(seeded_path, tmp_dir, "hashed.json")
+        AuthService(hashed_path).migrate_plaintext_passwords()
+        auth_service = AuthService(hashed_path)
+        assert all(is_hashed(user.get_password()) for user in auth_service.users.values())
+        report("Login (cold, hashed)", time_logins(auth_service, passwords, repeats=1))
+        report("Login (warm, session cache)", time_logins(auth_service, passwords))
+
+        # Rehash-on-login: each user's first login migrates them, so every round starts
+        # from a fresh plaintext copy and a fresh AuthService with an empty cache.
+        latencies = []
+        for round_number in range(REHASH_ROUNDS):
+            auth_service = AuthService(copy_dataset(seeded_path, tmp_dir, f"rehash{round_number}.json"))
+            latencies.extend(time_logins(auth_service, passwords, repeats=1))
+            assert all(is_hashed(user.get_password()) for user in auth_service.users.values())
+        report("Login (plaintext, rehash)", latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Mood aggregation and chart rendering over a patient with a long mood history, and
+population mood analytics over a caseload of such patients.
+
+To run: python -m benchmarks.bench_mood_chart [number_of_entries] [number_of_patients]
+"""
+import contextlib
+import datetime
+import io
+import random
+import statistics
+import sys
+import time
+import uuid
+from array import array
+
+from breeze.models.patient import Patient
+from breeze.services.mood_analytics_service import MoodAnalytics
+from breeze.utils.mood_aggregates import MOOD_LEVELS, parse_entry_date
+from breeze.utils.mood_chart_utils import plot_mood_chart
+
+DEFAULT_ENTRIES = 10000
+DEFAULT_PATIENTS = 100
+
+
+def generate_mood_entries(num_entries, seed=0):
+    """Generates one mood entry per day or so, ending today, oldest first."""
+    rng = random.Random(seed)
+    moods = list(MOOD_LEVELS)
+    start = datetime.datetime.now() - datetime.timedelta(days=num_entries)
+    return [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "mood": rng.choice(moods),
+            "comment": "",
+            "date": (start + datetime.timedelta(days=day, minutes=rng.randint(0, 1439))).strftime(
+                "%d-%m-%Y %H:%M:%S"
+            ),
+        }
+        for day in range(num_entries)
+    ]
+
+
+def time_call(function, repeats=20):
+    """Runs a function repeatedly with stdout discarded, returning latencies in milliseconds."""
+    latencies = []
+    for _ in range(repeats):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            function()
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label, latencies):
+    print(
+        f"{label:<36} n={len(latencies):<6} "
+        f"median={statistics.median(latencies):9.3f} ms  "
+        f"max={max(latencies):9.3f} ms"
+    )
+
+
+def build_mood_columns(patients):
+    """Copies every mood point into (patient id, day, level) arrays, for comparison with
+    MoodAnalytics, which reads the patients' aggregates in place instead."""
+    patient_ids, days, levels = array("I"), array("I"), array("B")
+    for patient_id, patient in enumerate(patients):
+        for entry in patient.get_mood_entries():
+            patient_ids.append(patient_id)
+            days.append(parse_entry_date(entry["date"]).toordinal())
+            levels.append(MOOD_LEVELS[entry["mood"]])
+    return patient_ids, days, levels
+
+
+def count_columns_in_window(days, levels, start, end):
+    counts = [0] * (len(MOOD_LEVELS) + 1)
+    for day, level in zip(days, levels):
+        if start <= day <= end:
+            counts[level] += 1
+    return counts
+
+
+def bench_population(num_entries, num_patients):
+    """Times caseload-wide analytics over num_patients patients with num_entries moods each."""
+    print(f"\nPopulation: {num_patients} patients x {num_entries} moods = {num_patients * num_entries} mood points\n")
+    patients = [
+        Patient(f"patient{index}", "", mood_entries=generate_mood_entries(num_entries, seed=index))
+        for index in range(num_patients)
+    ]
+    today = datetime.date.today()
+    start_date = today - datetime.timedelta(days=13)
+
+    report("MoodAnalytics.from_patients", time_call(lambda: MoodAnalytics.from_patients(patients)))
+    analytics = MoodAnalytics.from_patients(patients)
+    report(
+        "Distribution, last 14 days",
+        time_call(lambda: analytics.get_distribution(start_date, today)),
+    )
+    report("Distribution, full history", time_call(analytics.get_distribution, repeats=5))
+    report(
+        "7-day rolling average, last 14 days",
+        time_call(lambda: analytics.get_rolling_average(7, start_date, today)),
+    )
+    report(
+        "Declining patients (14 vs 28 days)",
+        time_call(lambda: analytics.get_declining_patients(today=today)),
+    )
+
+    # The columnar alternative: every view pays for the copy, and every window scans all points
+    report("Columnar: build arrays", time_call(lambda: build_mood_columns(patients), repeats=3))
+    _, days, levels = build_mood_columns(patients)
+    report(
+        "Columnar: distribution, last 14 days",
+        time_call(
+            lambda: count_columns_in_window(days, levels, start_date.toordinal(), today.toordinal()),
+            repeats=5,
+        ),
+    )
+
+
+def main():
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ENTRIES
+    num_patients = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PATIENTS
+    mood_entries = generate_mood_entries(num_entries)
+    print(f"Mood entries: {num_entries}\n")
+
+    report(
+        "Load patient (build aggregates)",
+        time_call(lambda: Patient("bench", "", mood_entries=mood_entries), repeats=5),
+    )
+    patient = Patient("bench", "", mood_entries=mood_entries)
+    aggregates = patient.get_mood_aggregates()
+
+    new_entries = generate_mood_entries(1000, seed=1)
+    latencies = []
+    for entry in new_entries:
+        start = time.perf_counter()
+        patient.add_mood_entry(entry["id"], entry["mood"], entry["comment"], entry["date"])
+        latencies.append((time.perf_counter() - start) * 1000)
+    report("add_mood_entry (incremental)", latencies)
+
+    for granularity in ("day", "week", "month"):
+        report(
+            f"Chart last 14 {granularity}s",
+            time_call(lambda: plot_mood_chart(aggregates, granularity, max_columns=14)),
+        )
+        report(
+            f"Chart full history by {granularity}",
+            time_call(lambda: plot_mood_chart(aggregates, granularity), repeats=5),
+        )
+
+    bench_population(num_entries, num_patients)
+
+
+if __name__ == "__main__":
+    main()
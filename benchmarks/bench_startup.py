@@ -0,0 +1,152 @@
+"""Cold-start cost of the app: import time and time to the first prompt.
+
+Import time is measured with python -X importtime, and the slowest modules are listed.
+Time to first prompt starts main.py in a fresh interpreter and waits for the main menu
+prompt, both with an existing users.json and with the seeder generating one. Results are
+saved as JSON so runs on different commits can be compared.
+
+To run: python -m benchmarks.bench_startup [--repeats N] [--output FILE] [--compare FILE]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.harness import (
+    RESULTS_DIR,
+    compare_results,
+    get_commit,
+    save_results,
+    seed_dataset,
+    summarise,
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT = b"> "
+SLOWEST_MODULES = 15
+
+
+def get_import_times(module="main"):
+    """Imports a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        list of tuple: (module name, self time in ms, cumulative time in ms), in import order.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        import_times.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return import_times
+
+
+def time_to_first_prompt(work_dir):
+    """Starts main.py in work_dir and returns the milliseconds until the first prompt."""
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(PROJECT_ROOT, "main.py")],
+        cwd=work_dir,
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    output = b""
+    while not output.endswith(PROMPT):
+        chunk = os.read(process.stdout.fileno(), 4096)
+        if not chunk:
+            raise RuntimeError(f"main.py exited before showing a prompt:\n{output.decode()}")
+        output += chunk
+    elapsed = (time.perf_counter() - start) * 1000
+    process.communicate(b"e\n")
+    return elapsed
+
+
+def bench_first_prompt(data_path, repeats, seed=False):
+    """Times the first prompt on a copy of data_path, or with the seeder creating users.json."""
+    latencies = []
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as work_dir:
+            os.makedirs(os.path.join(work_dir, "data"))
+            if seed:
+                shutil.copyfile(
+                    os.path.join(PROJECT_ROOT, "data", "seeder.py"),
+                    os.path.join(work_dir, "data", "seeder.py"),
+                )
+            else:
+                shutil.copyfile(data_path, os.path.join(work_dir, "data", "users.json"))
+            latencies.append(time_to_first_prompt(work_dir))
+    return summarise(latencies)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks Breeze start-up time.")
+    parser.add_argument("--repeats", type=int, default=10, help="runs of each measurement (default: 10)")
+    parser.add_argument(
+        "--output", help="results file (default: benchmarks/results/<commit>-startup.json)"
+    )
+    parser.add_argument("--compare", help="results file of an earlier run to compare with")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = {}
+
+    runs = [get_import_times() for _ in range(args.repeats)]
+    results["import main"] = summarise(
+        [next(cumulative for name, _, cumulative in reversed(run) if name == "main") for run in runs]
+    )
+
+    print(f"Slowest modules to import main (self time, median of {args.repeats} runs):")
+    self_times = {}
+    for run in runs:
+        for name, self_ms, _ in run:
+            self_times.setdefault(name, []).append(self_ms)
+    slowest = sorted(
+        ((sorted(times)[len(times) // 2], name) for name, times in self_times.items()),
+        reverse=True,
+    )[:SLOWEST_MODULES]
+    for self_ms, name in slowest:
+        print(f"  {self_ms:8.2f} ms  {name}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = seed_dataset(
+            os.path.join(tmp_dir, "users.json"),
+            patients=10,
+            mhwps=3,
+            years=0.25,
+            moods_per_day=1,
+            journals_per_day=0.3,
+        )
+        results["first prompt"] = bench_first_prompt(data_path, args.repeats)
+        results["first prompt (seeding)"] = bench_first_prompt(data_path, args.repeats, seed=True)
+
+    print()
+    for name, result in results.items():
+        print(
+            f"{name:<24} n={result['n']:<4} p50={result['p50_ms']:9.2f} ms  "
+            f"p90={result['p90_ms']:9.2f} ms  max={result['max_ms']:9.2f} ms"
+        )
+
+    results = {"startup": results}
+    output_path = args.output or os.path.join(RESULTS_DIR, f"{get_commit()}-startup.json")
+    print(f"\nResults saved to {save_results(results, output_path)}")
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
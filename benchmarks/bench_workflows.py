@@ -0,0 +1,169 @@
+"""End-to-end latency and peak memory of the core workflows over seeded datasets.
+
+Each workflow drives the real code path headlessly (scripted input, no sleeps, no output)
+against datasets of increasing size generated by data/seeder.py. Results are saved as JSON
+so runs on different commits can be compared.
+
+To run: python -m benchmarks.bench_workflows [--sizes small,medium,large]
+            [--data-dir DIR] [--output FILE] [--compare FILE]
+"""
+import argparse
+import itertools
+import os
+import shutil
+import tempfile
+
+from benchmarks.harness import (
+    compare_results,
+    measure,
+    print_results,
+    save_results,
+    seed_dataset,
+)
+from breeze.services.admin_service.view_summary import view_summary
+from breeze.services.auth_service import AuthService
+from breeze.services.mhwp_service.display_patient_summary import display_patient_summary
+from breeze.services.patient_service.history import show_journal_history
+from breeze.utils.calendar_utils import (
+    generate_calendar_slot_code_map,
+    generate_time_slots,
+    get_next_available_days,
+)
+from breeze.utils.credential_utils import VerifiedCredentialCache, hash_password
+from breeze.utils.data_utils import load_data, save_data
+from breeze.utils.mood_chart_utils import plot_mood_chart
+
+# Seeder parameters per dataset: patients, MHWPs, years of history, moods and journals per day
+DATASETS = {
+    "small": dict(patients=10, mhwps=3, years=0.25, moods_per_day=1, journals_per_day=0.3),
+    "medium": dict(patients=500, mhwps=20, years=1, moods_per_day=1, journals_per_day=0.3),
+    "large": dict(patients=5000, mhwps=100, years=2, moods_per_day=1, journals_per_day=0.5),
+}
+DEFAULT_SIZES = "small,medium"
+LOGIN_SAMPLE_SIZE = 20
+SEARCH_TERMS = ["today", "feeling", "work", "friends", "quiet", "family", "zzz-no-match"]
+
+
+def bench_dataset(data_path, scratch_dir):
+    """Runs every workflow against one dataset, returning workflow name -> result."""
+    results = {}
+
+    results["load_data"] = measure(lambda: load_data(data_path), repeats=3)
+
+    auth_service = AuthService(data_path)
+    users = list(auth_service.users.values())
+    save_path = os.path.join(scratch_dir, "saved.json")
+    results["save_data"] = measure(lambda: save_data(save_path, users), repeats=3)
+
+    # Sampled users get a hashed password up front, so logging in never rewrites the file
+    sample = users[:LOGIN_SAMPLE_SIZE]
+    for user in sample:
+        user.set_password(hash_password(""))
+    logins = itertools.cycle(sample)
+
+    def login():
+        # An empty session cache makes every login pay for the key derivation
+        user = next(logins)
+        auth_service.credential_cache = VerifiedCredentialCache()
+        return auth_service.verify_credentials(user, "")
+
+    results["login (cold)"] = measure(login, repeats=len(sample))
+    results["AuthService.login (warm)"] = measure(
+        auth_service.login, repeats=50, inputs=[sample[0].get_username(), ""]
+    )
+
+    # The busiest MHWP and the patient with the longest history stress the per-user paths
+    mhwp = max(auth_service.get_mhwps().values(), key=lambda mhwp: len(mhwp.get_appointments()))
+    patient = max(
+        auth_service.get_patients().values(),
+        key=lambda patient: len(patient.get_mood_entries()) + len(patient.get_journal_entries()),
+    )
+
+    results["MHWP.display_calendar"] = measure(mhwp.display_calendar)
+
+    slots = itertools.cycle(
+        generate_calendar_slot_code_map(
+            get_next_available_days(include_today=True), generate_time_slots()
+        ).values()
+    )
+
+    def check_slot():
+        # The double-booking checks made when a patient picks a slot
+        date, time = next(slots)
+        mhwp.get_appointment_by_date_time(date, time)
+        patient.get_appointment_by_date_time(date, time)
+
+    results["booking slot check"] = measure(check_slot, repeats=200)
+
+    # A different term on each run, so later runs are not served from the query cache
+    terms = itertools.cycle(SEARCH_TERMS)
+    results["show_journal_history search"] = measure(
+        lambda: show_journal_history(patient, auth_service),
+        inputs=lambda: ["s", next(terms), "x"],
+    )
+
+    results["view_summary"] = measure(lambda: view_summary(auth_service), inputs=["b"])
+
+    patient_mhwp = auth_service.get_assigned_mhwp(patient) or mhwp
+    results["display_patient_summary"] = measure(
+        lambda: display_patient_summary(patient_mhwp, auth_service),
+        inputs=[patient.get_username(), "r", "x"],
+    )
+
+    aggregates = patient.get_mood_aggregates()
+    results["plot_mood_chart (14 days)"] = measure(
+        lambda: plot_mood_chart(aggregates, max_columns=14), repeats=50
+    )
+    results["plot_mood_chart (all months)"] = measure(
+        lambda: plot_mood_chart(aggregates, "month"), repeats=50
+    )
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks the core Breeze workflows.")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"comma separated datasets out of {', '.join(DATASETS)} (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument(
+        "--data-dir", help="directory to keep seeded datasets in for later runs (default: temporary)"
+    )
+    parser.add_argument(
+        "--output", help="results file (default: benchmarks/results/<commit>.json)"
+    )
+    parser.add_argument("--compare", help="results file of an earlier run to compare with")
+    args = parser.parse_args()
+    args.sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in args.sizes if size not in DATASETS]
+    if unknown:
+        parser.error(f"unknown dataset(s): {', '.join(unknown)}")
+    return args
+
+
+def main():
+    args = parse_args()
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        data_dir = args.data_dir or scratch_dir
+        os.makedirs(data_dir, exist_ok=True)
+        for size in args.sizes:
+            print(f"Seeding and benchmarking the {size} dataset...")
+            data_path = seed_dataset(
+                os.path.join(data_dir, f"{size}.json"), **DATASETS[size]
+            )
+            # Logins may re-hash and save, so each dataset is benchmarked on a copy
+            work_path = os.path.join(scratch_dir, "users.json")
+            shutil.copyfile(data_path, work_path)
+            results[size] = bench_dataset(work_path, scratch_dir)
+
+    print()
+    print_results(results)
+    print(f"\nResults saved to {save_results(results, args.output)}")
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
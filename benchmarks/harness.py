@@ -0,0 +1,193 @@
+"""Shared helpers for the benchmarks: headless execution, timing, memory and JSON results."""
+import contextlib
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from unittest import mock
+
+SEEDER_PATH = os.path.join("data", "seeder.py")
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+class ScriptExhausted(Exception):
+    """Raised when a headless workflow asks for more input than its script provides."""
+
+
+@contextlib.contextmanager
+def headless(inputs=()):
+    """Runs interactive code without a terminal.
+
+    input() answers from the scripted inputs, time.sleep and screen clearing return at
+    once, and everything printed is discarded.
+    """
+    answers = iter(inputs)
+
+    def scripted_input(prompt=""):
+        try:
+            return next(answers)
+        except StopIteration:
+            raise ScriptExhausted(f"No scripted input left for prompt {prompt!r}") from None
+
+    with open(os.devnull, "w") as devnull, mock.patch(
+        "builtins.input", scripted_input
+    ), mock.patch("time.sleep"), mock.patch("os.system"), contextlib.redirect_stdout(devnull):
+        yield
+
+
+def seed_dataset(file_path, patients, mhwps, years, moods_per_day, journals_per_day, seed=0):
+    """Generates a users.json with the seeder, unless the file already exists."""
+    if os.path.exists(file_path):
+        return file_path
+    subprocess.run(
+        [
+            sys.executable,
+            SEEDER_PATH,
+            "--patients", str(patients),
+            "--mhwps", str(mhwps),
+            "--years", str(years),
+            "--moods-per-day", str(moods_per_day),
+            "--journals-per-day", str(journals_per_day),
+            "--seed", str(seed),
+            "--indent", "0",
+            "--output", file_path,
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return file_path
+
+
+def get_percentile(sorted_values, percent):
+    """Returns the nearest-rank percentile of already sorted values."""
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarise(latencies):
+    """Returns count, mean and p50/p90/p99/max of latencies in milliseconds."""
+    values = sorted(latencies)
+    return {
+        "n": len(values),
+        "mean_ms": statistics.fmean(values),
+        "p50_ms": get_percentile(values, 50),
+        "p90_ms": get_percentile(values, 90),
+        "p99_ms": get_percentile(values, 99),
+        "max_ms": values[-1],
+    }
+
+
+def measure(function, repeats=20, inputs=()):
+    """Times a workflow headlessly and measures its peak memory.
+
+    Each call gets a fresh copy of the scripted inputs. The calls are timed without
+    tracemalloc, then one extra call is traced, since tracing slows Python code down.
+
+    Args:
+        function (callable): The workflow to run. Takes no arguments.
+        repeats (int, optional): Number of timed calls. Defaults to 20.
+        inputs (list of str or callable, optional): Answers to input() for each call, or a
+            function returning a new list of answers for each call.
+
+    Returns:
+        dict: The latency summary plus peak_memory_kb, the most memory allocated at once.
+    """
+    get_inputs = inputs if callable(inputs) else lambda: inputs
+    latencies = []
+    for _ in range(repeats):
+        with headless(get_inputs()):
+            start = time.perf_counter()
+            function()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        with headless(get_inputs()):
+            function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    result = summarise(latencies)
+    result["peak_memory_kb"] = (peak - baseline) / 1024
+    return result
+
+
+def get_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def save_results(results, file_path=None):
+    """Writes results with their commit and environment to JSON, returning the file path.
+
+    By default the file is benchmarks/results/<commit>.json, so runs on different commits
+    can be compared with compare_results.
+    """
+    commit = get_commit()
+    file_path = file_path or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(file_path, "w") as file:
+        json.dump(
+            {
+                "commit": commit,
+                "created": datetime.datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            file,
+            indent=4,
+        )
+    return file_path
+
+
+def print_results(results):
+    print(
+        f"{'Dataset':<8} {'Workflow':<34} {'n':>5} {'p50 ms':>10} {'p90 ms':>10} "
+        f"{'p99 ms':>10} {'peak KB':>10}"
+    )
+    for dataset, workflows in results.items():
+        for name, result in workflows.items():
+            print(
+                f"{dataset:<8} {name:<34} {result['n']:>5} {result['p50_ms']:>10.3f} "
+                f"{result['p90_ms']:>10.3f} {result['p99_ms']:>10.3f} "
+                f"{result['peak_memory_kb']:>10.1f}"
+            )
+
+
+def compare_results(results, baseline_path, threshold=0.1):
+    """Prints the p50, peak memory and throughput change of every entry against a saved run.
+
+    Changes larger than the threshold (a fraction, 0.1 = 10%) are flagged.
+    """
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    print(f"\nCompared with {baseline['commit']} ({baseline_path}):")
+    for dataset, workflows in results.items():
+        for name, result in workflows.items():
+            previous = baseline["results"].get(dataset, {}).get(name)
+            if not previous:
+                continue
+            changes = []
+            for key in ("p50_ms", "peak_memory_kb", "actions_per_s"):
+                if key not in result or key not in previous:
+                    continue
+                ratio = result[key] / previous[key] - 1 if previous[key] else 0.0
+                flag = " !" if abs(ratio) > threshold else ""
+                changes.append(f"{key} {ratio:+7.1%}{flag}")
+            print(f"{dataset:<8} {name:<34} " + "   ".join(changes))
@@ -0,0 +1,257 @@
+"""Replays scripted sessions through the full interactive app and measures throughput.
+
+A session script is a recorded input stream: one input per line, where an empty line
+presses Enter and lines starting with # are comments (see benchmarks/sessions/). Each
+session runs BreezeApp.run with input() answered from its script, time.sleep and screen
+clearing virtualised and all output captured. Sessions run in parallel worker processes,
+each on its own copy of the dataset, and the report gives actions per second and the
+latency of every action (the time from answering one prompt to the next prompt).
+
+To run: python -m benchmarks.session_driver [script ...] [--sessions N] [--processes N]
+            [--data FILE] [--show-output] [--output FILE] [--compare FILE]
+"""
+import argparse
+import contextlib
+import glob
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
+
+from benchmarks.harness import (
+    RESULTS_DIR,
+    ScriptExhausted,
+    compare_results,
+    get_commit,
+    save_results,
+    seed_dataset,
+    summarise,
+)
+from breeze.app import BreezeApp
+from breeze.utils.screen import CLEAR_SCREEN_SEQUENCE
+
+SESSIONS_DIR = os.path.join("benchmarks", "sessions")
+DEFAULT_DATASET = dict(patients=50, mhwps=5, years=0.5, moods_per_day=1, journals_per_day=0.3)
+
+
+def load_script(file_path):
+    """Reads a session script into its list of inputs."""
+    with open(file_path) as file:
+        return [line.rstrip("\n") for line in file if not line.startswith("#")]
+
+
+class ScriptedSession:
+    """One run of the app driven by a recorded input stream.
+
+    Args:
+        inputs (list of str): Answers to every input() call, in order.
+    """
+
+    def __init__(self, inputs):
+        self.inputs = list(inputs)
+        self.output = io.StringIO()
+        self.latencies = []
+        self.virtual_sleep = 0.0
+        self.screen_clears = 0
+        self.__answers = iter(self.inputs)
+        self.__last_answered = None
+
+    def __end_action(self):
+        if self.__last_answered is not None:
+            self.latencies.append((time.perf_counter() - self.__last_answered) * 1000)
+            self.__last_answered = None
+
+    def __input(self, prompt=""):
+        self.__end_action()
+        try:
+            answer = next(self.__answers)
+        except StopIteration:
+            raise ScriptExhausted(f"No scripted input left for prompt {prompt!r}") from None
+        self.output.write(f"{prompt}{answer}\n")
+        self.__last_answered = time.perf_counter()
+        return answer
+
+    def __sleep(self, seconds):
+        self.virtual_sleep += seconds
+
+    def __system(self, command):
+        # The app only shells out to clear the screen, on Windows
+        self.output.write(CLEAR_SCREEN_SEQUENCE)
+        return 0
+
+    def run(self, data_path):
+        """Runs the app on a dataset until it exits or the script runs out.
+
+        Returns:
+            dict: Whether the script completed, the number of actions, their latencies in
+                milliseconds, the start-up time, the virtual sleep and the screen clears.
+        """
+        error = None
+        with mock.patch("builtins.input", self.__input), mock.patch(
+            "time.sleep", self.__sleep
+        ), mock.patch("os.system", self.__system), contextlib.redirect_stdout(self.output):
+            start = time.perf_counter()
+            app = BreezeApp(data_path)
+            startup_ms = (time.perf_counter() - start) * 1000
+            try:
+                app.run()
+            except SystemExit:
+                pass
+            except ScriptExhausted as exception:
+                error = str(exception)
+            finally:
+                self.__end_action()
+        self.screen_clears = self.output.getvalue().count(CLEAR_SCREEN_SEQUENCE)
+
+        return {
+            "completed": error is None,
+            "error": error,
+            "actions": len(self.latencies),
+            "latencies_ms": self.latencies,
+            "startup_ms": startup_ms,
+            "virtual_sleep_s": self.virtual_sleep,
+            "screen_clears": self.screen_clears,
+        }
+
+
+def run_session(task):
+    """Worker entry point: runs one script on a private copy of the dataset."""
+    name, inputs, data_path, keep_output = task
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        session_path = os.path.join(tmp_dir, "users.json")
+        shutil.copyfile(data_path, session_path)
+        session = ScriptedSession(inputs)
+        result = session.run(session_path)
+    result["name"] = name
+    result["output"] = session.output.getvalue() if keep_output else None
+    return result
+
+
+def run_sessions(scripts, data_path, sessions=1, processes=None, keep_output=False):
+    """Replays every script the given number of times across worker processes.
+
+    Args:
+        scripts (dict): Script name -> list of inputs.
+        data_path (str): The users.json to copy for each session.
+        sessions (int, optional): Runs of each script. Defaults to 1.
+        processes (int, optional): Worker processes. Defaults to the number of CPUs.
+        keep_output (bool, optional): Whether to return each session's captured output.
+
+    Returns:
+        tuple: (list of session results, wall time in seconds)
+    """
+    tasks = [
+        (name, inputs, data_path, keep_output)
+        for _ in range(sessions)
+        for name, inputs in scripts.items()
+    ]
+    start = time.perf_counter()
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(run_session, tasks)
+    return results, time.perf_counter() - start
+
+
+def summarise_sessions(session_results, wall_time):
+    """Returns per-script and overall latency summaries with throughput in actions/sec."""
+    by_name = {}
+    for result in session_results:
+        by_name.setdefault(result["name"], []).append(result)
+    by_name["all"] = session_results
+
+    summaries = {}
+    for name, results in by_name.items():
+        latencies = [latency for result in results for latency in result["latencies_ms"]]
+        summary = summarise(latencies) if latencies else {"n": 0}
+        summary.update(
+            sessions=len(results),
+            failed=sum(not result["completed"] for result in results),
+            startup_ms=summarise([result["startup_ms"] for result in results])["p50_ms"],
+            virtual_sleep_s=sum(result["virtual_sleep_s"] for result in results),
+        )
+        summaries[name] = summary
+    summaries["all"]["wall_time_s"] = wall_time
+    summaries["all"]["actions_per_s"] = summaries["all"]["n"] / wall_time if wall_time else 0.0
+    return summaries
+
+
+def print_summaries(summaries):
+    print(
+        f"{'Script':<20} {'sessions':>8} {'failed':>6} {'actions':>8} {'p50 ms':>9} "
+        f"{'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} {'startup ms':>11} {'slept s':>8}"
+    )
+    for name, summary in summaries.items():
+        if not summary["n"]:
+            print(f"{name:<20} {summary['sessions']:>8} {summary['failed']:>6} {0:>8}")
+            continue
+        print(
+            f"{name:<20} {summary['sessions']:>8} {summary['failed']:>6} {summary['n']:>8} "
+            f"{summary['p50_ms']:>9.3f} {summary['p90_ms']:>9.3f} {summary['p99_ms']:>9.3f} "
+            f"{summary['max_ms']:>9.3f} {summary['startup_ms']:>11.1f} "
+            f"{summary['virtual_sleep_s']:>8.1f}"
+        )
+    overall = summaries["all"]
+    print(
+        f"\nThroughput: {overall['n']} actions in {overall['wall_time_s']:.2f} s "
+        f"= {overall['actions_per_s']:.1f} actions/s"
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Replays scripted sessions through Breeze.")
+    parser.add_argument(
+        "scripts", nargs="*", help=f"session scripts (default: every script in {SESSIONS_DIR})"
+    )
+    parser.add_argument("--sessions", type=int, default=10, help="runs of each script (default: 10)")
+    parser.add_argument("--processes", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--data", help="users.json to run on (default: a seeded 50 patient dataset)")
+    parser.add_argument(
+        "--show-output", action="store_true", help="print the captured output of one run of each script"
+    )
+    parser.add_argument(
+        "--output", help="results file (default: benchmarks/results/<commit>-sessions.json)"
+    )
+    parser.add_argument("--compare", help="results file of an earlier run to compare with")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    script_paths = args.scripts or sorted(glob.glob(os.path.join(SESSIONS_DIR, "*.txt")))
+    scripts = {
+        os.path.splitext(os.path.basename(path))[0]: load_script(path) for path in script_paths
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = args.data or seed_dataset(
+            os.path.join(tmp_dir, "users.json"), **DEFAULT_DATASET
+        )
+        session_results, wall_time = run_sessions(
+            scripts, data_path, args.sessions, args.processes, keep_output=args.show_output
+        )
+
+    if args.show_output:
+        shown = set()
+        for result in session_results:
+            if result["name"] not in shown:
+                shown.add(result["name"])
+                print(f"===== {result['name']} =====")
+                print(result["output"].replace(CLEAR_SCREEN_SEQUENCE, "\n[screen cleared]\n"))
+
+    for result in session_results:
+        if not result["completed"]:
+            print(f"Session {result['name']} did not complete: {result['error']}")
+
+    summaries = summarise_sessions(session_results, wall_time)
+    print_summaries(summaries)
+    results = {"sessions": summaries}
+    output_path = args.output or os.path.join(RESULTS_DIR, f"{get_commit()}-sessions.json")
+    print(f"\nResults saved to {save_results(results, output_path)}")
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
-from breeze.services.auth_service import AuthService
-from breeze.services.admin_service.admin_service import AdminService
-from breeze.services.mhwp_service.mhwp_service import MHWPService
-from breeze.services.patient_service.patient_service import PatientService
+from functools import cached_property
+
+from breeze.services.auth_service import DATA_FILE_PATH, AuthService
 
 from breeze.utils.cli_utils import print_system_message, clear_screen
 from breeze.utils.constants import (
@@ -16,11 +15,28 @@ class BreezeApp:
     to user-specific dashboards.
     """
 
-    def __init__(self):
-        self.auth_service = AuthService()
-        self.admin_service = AdminService(self.auth_service)
-        self.patient_service = PatientService(self.auth_service)
-        self.mhwp_service = MHWPService(self.auth_service)
+    def __init__(self, data_path=DATA_FILE_PATH):
+        self.auth_service = AuthService(data_path)
+
+    # The role services and their screens are imported on first use, so the main menu
+    # appears without loading every dashboard.
+    @cached_property
+    def admin_service(self):
+        from breeze.services.admin_service.admin_service import AdminService
+
+        return AdminService(self.auth_service)
+
+    @cached_property
+    def patient_service(self):
+        from breeze.services.patient_service.patient_service import PatientService
+
+        return PatientService(self.auth_service)
+
+    @cached_property
+    def mhwp_service(self):
+        from breeze.services.mhwp_service.mhwp_service import MHWPService
+
+        return MHWPService(self.auth_service)
 
     def run(self):
         """Starts the application and displays the main menu."""
@@ -37,6 +37,7 @@ class AppointmentEntry:
         self.patient_username = patient_username
         self.status = status  # "requested", "confirmed", or "cancelled"
         self.summary = summary
+        self.__status_listener = None
 
     def get_id(self):
         return self.appointment_id
@@ -58,23 +59,35 @@ class AppointmentEntry:
             stripped = stripped[:50] + "..."
         return stripped
 
+    def set_status_listener(self, listener):
+        """
+        Registers a callable that is called with (appointment, old_status) on status changes.
+        """
+        self.__status_listener = listener
+
+    def __set_status(self, status):
+        old_status = self.status
+        self.status = status
+        if self.__status_listener and old_status != status:
+            self.__status_listener(self, old_status)
+
     def cancel_appointment(self):
         """
         Marks the appointment as cancelled and updates status.
         """
-        self.status = "cancelled"
+        self.__set_status("cancelled")
 
     def confirm_appointment(self):
         """
         Marks the appointment as confirmed and updates status.
         """
-        self.status = "confirmed"
+        self.__set_status("confirmed")
 
     def request_appointment(self):
         """
         Marks the appointment as requested and updates status.
         """
-        self.status = "requested"
+        self.__set_status("requested")
 
     def is_confirmed(self):
         """
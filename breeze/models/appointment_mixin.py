@@ -1,5 +1,7 @@
 import datetime
 
+from breeze.utils.instrumentation import increment
+
 
 class AppointmentMixin:
     def get_appointment_by_date_time(self, date, time, not_cancelled=True):
@@ -11,10 +13,15 @@ class AppointmentMixin:
         )
         time_obj = datetime.datetime.strptime(time, "%I:%M %p").time()
 
-        for app in self.get_appointments():
-            if app.get_date() == date_obj and app.get_time() == time_obj:
-                if not_cancelled and app.get_status() != "cancelled":
-                    return app
-                elif not_cancelled is False:
-                    return app
-        return None
+        scanned = 0
+        try:
+            for app in self.get_appointments():
+                scanned += 1
+                if app.get_date() == date_obj and app.get_time() == time_obj:
+                    if not_cancelled and app.get_status() != "cancelled":
+                        return app
+                    elif not_cancelled is False:
+                        return app
+            return None
+        finally:
+            increment("appointments_scanned", scanned)
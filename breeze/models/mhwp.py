@@ -1,5 +1,7 @@
 from breeze.models.appointment_mixin import AppointmentMixin
 from breeze.utils.ansi_utils import colorise
+from breeze.utils.instrumentation import timed
+from breeze.utils.screen import buffered_output
 from .user import User
 from ..utils.calendar_utils import (
     get_colored_status,
@@ -36,7 +38,8 @@ class MHWP(User, AppointmentMixin):
             is_disabled=is_disabled,
         )
         self.__appointments = appointments if appointments is not None else []
-        self.__assigned_patients = (
+        # Insertion-ordered set of patient usernames (dict keys), for O(1) add/remove/lookup
+        self.__assigned_patients = dict.fromkeys(
             assigned_patients if assigned_patients is not None else []
         )
 
@@ -57,139 +60,145 @@ class MHWP(User, AppointmentMixin):
     def add_appointment(self, appointment):
         self.__appointments.append(appointment)
 
+    @timed("calendar.render")
     def display_calendar(self, code_map=None, is_MHWP_view=True):
         """
         Displays the calendar with dates as columns and time slots as rows for this MHWP.
         """
         HEADER_WIDTH = 116
 
-        next_available_days = get_next_available_days(include_today=True)
-        time_slots = generate_time_slots()
-        code_map = (
-            generate_calendar_slot_code_map(next_available_days, time_slots)
-            if not code_map
-            else code_map
-        )
+        # the calendar is built in memory and written in one go, rather than cell by cell
+        with buffered_output():
+            next_available_days = get_next_available_days(include_today=True)
+            time_slots = generate_time_slots()
+            code_map = (
+                generate_calendar_slot_code_map(next_available_days, time_slots)
+                if not code_map
+                else code_map
+            )
 
-        if next_available_days:
-            start_date = next_available_days[0].strftime("%m-%d")
-            end_date = next_available_days[-1].strftime("%m-%d")
-            date_range = f"{start_date} ~ {end_date}"
-        else:
-            date_range = "No available days"
+            if next_available_days:
+                start_date = next_available_days[0].strftime("%m-%d")
+                end_date = next_available_days[-1].strftime("%m-%d")
+                date_range = f"{start_date} ~ {end_date}"
+            else:
+                date_range = "No available days"
 
-        current_date = datetime.datetime.now()
-        formatted_date = current_date.strftime("%d-%m-%Y %a")
+            current_date = datetime.datetime.now()
+            formatted_date = current_date.strftime("%d-%m-%Y %a")
 
-        header_line = "=" * HEADER_WIDTH
-        sub_header_line = "-" * HEADER_WIDTH
+            header_line = "=" * HEADER_WIDTH
+            sub_header_line = "-" * HEADER_WIDTH
 
-        print(f"\n{header_line}")
-        print(f"Today is {formatted_date}".center(HEADER_WIDTH))
+            print(f"\n{header_line}")
+            print(f"Today is {formatted_date}".center(HEADER_WIDTH))
 
-        text_with_colors = (
-            f"Upcoming calendar for {colorise(self.get_username(), color=63)} {colorise('today', bold=True)}, and for the "
-            f"{colorise(f'next five working days ({date_range})', bold=True)}:"
-        )
-        text_without_colors = strip_ansi_codes(text_with_colors)
+            text_with_colors = (
+                f"Upcoming calendar for {colorise(self.get_username(), color=63)} {colorise('today', bold=True)}, and for the "
+                f"{colorise(f'next five working days ({date_range})', bold=True)}:"
+            )
+            text_without_colors = strip_ansi_codes(text_with_colors)
 
-        print(
-            text_with_colors.center(
-                HEADER_WIDTH + (len(text_with_colors) - len(text_without_colors))
+            print(
+                text_with_colors.center(
+                    HEADER_WIDTH + (len(text_with_colors) - len(text_without_colors))
+                )
             )
-        )
 
-        upcoming_appointments = [
-            app
-            for app in self.get_appointments()
-            if app.get_status() != "cancelled" and app.get_date() >= current_date.date()
-        ]
-        requested_appointments_count = len(
-            [app for app in upcoming_appointments if app.get_status() == "requested"]
-        )
-        confirmed_appointments_count = len(
-            [app for app in upcoming_appointments if app.get_status() == "confirmed"]
-        )
+            upcoming_appointments = [
+                app
+                for app in self.get_appointments()
+                if app.get_status() != "cancelled" and app.get_date() >= current_date.date()
+            ]
+            requested_appointments_count = len(
+                [app for app in upcoming_appointments if app.get_status() == "requested"]
+            )
+            confirmed_appointments_count = len(
+                [app for app in upcoming_appointments if app.get_status() == "confirmed"]
+            )
 
-        print(
-            f"Number of requested appointments: {requested_appointments_count}".center(
-                HEADER_WIDTH
+            print(
+                f"Number of requested appointments: {requested_appointments_count}".center(
+                    HEADER_WIDTH
+                )
             )
-        )
-        print(
-            f"Number of confirmed appointments: {confirmed_appointments_count}".center(
-                HEADER_WIDTH
+            print(
+                f"Number of confirmed appointments: {confirmed_appointments_count}".center(
+                    HEADER_WIDTH
+                )
             )
-        )
 
-        print(f"{sub_header_line}\n")
+            print(f"{sub_header_line}\n")
 
-        print("+", "-" * (10 + 17 * len(next_available_days)), "+")
-        print(f"| {'Time':<10}", end=" | ")
-        for day in next_available_days:
-            if day == datetime.date.today():
-                print(f"{'Today':<14}", end=" | ")
-            else:
-                print(f"{day.strftime('%d-%m-%Y %a'):<14}", end=" | ")
-        print()
-        print("+", "-" * (10 + 17 * len(next_available_days)), "+")
-
-        for i, slot in enumerate(time_slots):
-            print(f"| {slot:<10}", end=" | ")
-            for j, day in enumerate(next_available_days):
-                code = f"{chr(ord('A') + i)}{j + 1}"
-                day_slot = code_map[code]
-
-                app = self.get_appointment_by_date_time(day_slot[0], day_slot[1])
-                if is_MHWP_view:
-                    placeholder = (
-                        get_colored_status(app.get_status())
-                        if app and app.get_status() != "cancelled"
-                        else "\u25CB"
-                    )
+            print("+", "-" * (10 + 17 * len(next_available_days)), "+")
+            cells = [f"| {'Time':<10}"]
+            for day in next_available_days:
+                if day == datetime.date.today():
+                    cells.append(f"{'Today':<14}")
                 else:
-                    if app and app.get_status() == "confirmed":
-                        placeholder = get_colored_status("unavailable")
+                    cells.append(f"{day.strftime('%d-%m-%Y %a'):<14}")
+            print(" | ".join(cells), end=" | \n")
+            print("+", "-" * (10 + 17 * len(next_available_days)), "+")
+
+            for i, slot in enumerate(time_slots):
+                cells = [f"| {slot:<10}"]
+                for j, day in enumerate(next_available_days):
+                    code = f"{chr(ord('A') + i)}{j + 1}"
+                    day_slot = code_map[code]
+
+                    app = self.get_appointment_by_date_time(day_slot[0], day_slot[1])
+                    if is_MHWP_view:
+                        placeholder = (
+                            get_colored_status(app.get_status())
+                            if app and app.get_status() != "cancelled"
+                            else "\u25CB"
+                        )
                     else:
-                        if app and app.get_status() != "cancelled":
-                            placeholder = get_colored_status(app.get_status())
+                        if app and app.get_status() == "confirmed":
+                            placeholder = get_colored_status("unavailable")
                         else:
-                            placeholder = code
+                            if app and app.get_status() != "cancelled":
+                                placeholder = get_colored_status(app.get_status())
+                            else:
+                                placeholder = code
 
-                    if day == datetime.date.today():
-                        day_slot_time_obj = datetime.datetime.strptime(
-                            day_slot[1], "%I:%M %p"
-                        )
-                        now = datetime.datetime.now()
+                        if day == datetime.date.today():
+                            day_slot_time_obj = datetime.datetime.strptime(
+                                day_slot[1], "%I:%M %p"
+                            )
+                            now = datetime.datetime.now()
 
-                        day_slot_time_obj = now.replace(
-                            hour=day_slot_time_obj.hour,
-                            minute=day_slot_time_obj.minute,
-                            second=0,
-                            microsecond=0,
-                        )
+                            day_slot_time_obj = now.replace(
+                                hour=day_slot_time_obj.hour,
+                                minute=day_slot_time_obj.minute,
+                                second=0,
+                                microsecond=0,
+                            )
 
-                        two_hours_ahead = day_slot_time_obj - datetime.timedelta(
-                            hours=2
-                        )
+                            two_hours_ahead = day_slot_time_obj - datetime.timedelta(
+                                hours=2
+                            )
 
-                        if now >= two_hours_ahead:
-                            placeholder = "\u25CB"
+                            if now >= two_hours_ahead:
+                                placeholder = "\u25CB"
 
-                visible_placeholder = strip_ansi_codes(placeholder)
-                padding_width = 14 - len(visible_placeholder) + len(placeholder)
+                    visible_placeholder = strip_ansi_codes(placeholder)
+                    padding_width = 14 - len(visible_placeholder) + len(placeholder)
 
-                print(f"{placeholder:<{padding_width}}", end=" | ")
-            print()
+                    cells.append(f"{placeholder:<{padding_width}}")
+                print(" | ".join(cells), end=" | \n")
 
-        print("+", "-" * (10 + 17 * len(next_available_days)), "+")
+            print("+", "-" * (10 + 17 * len(next_available_days)), "+")
 
     def add_patient(self, patient_username):
-        if patient_username not in self.__assigned_patients:
-            self.__assigned_patients.append(patient_username)
+        self.__assigned_patients[patient_username] = None
+
+    def remove_patient(self, patient_username):
+        self.__assigned_patients.pop(patient_username, None)
 
     def get_assigned_patients(self):
-        return self.__assigned_patients
+        """Returns a read-only, insertion-ordered view of the assigned patient usernames."""
+        return self.__assigned_patients.keys()
 
     def __str__(self):
         return f"MHWP: {self.get_username()}, Role: {self.get_role()}"
@@ -209,7 +218,7 @@ class MHWP(User, AppointmentMixin):
                 "email": self.get_email(),
             },
             "appointments": [app.get_id() for app in self.get_appointments()],
-            "assignedPatients": self.__assigned_patients,
+            "assignedPatients": list(self.__assigned_patients),
         }
 
 
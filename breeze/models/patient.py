@@ -1,4 +1,7 @@
 from breeze.models.appointment_mixin import AppointmentMixin
+from breeze.utils.entry_map import EntryMap, get_timestamp_key
+from breeze.utils.mood_aggregates import MoodAggregates
+from breeze.utils.text_index import InvertedIndex
 from .user import User
 from datetime import datetime
 
@@ -15,9 +18,9 @@ class Patient(User, AppointmentMixin):
         date_of_birth=None,
         gender=None,
         is_disabled=False,
-        mood_entries=[],
-        journal_entries=[],
-        appointments=[],
+        mood_entries=None,
+        journal_entries=None,
+        appointments=None,
         assigned_MHWP=None,
         conditions=None,
         prescriptions=None,
@@ -35,13 +38,72 @@ class Patient(User, AppointmentMixin):
         self.__gender = gender
         self.__date_of_birth = date_of_birth
 
-        self.__mood_entries = mood_entries
-        self.__journal_entries = journal_entries
-        self.__appointments = appointments
+        # Moods and journals are keyed by id for O(1) edits and deletes, kept in date order
+        self.__mood_entries = EntryMap(mood_entries or [])
+        self.__journal_entries = EntryMap(journal_entries or [])
+        self.__appointments = appointments if appointments is not None else []
+        self.__mood_aggregates = MoodAggregates(self.__mood_entries)
         self.__assigned_mhwp = assigned_MHWP
         self.__conditions = conditions or {}
         self.__prescriptions = prescriptions or []
 
+        # Summary projections, kept up to date by add_condition, add_prescription and add_appointment
+        self.__latest_condition = max(
+            (condition for condition, notes in self.__conditions.items() if notes),
+            key=lambda condition: max(
+                get_timestamp_key(note["timestamp"]) for note in self.__conditions[condition]
+            ),
+            default=None,
+        )
+        self.__current_prescription = max(
+            self.__prescriptions,
+            key=lambda prescription: get_timestamp_key(prescription["start_date"]),
+            default=None,
+        )
+        self.__next_appointment = None
+        self.__next_appointment_is_stale = True
+
+        # Bumped whenever moods, journals or appointments change, so derived data can be invalidated
+        self.__mood_version = 0
+        self.__journal_version = 0
+        self.__appointment_version = 0
+
+        # Full-text indexes for history search, built on the first search and then kept up to date
+        self.__journal_index = None
+        self.__mood_index = None
+        self.__appointment_index = None
+
+    @staticmethod
+    def __build_index(documents):
+        """Builds an index over (doc_id, *texts) documents."""
+        index = InvertedIndex()
+        for doc_id, *texts in documents:
+            index.add(doc_id, *texts)
+        return index
+
+    def __get_journal_index(self):
+        if self.__journal_index is None:
+            self.__journal_index = self.__build_index(
+                (j["id"], j.get("title"), j.get("text")) for j in self.__journal_entries
+            )
+        return self.__journal_index
+
+    def __get_mood_index(self):
+        if self.__mood_index is None:
+            self.__mood_index = self.__build_index(
+                (m["id"], m.get("mood"), m.get("comment")) for m in self.__mood_entries
+            )
+        return self.__mood_index
+
+    def __get_appointment_index(self):
+        if self.__appointment_index is None:
+            self.__appointment_index = self.__build_index(
+                (app.get_id(), app.summary, app.mhwp_username)
+                for app in self.__appointments
+                if app.summary is not None
+            )
+        return self.__appointment_index
+
     def get_emergency_contact(self):
         return self.__emergency_contact_email
 
@@ -65,6 +127,18 @@ class Patient(User, AppointmentMixin):
 
     def get_journal_entries(self):
         return self.__journal_entries
+
+    def get_mood_aggregates(self):
+        return self.__mood_aggregates
+
+    def get_mood_version(self):
+        return self.__mood_version
+
+    def get_journal_version(self):
+        return self.__journal_version
+
+    def get_appointment_version(self):
+        return self.__appointment_version
     
     def sort_appointments(self):
         self.__appointments = sorted(
@@ -79,29 +153,85 @@ class Patient(User, AppointmentMixin):
 
     def set_appointments(self, appointments):
         self.__appointments = appointments
+        self.__appointment_index = None
+        self.__appointment_version += 1
+        self.__next_appointment_is_stale = True
 
     def add_appointment(self, appointment):
         self.__appointments.append(appointment)
+        self.__index_appointment(appointment)
+        if self.__is_upcoming(appointment) and (
+            self.__next_appointment is None
+            or self.__get_appointment_datetime(appointment)
+            < self.__get_appointment_datetime(self.__next_appointment)
+        ):
+            self.__next_appointment = appointment
+
+    def __index_appointment(self, appointment):
+        self.__appointment_version += 1
+        if self.__appointment_index is None:
+            return
+        if appointment.summary is None:
+            self.__appointment_index.remove(appointment.get_id())
+        else:
+            self.__appointment_index.add(
+                appointment.get_id(), appointment.summary, appointment.mhwp_username
+            )
+
+    def set_appointment_summary(self, appointment, summary):
+        appointment.summary = summary
+        self.__index_appointment(appointment)
 
     def add_mood_entry(self, mood_id, mood, comment, datetime_str):
-        self.__mood_entries.append(
-            {"id": mood_id, "mood": mood, "comment": comment, "date": datetime_str}
-        )
+        mood_entry = {"id": mood_id, "mood": mood, "comment": comment, "date": datetime_str}
+        replaced = self.__mood_entries.add(mood_entry)
+        if replaced is not None:
+            self.__mood_aggregates.remove(replaced)
+        self.__mood_aggregates.add(mood_entry)
+        if self.__mood_index is not None:
+            self.__mood_index.add(mood_id, mood, comment)
+        self.__mood_version += 1
 
     def delete_mood_entry(self, mood_id):
-        self.__mood_entries = [
-            mood for mood in self.__mood_entries if mood["id"] != mood_id
-        ]
+        mood_entry = self.__mood_entries.remove(mood_id)
+        if mood_entry is not None:
+            self.__mood_aggregates.remove(mood_entry)
+        if self.__mood_index is not None:
+            self.__mood_index.remove(mood_id)
+        self.__mood_version += 1
 
     def add_journal_entry(self, journal_id, title, entry, datetime_str):
-        self.__journal_entries.append(
+        self.__journal_entries.add(
             {"id": journal_id, "title": title, "text": entry, "date": datetime_str}
         )
+        if self.__journal_index is not None:
+            self.__journal_index.add(journal_id, title, entry)
+        self.__journal_version += 1
+
+    def edit_journal_entry(self, journal_id, entry, last_update):
+        journal = self.__journal_entries.update(journal_id, text=entry, last_update=last_update)
+        if journal is not None:
+            if self.__journal_index is not None:
+                self.__journal_index.add(journal_id, journal["title"], entry)
+            self.__journal_version += 1
 
     def delete_journal_entry(self, journal_id):
-        self.__journal_entries = [
-            journal for journal in self.__journal_entries if journal["id"] != journal_id
-        ]
+        self.__journal_entries.remove(journal_id)
+        if self.__journal_index is not None:
+            self.__journal_index.remove(journal_id)
+        self.__journal_version += 1
+
+    def search_journal_entries(self, query):
+        """Returns the ids of journal entries whose title or text match the query, best match first."""
+        return self.__get_journal_index().search(query)
+
+    def search_mood_entries(self, query):
+        """Returns the ids of mood entries whose mood or comment match the query, best match first."""
+        return self.__get_mood_index().search(query)
+
+    def search_appointments(self, query):
+        """Returns the ids of appointments whose summary or MHWP match the query, best match first."""
+        return self.__get_appointment_index().search(query)
 
     def get_assigned_mhwp(self):
         return self.__assigned_mhwp
@@ -114,24 +244,66 @@ class Patient(User, AppointmentMixin):
         if condition not in self.__conditions:
             self.__conditions[condition] = []
         self.__conditions[condition].append({"note": notes, "timestamp": timestamp})
+        self.__latest_condition = condition
 
     def get_conditions(self):
         return self.__conditions
 
+    def get_prescriptions(self):
+        return self.__prescriptions
+
     def add_prescription(
         self, medication, dosage, frequency, start_date, end_date, notes
     ):
-        self.__prescriptions.append(
-            {
-                "medication": medication,
-                "dosage": dosage,
-                "frequency": frequency,
-                "start_date": start_date,
-                "end_date": end_date,
-                "notes": notes,
-            }
+        prescription = {
+            "medication": medication,
+            "dosage": dosage,
+            "frequency": frequency,
+            "start_date": start_date,
+            "end_date": end_date,
+            "notes": notes,
+        }
+        self.__prescriptions.append(prescription)
+        if self.__current_prescription is None or get_timestamp_key(start_date) >= get_timestamp_key(
+            self.__current_prescription["start_date"]
+        ):
+            self.__current_prescription = prescription
+
+    @staticmethod
+    def __get_appointment_datetime(appointment):
+        return datetime.combine(appointment.date, appointment.time)
+
+    def __is_upcoming(self, appointment):
+        return (
+            appointment.status != "cancelled"
+            and self.__get_appointment_datetime(appointment) >= datetime.now()
         )
 
+    def get_next_appointment(self):
+        """Returns the earliest upcoming appointment that is not cancelled, or None."""
+        # Appointments can be cancelled or pass after they were added, so check before using
+        if self.__next_appointment_is_stale or (
+            self.__next_appointment is not None and not self.__is_upcoming(self.__next_appointment)
+        ):
+            self.__next_appointment = min(
+                (app for app in self.__appointments if self.__is_upcoming(app)),
+                key=self.__get_appointment_datetime,
+                default=None,
+            )
+            self.__next_appointment_is_stale = False
+        return self.__next_appointment
+
+    def get_summary(self):
+        """Returns the patient's latest condition, current medication, last mood and next appointment."""
+        return {
+            "condition": self.__latest_condition,
+            "medication": (
+                self.__current_prescription["medication"] if self.__current_prescription else None
+            ),
+            "last_mood": self.__mood_entries[-1] if self.__mood_entries else None,
+            "next_appointment": self.get_next_appointment(),
+        }
+
     def __str__(self):
         return f"Patient: {self.get_username()}, Role: {self.get_role()}"
 
@@ -153,8 +325,8 @@ class Patient(User, AppointmentMixin):
                 "dateOfBirth": self.get_date_of_birth(),
             },
             "assignedMHWP": self.get_assigned_mhwp(),
-            "moods": self.__mood_entries,
-            "journals": self.__journal_entries,
+            "moods": self.__mood_entries.to_list(),
+            "journals": self.__journal_entries.to_list(),
             "appointments": [app.get_id() for app in self.get_appointments()],
             "conditions": self.__conditions,
             "prescriptions": self.__prescriptions,
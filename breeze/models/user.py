@@ -1,3 +1,6 @@
+from breeze.utils.credential_utils import verify_password
+
+
 class User:
     """The basic User class
     """
@@ -55,4 +58,4 @@ class User:
         self.__is_disabled = is_disabled
 
     def login(self, input_password):
-        return self.get_password() == input_password
\ No newline at end of file
+        return verify_password(self.get_password(), input_password)
@@ -18,18 +18,24 @@ def show_admin_dashboard(user, admin_service):
         print("Hi", user.get_username(), "!")
         print("What do you want to do today?")
         print("[R] Reallocate patient to MHWP")
+        print("[B] Rebalance MHWP caseloads")
         print("[E] Edit user information")
         print("[D] Delete a user")
         print("[I] Disable/Enable a user")
         print("[V] View summary")
+        print("[T] View mood trends")
+        print("[P] View reports")
+        print("[U] Bulk import/export users and appointments")
         print("[X] Log out")
 
         user_input = input("> ").strip().lower()
 
-        if user_input in ["r", "e", "d", "i", "v", "x"]:
+        if user_input in ["r", "b", "e", "d", "i", "v", "t", "p", "u", "x"]:
             match user_input:
                 case "r":
                     admin_service.reallocate_patient_to_mhwp()
+                case "b":
+                    admin_service.rebalance_caseloads()
                 case "e":
                     admin_service.edit_user_information()
                 case "d":
@@ -38,6 +44,12 @@ def show_admin_dashboard(user, admin_service):
                     admin_service.disable_user()
                 case "v":
                     admin_service.view_summary()
+                case "t":
+                    admin_service.view_mood_trends()
+                case "p":
+                    admin_service.view_reports()
+                case "u":
+                    admin_service.bulk_transfer()
                 case "x":
                     return True
                 case _:
@@ -1,9 +1,13 @@
 
 from breeze.services.admin_service.admin_dashboard import show_admin_dashboard
+from breeze.services.admin_service.bulk_transfer import bulk_transfer
 from breeze.services.admin_service.delete_user import delete_user
 from breeze.services.admin_service.disable_user import disable_user
 from breeze.services.admin_service.edit_user_infomation import edit_user_information
 from breeze.services.admin_service.patient_mhwp_allocation import reallocate_patient_to_mhwp
+from breeze.services.admin_service.rebalance_caseloads import rebalance_caseloads
+from breeze.services.admin_service.view_mood_trends import view_mood_trends
+from breeze.services.admin_service.view_reports import view_reports
 from breeze.services.admin_service.view_summary import view_summary
 
 
@@ -17,6 +21,9 @@ class AdminService:
     def reallocate_patient_to_mhwp(self):
         reallocate_patient_to_mhwp(self.auth_service)
 
+    def rebalance_caseloads(self):
+        rebalance_caseloads(self.auth_service)
+
     def edit_user_information(self):
         edit_user_information(self.auth_service)
 
@@ -28,3 +35,12 @@ class AdminService:
 
     def view_summary(self):
         view_summary(self.auth_service)
+
+    def view_mood_trends(self):
+        view_mood_trends(self.auth_service)
+
+    def view_reports(self):
+        view_reports(self.auth_service)
+
+    def bulk_transfer(self):
+        bulk_transfer(self.auth_service)
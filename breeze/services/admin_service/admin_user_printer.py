@@ -1,9 +1,12 @@
 from breeze.models.mhwp import MHWP
 from breeze.models.patient import Patient
+from breeze.utils.table_renderer import stream_table
 
+MAX_COLUMN_WIDTH = 40
 
-def print_users_with_disabled_status(auth_service):
-        """Private method that prints a list of all users and their account disabled status.
+
+def print_users_with_disabled_status(users):
+        """Private method that prints a list of users and their account disabled status.
         
         This method is intended for AdminService class only and is responsible for displaying
         usernames, their roles, and whether their accounts are disabled. It excludes 
@@ -11,25 +14,23 @@ def print_users_with_disabled_status(auth_service):
 
         Only the status of disabled accounts is shown for each user.
 
+        Rows are streamed to the screen one at a time. Columns are sized from the rows, up
+        to MAX_COLUMN_WIDTH, and longer cells are cut short with "...".
+
+        Args:
+            users (iterable): The users to print, usually one page of search results.
+
         Note:
             This is a private method and should not be accessed directly outside of 
             this class.
         """
-        users = auth_service.get_all_users().values()
-        
-        print("-" * 65)  
-        print(f"| {'Username':<20} | {'Role':<15} | {'Is Account Disabled':<20} |")
-        print("-" * 65)  
-
-        # Print each user's details with vertical lines
-        for user in users:
-            if not user.get_role() == 'Admin':
-                username = user.get_username()
-                role = user.get_role()
-                is_account_disabled = "True" if user.get_is_disabled() else "False"
-                print(f"| {username:<20} | {role:<15} | {is_account_disabled:<20} |")
         
-        print("-" * 65)
+        rows = (
+            [user.get_username(), user.get_role(), "True" if user.get_is_disabled() else "False"]
+            for user in users
+            if not user.get_role() == 'Admin'
+        )
+        stream_table(["Username", "Role", "Is Account Disabled"], rows, max_width=MAX_COLUMN_WIDTH)
 
     
 def print_users(users, title, show_assigned_patients=False, basic_view=False):
@@ -42,44 +43,30 @@ def print_users(users, title, show_assigned_patients=False, basic_view=False):
         basic_view (bool): If True, only display username, first name, and last name.
     """
     print(f"\n{title}:")
-    
+
     if basic_view:
         # Basic view: only username, first name, and last name
-        print("-" * 60)
-        print(f"| {'Username':<20} | {'First Name':<15} | {'Last Name':<15} |")
-        print("-" * 60)
+        headers = ["Username", "First Name", "Last Name"]
     elif show_assigned_patients:
         # For MHWPs, show the assigned patients column
-        print("-" * 83)
-        print(f"| {'Username':<20} | {'First Name':<15} | {'Last Name':<15} | {'Assigned Patients':<20} |")
-        print("-" * 83)
+        headers = ["Username", "First Name", "Last Name", "Assigned Patients"]
     else:
         # For Patients, show the assigned MHWP column
-        print("-" * 83)
-        print(f"| {'Username':<20} | {'First Name':<15} | {'Last Name':<15} | {'Assigned MHWP':<20} |")
-        print("-" * 83)
+        headers = ["Username", "First Name", "Last Name", "Assigned MHWP"]
 
-    for user in users:
-        username = user.get_username()
-        first_name = user.get_first_name() or "N/A"
-        last_name = user.get_last_name() or "N/A"
-        
+    def build_row(user):
+        row = [user.get_username(), user.get_first_name() or "N/A", user.get_last_name() or "N/A"]
         if basic_view:
-            # Basic view row
-            print(f"| {username:<20} | {first_name:<15} | {last_name:<15} |")
-        elif show_assigned_patients and isinstance(user, MHWP):
+            return row
+        if show_assigned_patients and isinstance(user, MHWP):
             # For MHWPs, count assigned patients
-            assigned_patients = str(len(user.get_assigned_patients()))
-            print(f"| {username:<20} | {first_name:<15} | {last_name:<15} | {assigned_patients:<20} |")
-        elif not show_assigned_patients and isinstance(user, Patient):
+            return row + [str(len(user.get_assigned_patients()))]
+        if not show_assigned_patients and isinstance(user, Patient):
             # For Patients, show the assigned MHWP
-            assigned_mhwp = user.get_assigned_mhwp() or "Unassigned"
-            print(f"| {username:<20} | {first_name:<15} | {last_name:<15} | {assigned_mhwp:<20} |")
-        else:
-            # Default row for any other user type (fallback)
-            print(f"| {username:<20} | {first_name:<15} | {last_name:<15} |")
+            return row + [user.get_assigned_mhwp() or "Unassigned"]
+        # Default row for any other user type (fallback)
+        return row
 
-    if basic_view:
-        print("-" * 60)
-    else:
-        print("-" * 83)
\ No newline at end of file
+    # Rows are built and printed one at a time, so any number of users streams in bounded memory.
+    # Columns are sized from the first rows, up to MAX_COLUMN_WIDTH; longer cells end in "..."
+    stream_table(headers, (build_row(user) for user in users), max_width=MAX_COLUMN_WIDTH)
@@ -0,0 +1,73 @@
+from breeze.services.transfer_service import TransferService
+from breeze.utils.cli_utils import (
+    check_exit,
+    clear_screen,
+    direct_to_dashboard,
+    print_system_message,
+    table_creator,
+)
+from breeze.utils.constants import ADMIN_BANNER_STRING
+
+MAX_REJECTED_ROWS = 20
+
+
+def bulk_transfer(auth_service):
+    """
+    Imports or exports users and appointments in bulk, from or to a CSV or JSONL file.
+
+    Imports are validated record by record and saved once at the end. The result shows
+    how many records were transferred, the throughput and the reason for each rejection.
+
+    Args:
+        auth_service (AuthService): The authentication service managing users.
+    """
+    transfer_service = TransferService(auth_service)
+    actions = {
+        "u": ("Import users", transfer_service.import_users),
+        "a": ("Import appointments", transfer_service.import_appointments),
+        "e": ("Export users", transfer_service.export_users),
+        "p": ("Export appointments", transfer_service.export_appointments),
+    }
+
+    clear_screen()
+    print(ADMIN_BANNER_STRING)
+    print_system_message("Bulk Import / Export")
+    print("Files can be .csv or .jsonl. Imported patients without an MHWP are allocated one.\n")
+    print("[U] Import users")
+    print("[A] Import appointments")
+    print("[E] Export users")
+    print("[P] Export appointments")
+    print("[X] Exit")
+
+    while True:
+        user_input = input("> ").strip().lower()
+        if check_exit(user_input):
+            return
+        if user_input in actions:
+            break
+        print_system_message("Invalid input. Please select from the options provided.")
+
+    description, transfer = actions[user_input]
+    file_path = input("File path (or [X] to exit): ").strip()
+    if check_exit(file_path) or not file_path:
+        return
+
+    print(f"\n{description} ...")
+    try:
+        report = transfer(file_path)
+    except (OSError, ValueError) as error:
+        print_system_message(f"{description} failed: {error}")
+        direct_to_dashboard()
+        return
+
+    print_system_message(report.describe())
+    if report.rejected:
+        print("\nRejected records:")
+        table_creator(
+            ["Line", "Reason"],
+            [[line_no, reason] for line_no, reason in report.rejected[:MAX_REJECTED_ROWS]],
+        )
+        if len(report.rejected) > MAX_REJECTED_ROWS:
+            print(f"... and {len(report.rejected) - MAX_REJECTED_ROWS} more.")
+
+    direct_to_dashboard()
@@ -1,6 +1,5 @@
-from breeze.models.mhwp import MHWP
 from breeze.models.patient import Patient
-from breeze.services.admin_service.admin_user_printer import print_users
+from breeze.services.admin_service.user_lookup import select_user
 from breeze.utils.cli_utils import check_exit, clear_screen, direct_to_dashboard, print_system_message
 from breeze.utils.constants import ADMIN_BANNER_STRING
 
@@ -26,30 +25,16 @@ def edit_user_information(auth_service):
             break
         print_system_message("Invalid choice. Please select a valid option.")
 
-    # Filter and display users of the chosen type
-    users_to_edit = [
-        user for user in auth_service.users.values() if (isinstance(user, Patient) if user_input == "p"
-        else isinstance(user, MHWP))
-    ]
+    # Search and select a user of the chosen type
     title = "Patients" if user_input == "p" else "MHWPs"
-
-   
-    clear_screen()
-    print(ADMIN_BANNER_STRING)
-    print_users(users_to_edit, title, basic_view=True)
-
-    while True:
-        print("\nEnter the username of the user to edit (or enter [X] to exit):")
-        username = input("> ").strip().lower()
-        
-        if check_exit(username):
-            return
-
-        user = auth_service.users.get(username)
-        if user and ((user_input == "p" and isinstance(user, Patient)) or (user_input == "m" and isinstance(user, MHWP))):
-            break
-        else:
-            print_system_message("Invalid username. Please try again.")
+    user = select_user(
+        auth_service,
+        title,
+        ["Patient"] if user_input == "p" else ["MHWP"],
+        heading="Edit User Information",
+    )
+    if not user:
+        return
 
         # Display and edit user information
     clear_screen()
@@ -109,6 +94,7 @@ def edit_user_information(auth_service):
         + (f"\nEmergency contact email: {user.get_emergency_contact()}" if isinstance(user, Patient) else "")
     )
 
+    auth_service.reindex_user(user)
     auth_service.save_data_to_file()
     direct_to_dashboard()
     return
\ No newline at end of file
@@ -1,9 +1,6 @@
-from breeze.models.mhwp import MHWP
-from breeze.models.patient import Patient
 from breeze.services.admin_service.admin_user_printer import print_users
+from breeze.services.admin_service.user_lookup import select_user
 from breeze.utils.cli_utils import (
-    check_exit,
-    check_previous,
     clear_screen,
     direct_to_dashboard,
     print_system_message,
@@ -13,46 +10,27 @@ from breeze.utils.constants import ADMIN_BANNER_STRING
 
 def reallocate_patient_to_mhwp(auth_service):
     while True:
-        clear_screen()
-        print(ADMIN_BANNER_STRING)
-        print_system_message("Reallocate Patient to MHWP")
-
-        patients = [
-            user for user in auth_service.users.values() if isinstance(user, Patient)
-        ]
-        mhwps = [user for user in auth_service.users.values() if isinstance(user, MHWP)]
-
-        if not patients:
+        if not auth_service.search_users("", ["Patient"], page_size=1)[0]:
+            clear_screen()
+            print(ADMIN_BANNER_STRING)
             print_system_message("No patients found.")
             direct_to_dashboard()
             return
 
-        print_users(
-            patients,
+        selected_patient = select_user(
+            auth_service,
             "List of All Patients and Their Assigned MHWPs:",
-            show_assigned_patients=False,
+            ["Patient"],
+            heading="Reallocate Patient to MHWP",
+            printer=lambda users: print_users(
+                users,
+                "List of All Patients and Their Assigned MHWPs:",
+                show_assigned_patients=False,
+            ),
         )
-        print(
-            "\nEnter the username of the patient to reallocate (or enter [X] to exit):"
-        )
-
-        while True:
-            selected_patient_username = input("> ").strip().lower()
-
-            if check_exit(selected_patient_username):
-                return
-
-            selected_patient = auth_service.users.get(selected_patient_username)
-            if selected_patient and isinstance(selected_patient, Patient):
-                break
-            else:
-                print_system_message(
-                    "Invalid username. Please enter a valid patient username."
-                )
+        if not selected_patient:
+            return
 
-            # List of MHWPs
-        clear_screen()
-        print(ADMIN_BANNER_STRING)
         assigned_mhwp_username = selected_patient.get_assigned_mhwp()
         assigned_mhwp_obj = auth_service.get_user_by_username(assigned_mhwp_username)
 
@@ -61,57 +39,45 @@ def reallocate_patient_to_mhwp(auth_service):
         else:
             mhwp_name = "Unassigned"
 
-        print(
-            f"\nPatient: {selected_patient.get_first_name()} {selected_patient.get_last_name()} (Username: {selected_patient.get_username()}) is currently assigned to: {mhwp_name}"
+        # List of MHWPs, [X] returns to the patient selection
+        selected_mhwp = select_user(
+            auth_service,
+            "Available MHWPs",
+            ["MHWP"],
+            heading=f"Patient: {selected_patient.get_first_name()} {selected_patient.get_last_name()} (Username: {selected_patient.get_username()}) is currently assigned to: {mhwp_name}",
+            printer=lambda users: print_users(
+                users, "Available MHWPs", show_assigned_patients=True
+            ),
         )
-        print_users(mhwps, "Available MHWPs", show_assigned_patients=True)
-
-        while True:
-            selected_mhwp_username = input(
-                "\nEnter the username of the MHWP to allocate the patient to (or enter [R] to return to previous menu): "
-            ).strip()
-
-            if check_previous(selected_mhwp_username):
-                break
-
-            selected_mhwp = auth_service.get_user_by_username(selected_mhwp_username)
-            if selected_mhwp and isinstance(selected_mhwp, MHWP):
-                if selected_mhwp.get_is_disabled():
-                    print_system_message(
-                        f"You cannot assign the patient to MHWP '{selected_mhwp.get_first_name()} {selected_mhwp.get_last_name()}' because their account is disabled."
-                    )
-                    direct_to_dashboard()
-                    return
+        if not selected_mhwp:
+            continue
+
+        selected_mhwp_username = selected_mhwp.get_username()
+        if selected_mhwp.get_is_disabled():
+            print_system_message(
+                f"You cannot assign the patient to MHWP '{selected_mhwp.get_first_name()} {selected_mhwp.get_last_name()}' because their account is disabled."
+            )
+            direct_to_dashboard()
+            return
 
-                elif assigned_mhwp_username == selected_mhwp_username:
-                    clear_screen()
-                    print(ADMIN_BANNER_STRING)
-                    print_system_message(
-                        f"This patient is already allocated to MHWP '{selected_mhwp.get_first_name()} {selected_mhwp.get_last_name()}'. No changes were required."
-                    )
-                    direct_to_dashboard("No changes required!")
-                    return
-                else:
-                    if assigned_mhwp_username:
-                        previous_mhwp = auth_service.users.get(assigned_mhwp_username)
-                        if previous_mhwp and isinstance(previous_mhwp, MHWP):
-                            previous_mhwp.get_assigned_patients().remove(
-                                selected_patient.get_username()
-                            )
+        elif assigned_mhwp_username == selected_mhwp_username:
+            clear_screen()
+            print(ADMIN_BANNER_STRING)
+            print_system_message(
+                f"This patient is already allocated to MHWP '{selected_mhwp.get_first_name()} {selected_mhwp.get_last_name()}'. No changes were required."
+            )
+            direct_to_dashboard("No changes required!")
+            return
+        else:
+            auth_service.assign_patient_to_mhwp(selected_patient, selected_mhwp)
 
-                    selected_patient.set_assigned_mhwp(selected_mhwp_username)
-                    selected_mhwp.add_patient(selected_patient_username)
+            auth_service.save_data_to_file()
 
-                    auth_service.save_data_to_file()
+            clear_screen()
+            print(ADMIN_BANNER_STRING)
+            print_system_message(
+                f"Successfully reallocated patient '{selected_patient.get_username()}' to MHWP '{selected_mhwp.get_username()}'."
+            )
+            direct_to_dashboard("Patient allocation saved!")
+            return
 
-                    clear_screen()
-                    print(ADMIN_BANNER_STRING)
-                    print_system_message(
-                        f"Successfully reallocated patient '{selected_patient.get_username()}' to MHWP '{selected_mhwp.get_username()}'."
-                    )
-                    direct_to_dashboard("Patient allocation saved!")
-                    return
-            else:
-                print_system_message(
-                    "Invalid MHWP username. Please enter a valid MHWP username."
-                )
@@ -0,0 +1,44 @@
+from breeze.utils.cli_utils import clear_screen, direct_to_dashboard, print_system_message, table_creator
+from breeze.utils.constants import ADMIN_BANNER_STRING
+
+
+def rebalance_caseloads(auth_service):
+    """
+    Evens out patient caseloads across active MHWPs in one batch.
+
+    Patients assigned to disabled or deleted MHWPs are reassigned first. The planned moves
+    are shown for confirmation before anything is changed.
+
+    Args:
+        auth_service (AuthService): The authentication service managing users.
+    """
+    clear_screen()
+    print(ADMIN_BANNER_STRING)
+    print_system_message("Rebalance MHWP Caseloads")
+
+    moves = auth_service.rebalance_patients(dry_run=True)
+    if not moves:
+        print_system_message("Caseloads are already balanced. No changes were required.")
+        direct_to_dashboard()
+        return
+
+    print(f"\n{len(moves)} patient(s) will be reallocated:")
+    table_creator(
+        ["Patient", "From MHWP", "To MHWP"],
+        [[patient, from_mhwp or "Unassigned", to_mhwp] for patient, from_mhwp, to_mhwp in moves[:20]],
+    )
+    if len(moves) > 20:
+        print(f"... and {len(moves) - 20} more.")
+
+    while True:
+        print("\nPress [Y] to apply these changes or [N] to cancel:")
+        confirmation = input("> ").strip().lower()
+        if confirmation == "y":
+            auth_service.rebalance_patients()
+            print_system_message(f"Successfully reallocated {len(moves)} patient(s).")
+            break
+        elif confirmation == "n":
+            print_system_message("Rebalancing cancelled. No changes were made.")
+            break
+
+    direct_to_dashboard()
@@ -0,0 +1,88 @@
+from breeze.services.admin_service.admin_user_printer import print_users
+from breeze.utils.cli_utils import check_exit, clear_screen, print_system_message
+from breeze.utils.constants import ADMIN_BANNER_STRING
+
+PAGE_SIZE = 10
+
+
+def select_user(auth_service, title, roles, heading=None, printer=None, page_size=PAGE_SIZE):
+    """Lets the admin find a user by searching instead of scrolling through every user.
+
+    Only one page of matching users is shown at a time. The admin can type the exact
+    username to select a user, or part of a username, name or email to narrow the list
+    down, refining the search as they go. An exact username is matched before the
+    page commands.
+
+    Args:
+        auth_service (AuthService): The authentication service managing users.
+        title (str): Title of the results table.
+        roles (list of str): Roles of the users that can be selected.
+        heading (str, optional): System message shown above the results.
+        printer (callable, optional): Prints a page of users. Defaults to the basic user table.
+        page_size (int, optional): Number of users per page.
+
+    Returns:
+        User: The selected user, or None if the admin exited.
+    """
+    printer = printer or (lambda users: print_users(users, title, basic_view=True))
+    query = ""
+    page = 1
+    message = None
+
+    while True:
+        clear_screen()
+        print(ADMIN_BANNER_STRING)
+        if heading:
+            print_system_message(heading)
+
+        users, has_next_page = auth_service.search_users(query, roles, page, page_size)
+        if not users and query:
+            suggestions = auth_service.suggest_users(query, roles, page_size)
+            print(f"\nNo users match '{query}'.")
+            if suggestions:
+                printer(suggestions)
+                print("Did you mean one of the users above?")
+        else:
+            printer(users)
+            print(f"Page [{page}]" + (f" - Filtering by: '{query}'" if query else ""))
+
+        if message:
+            print_system_message(message)
+            message = None
+
+        print(
+            "\nEnter a username to select it, or part of a username, name or email to search."
+        )
+        options = []
+        if has_next_page:
+            options.append("[N] Next page")
+        if page > 1:
+            options.append("[P] Previous page")
+        if query:
+            options.append("[C] Clear search")
+        options.append("[X] Exit")
+        print(" | ".join(options))
+
+        user_input = input("> ").strip().lower()
+
+        # An exact username wins over the commands, so users named e.g. "n" can be selected
+        user = auth_service.get_user_by_username(user_input)
+        if user and user.get_role() in roles:
+            return user
+
+        if check_exit(user_input):
+            return None
+        if user_input == "n" and has_next_page:
+            page += 1
+            continue
+        if user_input == "p" and page > 1:
+            page -= 1
+            continue
+        if user_input == "c" and query:
+            query, page = "", 1
+            continue
+        if not user_input:
+            message = "Please enter a username or a search term."
+            continue
+
+        query, page = user_input, 1
@@ -0,0 +1,24 @@
+from breeze.services.mood_analytics_service import MoodAnalytics
+from breeze.utils.cli_utils import clear_screen, direct_to_dashboard, print_system_message
+from breeze.utils.constants import ADMIN_BANNER_STRING
+from breeze.utils.mood_chart_utils import print_mood_trends
+
+
+def view_mood_trends(auth_service):
+    """
+    Displays mood trends across every patient using the service.
+
+    Args:
+        auth_service (AuthService): The authentication service managing users.
+    """
+    clear_screen()
+    print(ADMIN_BANNER_STRING)
+    print_system_message("Population Mood Trends")
+
+    patients = auth_service.get_patients().values()
+    if not patients:
+        print_system_message("There are no patients yet.")
+    else:
+        print_mood_trends(MoodAnalytics.from_patients(patients))
+
+    direct_to_dashboard()
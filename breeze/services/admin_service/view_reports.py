@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+
+from breeze.services.reporting_service import get_report_path, load_reports
+from breeze.utils.cli_utils import clear_screen, direct_to_dashboard, print_system_message, table_creator
+from breeze.utils.constants import ADMIN_BANNER_STRING
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# The background report run started from this session, if any
+_report_process = None
+
+
+def format_percentage(value):
+    return f"{value * 100:.1f}%" if value is not None else "-"
+
+
+def get_report_row(name, report):
+    appointments = report["appointments"]
+    return [
+        name,
+        report["patients"],
+        report["average_mood"] if report["average_mood"] is not None else "-",
+        report["low_mood_patients"],
+        report["patients_without_mood"],
+        appointments["requested"],
+        appointments["confirmed"],
+        appointments["cancelled"],
+        format_percentage(report["utilisation"]),
+    ]
+
+
+def is_report_running():
+    """Checks whether the last report run is still going. poll() also reaps a finished run."""
+    return _report_process is not None and _report_process.poll() is None
+
+
+def start_report_process(data_path):
+    """Starts the reporting process in the background, so the session is not blocked.
+
+    Returns:
+        subprocess.Popen: The new run, or None if the previous run has not finished yet.
+    """
+    global _report_process
+    if is_report_running():
+        return None
+    _report_process = subprocess.Popen(
+        [sys.executable, "-m", "breeze.services.reporting_service", "--data", os.path.abspath(data_path)],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return _report_process
+
+
+def view_reports(auth_service):
+    """
+    Displays the latest caseload, mood and appointment utilisation reports.
+
+    The reports are computed by a separate process from a snapshot of the data, so they
+    are shown instantly. The admin can start a new run in the background.
+
+    Args:
+        auth_service (AuthService): The authentication service managing users.
+    """
+    clear_screen()
+    print(ADMIN_BANNER_STRING)
+    print_system_message("Reports")
+
+    reports = load_reports(auth_service.data_path)
+    if is_report_running():
+        print("New reports are being generated in the background.\n")
+    if not reports:
+        print("No reports have been generated yet.")
+    else:
+        window = reports["window"]
+        print(
+            f"Generated {reports['generated']} from the data saved at {reports['snapshot']['modified']}, "
+            f"covering {window['start']} to {window['end']} ({window['days']} days).\n"
+        )
+        rows = [
+            get_report_row(
+                f"{report['mhwp']}{' (disabled)' if report['is_disabled'] else ''}" if report["mhwp"] else "Unassigned",
+                report,
+            )
+            for report in reports["mhwps"]
+        ]
+        rows.append(get_report_row("All MHWPs", reports["totals"]))
+        table_creator(
+            ["MHWP", "Patients", "Avg Mood", "Low Mood", "No Mood", "Requested", "Confirmed", "Cancelled", "Utilisation"],
+            rows,
+        )
+        print("\nAvg Mood is from 1 (Very Sad) to 5 (Very Happy). Low Mood counts patients whose moods on")
+        print("their latest day averaged Sad or below, and No Mood those without a mood entry in the period.")
+        print("Utilisation is confirmed appointments out of the working-day slots in the period.")
+
+    print("\n[G] Generate new reports in the background")
+    print("[B] Back to the dashboard")
+    while True:
+        user_input = input("> ").strip().lower()
+        if user_input == "g":
+            if start_report_process(auth_service.data_path) is None:
+                print_system_message("Reports are already being generated. Open Reports again in a moment.")
+                direct_to_dashboard()
+                return
+            print_system_message(
+                f"Reports are being generated and will be saved to {get_report_path(auth_service.data_path)}.\n"
+                "Open Reports again in a moment to see them."
+            )
+            direct_to_dashboard()
+            return
+        if user_input == "b":
+            clear_screen()
+            return
+        print("Invalid input. Please press [G] or [B].")
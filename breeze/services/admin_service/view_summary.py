@@ -1,29 +1,57 @@
-from breeze.models.mhwp import MHWP
-from breeze.models.patient import Patient
+import datetime
+from itertools import islice
+
+from breeze.services.statistics_service import get_week_start
 from breeze.utils.cli_utils import clear_screen, direct_to_dashboard, print_system_message
 from breeze.utils.constants import ADMIN_BANNER_STRING
 
+SUMMARY_WEEKS = 4
+
 
-def view_summary(auth_service):
+def view_summary(auth_service, max_rows=None):
     """
     Displays a summary of admin-related information.
+
+    Totals and appointment counts come from the maintained statistics store. Every patient
+    and MHWP is listed unless max_rows is given, in which case only the first max_rows of
+    each are listed, followed by a count of the rest.
     """
     clear_screen()
     print(ADMIN_BANNER_STRING)
     print_system_message("User Summary")
     
-    # Fetch all users
-    users = auth_service.get_all_users().values()
-    
-    # Separate patients and MHWPs
-    patients = [user for user in users if isinstance(user, Patient)]
-    mhwps = [user for user in users if isinstance(user, MHWP)]
+    # Fetch patients and MHWPs from their role partitions, and counts from the statistics store
+    patients = auth_service.get_patients()
+    mhwps = auth_service.get_mhwps()
+    statistics = auth_service.statistics
+    current_week = get_week_start(datetime.date.today())
+
+    print("\nAccounts:")
+    print("-" * 44)
+    print(f"| {'Role':<10} | {'Active':<12} | {'Disabled':<12} |")
+    print("-" * 44)
+    for role, totals in statistics.get_user_totals().items():
+        print(f"| {role:<10} | {totals['active']:<12} | {totals['disabled']:<12} |")
+    print("-" * 44)
+
+    print("\nAppointments by Week:")
+    print("-" * 62)
+    print(f"| {'Week Starting':<15} | {'Requested':<11} | {'Confirmed':<11} | {'Cancelled':<11} |")
+    print("-" * 62)
+    for week_start, counts in statistics.get_weekly_breakdown(SUMMARY_WEEKS):
+        print(
+            f"| {week_start.strftime('%d-%m-%Y'):<15} | "
+            f"{counts['requested']:<11} | "
+            f"{counts['confirmed']:<11} | "
+            f"{counts['cancelled']:<11} |"
+        )
+    print("-" * 62)
 
     print("\nPatients Summary:")
     print("-" * 101)
     print(f"| {'Username':<15} | {'First Name':<15} | {'Last Name':<15} | {'Email':<25} | {'Assigned MHWP':<15} |")
     print("-" * 101)
-    for patient in patients:
+    for patient in islice(patients.values(), max_rows):
         print(
             f"| {patient.get_username():<15} | "
             f"{patient.get_first_name() or 'N/A':<15} | "
@@ -32,17 +60,16 @@ def view_summary(auth_service):
             f"{patient.get_assigned_mhwp() or 'Unassigned':<15} |"
         )
     print("-" * 101)
+    print_remaining_count(len(patients), max_rows, "patients")
 
     print("\nMHWP Summary:")
     print("(Note: Confirmed Bookings are bookings confirmed for the current week.)")
     print("-" * 124)
     print(f"| {'Username':<15} | {'First Name':<15} | {'Last Name':<15} | {'Email':<25} | {'Assigned Patients':<17} | {'Confirmed Bookings':<18} |")
     print("-" * 124)
-    for mhwp in mhwps:
-        assigned_patients = len(mhwp.get_assigned_patients()) if mhwp.get_assigned_patients() else 0
-        confirmed_bookings = sum(
-            1 for appointment in mhwp.get_appointments() if appointment.get_status() == "confirmed"
-        )
+    for mhwp in islice(mhwps.values(), max_rows):
+        assigned_patients = len(mhwp.get_assigned_patients())
+        confirmed_bookings = statistics.get_week_counts(current_week, mhwp.get_username())["confirmed"]
         print(
             f"| {mhwp.get_username():<15} | "
             f"{mhwp.get_first_name() or 'N/A':<15} | "
@@ -53,4 +80,10 @@ def view_summary(auth_service):
         )
     
     print("-" * 124)
-    direct_to_dashboard()
\ No newline at end of file
+    print_remaining_count(len(mhwps), max_rows, "MHWPs")
+    direct_to_dashboard()
+
+
+def print_remaining_count(total, max_rows, role_name):
+    if max_rows is not None and total > max_rows:
+        print(f"... and {total - max_rows} more {role_name}. Use a user search screen to find them.")
\ No newline at end of file
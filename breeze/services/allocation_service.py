@@ -0,0 +1,203 @@
+import heapq
+import datetime
+from itertools import count
+
+
+class LeastCaseloadPolicy:
+    """Allocates patients to the MHWP with the fewest assigned patients.
+
+    Args:
+        max_patients (int, optional): Capacity cap per MHWP. Defaults to no cap.
+    """
+
+    def __init__(self, max_patients=None):
+        self.max_patients = max_patients
+
+    def get_base_load(self, mhwp):
+        """Load an MHWP carries on top of their caseload. Override to weight MHWPs differently."""
+        return 0
+
+    def get_load(self, mhwp, caseload_size, base_load=None):
+        base_load = self.get_base_load(mhwp) if base_load is None else base_load
+        return caseload_size + base_load
+
+    def has_capacity(self, caseload_size):
+        return self.max_patients is None or caseload_size < self.max_patients
+
+
+class ConfirmedAppointmentWeightedPolicy(LeastCaseloadPolicy):
+    """Allocates by caseload plus a weight per upcoming confirmed appointment.
+
+    Args:
+        weight (float, optional): Load added per upcoming confirmed appointment. Defaults to 0.5.
+        max_patients (int, optional): Capacity cap per MHWP. Defaults to no cap.
+    """
+
+    def __init__(self, weight=0.5, max_patients=None):
+        super().__init__(max_patients)
+        self.weight = weight
+
+    def get_base_load(self, mhwp):
+        today = datetime.date.today()
+        confirmed_appointments = sum(
+            1
+            for app in mhwp.get_appointments()
+            if app.get_status() == "confirmed" and app.get_date() >= today
+        )
+        return self.weight * confirmed_appointments
+
+
+class MHWPAllocator:
+    """Picks the MHWP a new patient is assigned to, using a min-heap keyed on load.
+
+    The heap uses lazy invalidation: every update pushes a fresh (load, order, username)
+    entry and stale entries are discarded when they reach the top. Disabled MHWPs and
+    MHWPs at capacity are not eligible. Ties go to the MHWP that was added first.
+
+    Args:
+        mhwps (iterable of MHWP): The MHWPs to allocate between.
+        policy (LeastCaseloadPolicy, optional): Allocation policy. Defaults to least caseload.
+    """
+
+    def __init__(self, mhwps=(), policy=None):
+        self.policy = policy or LeastCaseloadPolicy()
+        self.__mhwps = {}
+        self.__order = {}
+        self.__current = {}
+        self.__heap = []
+        self.__counter = count()
+        for mhwp in mhwps:
+            self.update(mhwp)
+
+    def __is_eligible(self, mhwp, caseload_size):
+        return not mhwp.get_is_disabled() and self.policy.has_capacity(caseload_size)
+
+    def update(self, mhwp):
+        """Re-keys an MHWP after their caseload, status or appointments changed."""
+        username = mhwp.get_username()
+        self.__mhwps[username] = mhwp
+        if username not in self.__order:
+            self.__order[username] = next(self.__counter)
+
+        caseload_size = len(mhwp.get_assigned_patients())
+        if not self.__is_eligible(mhwp, caseload_size):
+            self.__current.pop(username, None)
+            return
+
+        entry = (self.policy.get_load(mhwp, caseload_size), self.__order[username], username)
+        if self.__current.get(username) != entry:
+            self.__current[username] = entry
+            heapq.heappush(self.__heap, entry)
+            self.__compact()
+
+    def remove(self, username):
+        """Stops allocating to an MHWP, e.g. when their account is deleted."""
+        self.__mhwps.pop(username, None)
+        self.__current.pop(username, None)
+
+    def set_policy(self, policy):
+        """Switches the allocation policy and re-keys every MHWP."""
+        self.policy = policy
+        self.__current = {}
+        self.__heap = []
+        for mhwp in list(self.__mhwps.values()):
+            self.update(mhwp)
+
+    def peek(self):
+        """Returns the MHWP with the lowest load, or None if no MHWP is eligible."""
+        while self.__heap:
+            entry = self.__heap[0]
+            if self.__current.get(entry[2]) == entry:
+                return self.__mhwps[entry[2]]
+            heapq.heappop(self.__heap)
+        return None
+
+    def __compact(self):
+        if len(self.__heap) > 2 * len(self.__current) + 64:
+            self.__heap = list(self.__current.values())
+            heapq.heapify(self.__heap)
+
+    def plan_rebalance(self, patients):
+        """Plans the patient moves that even out the load across eligible MHWPs.
+
+        Patients without an eligible MHWP (unassigned, or assigned to a disabled or deleted
+        MHWP) are placed first. Then patients are moved from the most to the least loaded
+        MHWP for as long as that strictly lowers the spread. Nothing is changed.
+
+        Args:
+            patients (iterable of Patient): All patients.
+
+        Returns:
+            list of tuple: (patient_username, from_mhwp_username or None, to_mhwp_username)
+        """
+        mhwps = {
+            username: mhwp
+            for username, mhwp in self.__mhwps.items()
+            if not mhwp.get_is_disabled()
+        }
+        if not mhwps:
+            return []
+
+        caseloads = {username: list(mhwp.get_assigned_patients()) for username, mhwp in mhwps.items()}
+        base_loads = {username: self.policy.get_base_load(mhwp) for username, mhwp in mhwps.items()}
+
+        def load(username, delta=0):
+            return self.policy.get_load(
+                mhwps[username], len(caseloads[username]) + delta, base_loads[username]
+            )
+
+        def entry(username):
+            return (load(username), self.__order[username], username)
+
+        min_heap = [entry(username) for username in mhwps if self.policy.has_capacity(len(caseloads[username]))]
+        max_heap = [(-load(username), self.__order[username], username) for username in mhwps]
+        heapq.heapify(min_heap)
+        heapq.heapify(max_heap)
+
+        def pop_valid(heap, is_valid):
+            while heap and not is_valid(heap[0]):
+                heapq.heappop(heap)
+            return heap[0][2] if heap else None
+
+        def is_valid_receiver(item):
+            return item == entry(item[2]) and self.policy.has_capacity(len(caseloads[item[2]]))
+
+        def is_valid_donor(item):
+            return -item[0] == load(item[2])
+
+        planned = {}
+
+        def move(patient_username, from_username, to_username):
+            original, _ = planned.get(patient_username, (from_username, None))
+            if original == to_username:
+                planned.pop(patient_username)
+            else:
+                planned[patient_username] = (original, to_username)
+            if from_username in caseloads:
+                caseloads[from_username].pop()
+                heapq.heappush(max_heap, (-load(from_username), self.__order[from_username], from_username))
+                heapq.heappush(min_heap, entry(from_username))
+            caseloads[to_username].append(patient_username)
+            heapq.heappush(max_heap, (-load(to_username), self.__order[to_username], to_username))
+            heapq.heappush(min_heap, entry(to_username))
+
+        for patient in patients:
+            if patient.get_assigned_mhwp() not in mhwps:
+                receiver = pop_valid(min_heap, is_valid_receiver)
+                if receiver is None:
+                    break
+                move(patient.get_username(), patient.get_assigned_mhwp(), receiver)
+
+        while True:
+            donor = pop_valid(max_heap, is_valid_donor)
+            receiver = pop_valid(min_heap, is_valid_receiver)
+            if donor is None or receiver is None or donor == receiver:
+                break
+            if not caseloads[donor] or load(receiver, 1) >= load(donor):
+                break
+            move(caseloads[donor][-1], donor, receiver)
+
+        return [
+            (patient_username, from_username, to_username)
+            for patient_username, (from_username, to_username) in planned.items()
+        ]
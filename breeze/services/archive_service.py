@@ -0,0 +1,255 @@
+"""Archival of old history into compressed per-year files.
+
+Moods, journals and appointments older than a horizon are moved out of users.json into
+archive/<year>.jsonl.gz (or .jsonl.xz with lzma) next to the data file, so the data that
+is loaded and saved on every change only holds recent history. Each archive line is one
+record: {"kind": ..., "username": ..., "date": ..., "data": <the stored entry>}.
+
+Each archival run appends a new compressed stream to each year's file, so existing archives
+are never rewritten. The archives are read back on demand, when a patient searches their
+older history.
+
+To run: python -m breeze.services.archive_service [--days N] [--compression gzip|lzma]
+"""
+import argparse
+import datetime
+import gzip
+import json
+import lzma
+import os
+import re
+
+from breeze.services.auth_service import DATA_FILE_PATH, AuthService
+from breeze.utils.entry_map import get_timestamp_key
+
+ARCHIVE_DAYS_ENV_VAR = "BREEZE_ARCHIVE_DAYS"
+DEFAULT_ARCHIVE_DAYS = 365
+COMPRESSIONS = {"gzip": (gzip, ".jsonl.gz"), "lzma": (lzma, ".jsonl.xz")}
+DEFAULT_COMPRESSION = "gzip"
+ARCHIVE_FILE_PATTERN = re.compile(r"^(\d{4})\.jsonl\.(gz|xz)$")
+
+
+def get_archive_days():
+    """Returns the archive horizon in days from BREEZE_ARCHIVE_DAYS, or the default."""
+    try:
+        return max(int(os.environ.get(ARCHIVE_DAYS_ENV_VAR, "")), 0)
+    except ValueError:
+        return DEFAULT_ARCHIVE_DAYS
+
+
+def get_archive_dir(data_path):
+    """Returns the archive directory of a data file: archive/ next to it."""
+    return os.path.join(os.path.dirname(data_path) or ".", "archive")
+
+
+def get_record_text(record):
+    """Returns the searchable text of an archived record, in lower case."""
+    data = record["data"]
+    match record["kind"]:
+        case "journal":
+            fields = (data.get("title"), data.get("text"))
+        case "mood":
+            fields = (data.get("mood"), data.get("comment"))
+        case _:
+            fields = (data.get("summary"), data.get("mhwpUsername"))
+    return " ".join(field for field in fields if field).lower()
+
+
+class HistoryArchive:
+    """The compressed per-year archive files in a directory.
+
+    Args:
+        directory (str): The archive directory. Created on the first append.
+        compression (str, optional): "gzip" or "lzma", for new archive data. Files in
+            either format are read.
+    """
+
+    def __init__(self, directory, compression=DEFAULT_COMPRESSION):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.directory = directory
+        self.compression = compression
+
+    def get_files(self):
+        """Returns (year, path, compression module) of every archive file, oldest year first."""
+        if not os.path.isdir(self.directory):
+            return []
+        modules = {extension[-2:]: module for module, extension in COMPRESSIONS.values()}
+        files = []
+        for name in sorted(os.listdir(self.directory)):
+            match = ARCHIVE_FILE_PATTERN.match(name)
+            if match:
+                files.append(
+                    (int(match.group(1)), os.path.join(self.directory, name), modules[match.group(2)])
+                )
+        return files
+
+    def get_years(self):
+        return sorted({year for year, _, _ in self.get_files()})
+
+    def append(self, records_by_year):
+        """Appends records to the archive file of their year.
+
+        Args:
+            records_by_year (dict): year -> list of records.
+
+        Returns:
+            int: The number of records written.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        module, extension = COMPRESSIONS[self.compression]
+        written = 0
+        for year, records in sorted(records_by_year.items()):
+            with module.open(os.path.join(self.directory, f"{year}{extension}"), "at") as file:
+                for record in records:
+                    file.write(json.dumps(record))
+                    file.write("\n")
+                    written += 1
+        return written
+
+    def iter_records(self, kind=None, username=None, years=None):
+        """Streams archived records, optionally of one kind, user and set of years.
+
+        A record archived twice (e.g. after an interrupted archival run) is yielded once.
+        """
+        seen = set()
+        for year, path, module in self.get_files():
+            if years and year not in years:
+                continue
+            with module.open(path, "rt") as file:
+                for line in file:
+                    # cheap prefilter before decoding the line
+                    if username and f'"username": {json.dumps(username)}' not in line:
+                        continue
+                    record = json.loads(line)
+                    if kind and record["kind"] != kind:
+                        continue
+                    record_id = (record["kind"], record["data"].get("id") or record["data"].get("appointmentId"))
+                    if record_id in seen:
+                        continue
+                    seen.add(record_id)
+                    yield record
+
+    def search(self, kind, username, text=None, years=None):
+        """Returns a user's archived records of one kind that contain the text, newest first."""
+        text = text.lower() if text else None
+        records = [
+            record
+            for record in self.iter_records(kind, username, years)
+            if not text or text in get_record_text(record)
+        ]
+        records.sort(key=lambda record: get_timestamp_key(record["date"]), reverse=True)
+        return records
+
+
+def make_record(kind, username, date, data):
+    return {"kind": kind, "username": username, "date": date, "data": data}
+
+
+def archive_history(auth_service, archive, days=None, today=None):
+    """Moves moods, journals and appointments older than the horizon into the archive.
+
+    The archive is written before the entries are removed, and the data file is saved
+    once at the end.
+
+    Args:
+        auth_service (AuthService): The service holding the users.
+        archive (HistoryArchive): Where to move the old history.
+        days (int, optional): The horizon in days. Defaults to BREEZE_ARCHIVE_DAYS or 365.
+        today (datetime.date, optional): The date the horizon is counted from.
+
+    Returns:
+        dict: The number of archived records per kind.
+    """
+    days = get_archive_days() if days is None else days
+    cutoff = (today or datetime.date.today()) - datetime.timedelta(days=days)
+    cutoff_key = cutoff.strftime("%Y%m%d")
+
+    records_by_year = {}
+    counts = {"mood": 0, "journal": 0, "appointment": 0}
+    old_entries = []
+    old_appointments = {}
+
+    def add_record(record):
+        records_by_year.setdefault(int(record["date"][6:10]), []).append(record)
+        counts[record["kind"]] += 1
+
+    for patient in auth_service.get_patients().values():
+        username = patient.get_username()
+        for kind, entries in (
+            ("mood", patient.get_mood_entries()),
+            ("journal", patient.get_journal_entries()),
+        ):
+            # entries are kept oldest first
+            for entry in entries:
+                if get_timestamp_key(entry["date"]) >= cutoff_key:
+                    break
+                add_record(make_record(kind, username, entry["date"], entry))
+                old_entries.append((patient, kind, entry["id"]))
+
+        for appointment in patient.get_appointments():
+            if appointment.get_date() < cutoff and appointment.get_id() not in old_appointments:
+                old_appointments[appointment.get_id()] = appointment
+                add_record(
+                    make_record(
+                        "appointment",
+                        username,
+                        appointment.get_date().strftime("%d-%m-%Y"),
+                        appointment.to_dict(),
+                    )
+                )
+
+    if not records_by_year:
+        return counts
+    archive.append(records_by_year)
+
+    for patient, kind, entry_id in old_entries:
+        if kind == "mood":
+            patient.delete_mood_entry(entry_id)
+        else:
+            patient.delete_journal_entry(entry_id)
+    if old_appointments:
+        for user in list(auth_service.get_patients().values()) + list(auth_service.get_mhwps().values()):
+            appointments = user.get_appointments()
+            kept = [app for app in appointments if app.get_id() not in old_appointments]
+            if len(kept) != len(appointments):
+                user.set_appointments(kept)
+        for appointment in old_appointments.values():
+            auth_service.statistics.untrack_appointment(appointment)
+
+    auth_service.save_data_to_file()
+    return counts
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Moves old moods, journals and appointments into compressed per-year archives."
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        help=f"archive history older than this many days (default: {ARCHIVE_DAYS_ENV_VAR} or {DEFAULT_ARCHIVE_DAYS})",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSIONS,
+        default=DEFAULT_COMPRESSION,
+        help=f"compression for new archive data (default: {DEFAULT_COMPRESSION})",
+    )
+    parser.add_argument("--data", help="data file (default: ./data/users.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    data_path = args.data or DATA_FILE_PATH
+    archive = HistoryArchive(get_archive_dir(data_path), args.compression)
+    counts = archive_history(AuthService(data_path), archive, args.days)
+    print(
+        f"Archived {counts['mood']} mood(s), {counts['journal']} journal(s) and "
+        f"{counts['appointment']} appointment(s) to {archive.directory}"
+    )
+
+
+if __name__ == "__main__":
+    main()
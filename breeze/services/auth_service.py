@@ -1,7 +1,9 @@
-import time
+from itertools import chain, islice
 
 from breeze.models.admin import Admin
 from breeze.models.patient import Patient
+from breeze.services.allocation_service import MHWPAllocator
+from breeze.services.statistics_service import AdminStatistics
 from breeze.models.mhwp import MHWP
 
 from breeze.utils.cli_utils import (
@@ -14,19 +16,55 @@ from breeze.utils.cli_utils import (
     is_valid_name,
     is_empty,
 )
+from breeze.utils.credential_utils import (
+    VerifiedCredentialCache,
+    hash_password,
+    hash_passwords,
+    is_hashed,
+    needs_rehash,
+)
 from breeze.utils.data_utils import load_data, save_data
+from breeze.utils.prefix_index import PrefixIndex
 from breeze.utils.constants import REGISTER_BANNER_STRING
+from breeze.utils.pacing import pause
+
+DATA_FILE_PATH = "./data/users.json"
+USER_ROLES = ("Patient", "MHWP", "Admin")
 
 
 class AuthService:
-    def __init__(self):
-        users_data, _ = load_data("./data/users.json")
+    def __init__(self, data_path=DATA_FILE_PATH, allocation_policy=None):
+        self.data_path = data_path
+        users_data, _ = load_data(self.data_path)
         self.users = {user.get_username(): user for user in users_data.values()}
         self.current_user = None
+        self.credential_cache = VerifiedCredentialCache()
+        # Set when a login re-hashes a password in memory; saved on logout or with the next change
+        self.has_unsaved_rehashes = False
+
+        # Role-partitioned views of self.users and admin statistics, kept in sync by every mutation below
+        self.users_by_role = {role: {} for role in USER_ROLES}
+        self.disabled_users = {}
+        self.statistics = AdminStatistics()
+        for user in self.users.values():
+            self._add_to_partitions(user)
+            if user.get_role() != "Admin":
+                for appointment in user.get_appointments():
+                    self.statistics.track_appointment(appointment)
+
+        self._reconcile_assignments()
+        self.allocator = MHWPAllocator(self.get_mhwps().values(), allocation_policy)
+
+        self.user_index = PrefixIndex()
+        self.user_index.build(
+            (username, self._get_search_terms(user))
+            for username, user in self.users.items()
+        )
 
     def save_data_to_file(self):
         """Save the updated user data to the JSON file"""
-        save_data("./data/users.json", list(self.users.values()))
+        save_data(self.data_path, list(self.users.values()))
+        self.has_unsaved_rehashes = False
 
     def login(self):
         while True:
@@ -37,14 +75,62 @@ class AuthService:
             break
         password = input("Password: ")
         user = self.users.get(username)
-        if user and user.login(password):
+        if user and self.verify_credentials(user, password):
             print_system_message(f"Welcome, {username}")
-            time.sleep(1)
+            pause(1)
             self.current_user = user
             return user
         return None
 
+    def verify_credentials(self, user, password):
+        """Checks a password against the user's stored credential.
+
+        Successful checks are kept in the verified-session cache, so logging in again skips
+        the key derivation. Plaintext or outdated hashes are transparently re-hashed with
+        the configured work factor on the first successful login. The new hash is saved
+        with the next change or on logout, rather than rewriting the data file per login.
+
+        Args:
+            user (User): The user trying to log in.
+            password (str): The password entered by the user.
+
+        Returns:
+            bool: True if the password is correct, otherwise False.
+        """
+        username = user.get_username()
+        if self.credential_cache.contains(username, user.get_password(), password):
+            return True
+
+        if not user.login(password):
+            return False
+
+        if needs_rehash(user.get_password()):
+            user.set_password(hash_password(password))
+            self.has_unsaved_rehashes = True
+
+        self.credential_cache.add(username, user.get_password(), password)
+        return True
+
+    def migrate_plaintext_passwords(self):
+        """Hashes every remaining plaintext password in one batch and saves once.
+
+        Returns:
+            int: The number of migrated users.
+        """
+        pending = [user for user in self.users.values() if not is_hashed(user.get_password())]
+        if not pending:
+            return 0
+
+        hashed_passwords = hash_passwords([user.get_password() for user in pending])
+        for user, hashed_password in zip(pending, hashed_passwords):
+            user.set_password(hashed_password)
+
+        self.save_data_to_file()
+        return len(pending)
+
     def logout(self):
+        if self.has_unsaved_rehashes:
+            self.save_data_to_file()
         if self.current_user:
             self.current_user = None
             return None
@@ -293,7 +379,7 @@ class AuthService:
         new_user = self._register_role(
             role,
             username,
-            password,
+            hash_password(password),
             first_name,
             last_name,
             email,
@@ -304,37 +390,227 @@ class AuthService:
         if role == "p" and new_user:
             mhwp = self.find_mhwp_with_fewest_patients()
             if mhwp:
-                mhwp.add_patient(new_user.get_username())
-                new_user.set_assigned_mhwp(mhwp.get_username())
+                self.assign_patient_to_mhwp(new_user, mhwp)
                 print_system_message(
                     f"You have been assigned to MHWP: {mhwp.get_first_name()} {mhwp.get_last_name()}."
                 )
 
         if new_user:
-            self.users[new_user.get_username()] = new_user
+            self.add_user(new_user)
             self.save_data_to_file()
             direct_to_dashboard("Account created successfully!")
 
     def find_mhwp_with_fewest_patients(self):
-        """Finds the MHWP with the fewest assigned patients.
+        """Finds the active MHWP with the lowest load under the allocation policy
+        (by default, the fewest assigned patients).
 
         Returns:
             MHWP: The MHWP with the fewest assigned patients, or None.
         """
-        mhwps = []
-        for user in self.users.values():
-            if isinstance(user, MHWP):
-                mhwps.append(user)
+        return self.allocator.peek()
 
-        if mhwps:
-            # Find MHWP with the fewest assigned patients
-            return min(mhwps, key=lambda mhwp: len(mhwp.get_assigned_patients()))
-        else:
-            return None
+    def _reconcile_assignments(self):
+        """Makes the patient -> MHWP and MHWP -> patients links agree after loading.
+
+        The patient's assigned MHWP is treated as the source of truth.
+        """
+        patients = self.get_patients()
+        for mhwp in self.get_mhwps().values():
+            for patient_username in list(mhwp.get_assigned_patients()):
+                patient = patients.get(patient_username)
+                if not patient or patient.get_assigned_mhwp() != mhwp.get_username():
+                    mhwp.remove_patient(patient_username)
+
+        for patient in patients.values():
+            mhwp = self.get_mhwps().get(patient.get_assigned_mhwp())
+            if mhwp:
+                mhwp.add_patient(patient.get_username())
+
+    def get_assigned_patients(self, mhwp):
+        """Returns the Patient objects assigned to an MHWP, in assignment order."""
+        patients = self.get_patients()
+        return [
+            patients[username]
+            for username in mhwp.get_assigned_patients()
+            if username in patients
+        ]
+
+    def get_assigned_mhwp(self, patient):
+        """Returns the MHWP object a patient is assigned to, or None."""
+        return self.get_mhwps().get(patient.get_assigned_mhwp())
+
+    def assign_patient_to_mhwp(self, patient, mhwp):
+        """Assigns a patient to an MHWP, unassigning them from their previous MHWP (does not save to file)."""
+        previous_mhwp = self.get_mhwps().get(patient.get_assigned_mhwp())
+        if previous_mhwp:
+            previous_mhwp.remove_patient(patient.get_username())
+            self.allocator.update(previous_mhwp)
+
+        patient.set_assigned_mhwp(mhwp.get_username())
+        mhwp.add_patient(patient.get_username())
+        self.allocator.update(mhwp)
+
+    def rebalance_patients(self, dry_run=False):
+        """Evens out caseloads across active MHWPs in one batch with a single save.
+
+        Args:
+            dry_run (bool, optional): Only plan the moves without applying them.
+
+        Returns:
+            list of tuple: The (patient_username, from_mhwp_username, to_mhwp_username) moves.
+        """
+        moves = self.allocator.plan_rebalance(self.get_patients().values())
+        if dry_run or not moves:
+            return moves
+
+        for patient_username, _, to_username in moves:
+            self.assign_patient_to_mhwp(
+                self.get_patients()[patient_username], self.get_mhwps()[to_username]
+            )
+        self.save_data_to_file()
+        return moves
 
     def get_all_users(self):
         return self.users
 
+    @staticmethod
+    def _get_search_terms(user):
+        """Returns the terms a user can be found by: username, names and email."""
+        return [
+            user.get_username(),
+            user.get_first_name(),
+            user.get_last_name(),
+            user.get_full_name(),
+            user.get_email(),
+        ]
+
+    def _add_to_partitions(self, user):
+        self.users_by_role.setdefault(user.get_role(), {})[user.get_username()] = user
+        if user.get_is_disabled():
+            self.disabled_users[user.get_username()] = user
+        self.statistics.add_user(user)
+
+    def _remove_from_partitions(self, user):
+        self.users_by_role.get(user.get_role(), {}).pop(user.get_username(), None)
+        self.disabled_users.pop(user.get_username(), None)
+        self.statistics.remove_user(user)
+
+    def add_user(self, user):
+        """Adds a user to the registry, role partitions and search index (does not save to file)."""
+        self.users[user.get_username()] = user
+        self._add_to_partitions(user)
+        self.user_index.add(user.get_username(), self._get_search_terms(user))
+        if user.get_role() == "MHWP":
+            self.allocator.update(user)
+
+    def remove_user(self, username):
+        """Removes a user from the registry, role partitions and search index (does not save to file).
+
+        Returns:
+            User: The removed user, or None if no such user exists.
+        """
+        user = self.users.pop(username, None)
+        if user:
+            self._remove_from_partitions(user)
+            self._untrack_orphaned_appointments(user)
+            self.user_index.remove(username)
+            if user.get_role() == "MHWP":
+                self.allocator.remove(username)
+            elif user.get_role() == "Patient":
+                mhwp = self.get_mhwps().get(user.get_assigned_mhwp())
+                if mhwp:
+                    mhwp.remove_patient(username)
+                    self.allocator.update(mhwp)
+        return user
+
+    def _untrack_orphaned_appointments(self, removed_user):
+        """Stops counting the removed user's appointments that no remaining user holds."""
+        if removed_user.get_role() == "Admin":
+            return
+        held_ids = {}
+        for appointment in removed_user.get_appointments():
+            other_username = (
+                appointment.mhwp_username
+                if removed_user.get_role() == "Patient"
+                else appointment.patient_username
+            )
+            if other_username not in held_ids:
+                other_user = self.users.get(other_username)
+                held_ids[other_username] = (
+                    {app.get_id() for app in other_user.get_appointments()} if other_user else set()
+                )
+            if appointment.get_id() not in held_ids[other_username]:
+                self.statistics.untrack_appointment(appointment)
+
+    def set_user_disabled(self, user, is_disabled):
+        """Disables or enables a user's account, keeping the disabled partition in sync."""
+        self.statistics.remove_user(user)
+        user.set_is_disabled(is_disabled)
+        self.statistics.add_user(user)
+        if is_disabled:
+            self.disabled_users[user.get_username()] = user
+        else:
+            self.disabled_users.pop(user.get_username(), None)
+        if user.get_role() == "MHWP":
+            self.allocator.update(user)
+
+    def get_users_by_role(self, role):
+        """Returns a dict of username -> user for one role ("Patient", "MHWP" or "Admin")."""
+        return self.users_by_role.get(role, {})
+
+    def get_patients(self):
+        return self.get_users_by_role("Patient")
+
+    def get_mhwps(self):
+        return self.get_users_by_role("MHWP")
+
+    def get_admins(self):
+        return self.get_users_by_role("Admin")
+
+    def get_disabled_users(self):
+        return self.disabled_users
+
+    def reindex_user(self, user):
+        """Refreshes a user's search terms after their name or email has changed."""
+        self.user_index.add(user.get_username(), self._get_search_terms(user))
+
+    def search_users(self, query, roles=None, page=1, page_size=10):
+        """Finds users whose username, name or email starts with the query.
+
+        An empty query pages through all users. Results are produced lazily, so a page
+        costs O(page) rather than O(all users).
+
+        Args:
+            query (str): The (partial) username, name or email.
+            roles (list of str, optional): Only return users with these roles.
+            page (int, optional): 1-based page number. Defaults to 1.
+            page_size (int, optional): Number of users per page. Defaults to 10.
+
+        Returns:
+            tuple: (list of users on the page, bool whether there is a next page)
+        """
+        if query.strip():
+            candidates = (self.users[key] for key in self.user_index.iter_prefix(query))
+            if roles:
+                candidates = (user for user in candidates if user.get_role() in roles)
+        elif roles:
+            candidates = chain.from_iterable(
+                self.get_users_by_role(role).values() for role in roles
+            )
+        else:
+            candidates = iter(self.users.values())
+
+        start = (page - 1) * page_size
+        users = list(islice(candidates, start, start + page_size + 1))
+        return users[:page_size], len(users) > page_size
+
+    def suggest_users(self, query, roles=None, limit=10):
+        """Returns users whose username, name or email closely resembles a misspelt query."""
+        users = [self.users[key] for key in self.user_index.fuzzy_search(query, limit * 2)]
+        if roles:
+            users = [user for user in users if user.get_role() in roles]
+        return users[:limit]
+
     def get_user_by_username(self, username):
         return self.users.get(username, None)
 
@@ -1,12 +1,10 @@
 import os
 import re
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 
 from breeze.models.appointment_entry import AppointmentEntry
 from breeze.services.auth_service import AuthService
 from breeze.utils.cli_utils import print_system_message
+from breeze.utils.instrumentation import increment, timer
 
 
 # from dotenv import load_dotenv
@@ -186,15 +184,21 @@ class EmailService:
                     "Missing email configuration in environment variables."
                 )
 
+            # The mail modules are slow to import, so they are only loaded to send an email
+            import smtplib
+            from email.mime.multipart import MIMEMultipart
+            from email.mime.text import MIMEText
+
             msg = MIMEMultipart()
             msg["From"] = sender_email
             msg["To"] = receiver_email
             msg["Subject"] = subject
             msg.attach(MIMEText(body, "plain"))
 
-            with smtplib.SMTP_SSL(smtp_host, smtp_port) as server:
+            with timer("email.send"), smtplib.SMTP_SSL(smtp_host, smtp_port) as server:
                 server.login(sender_email, sender_password)
                 server.sendmail(sender_email, receiver_email, msg.as_string())
+            increment("emails_sent")
 
             print_system_message(
                 f"The email was successfully sent to the {receiver_role} at {receiver_email}."
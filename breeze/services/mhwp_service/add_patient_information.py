@@ -1,5 +1,4 @@
 from datetime import datetime
-from breeze.models.patient import Patient
 from breeze.utils.cli_utils import (
     clear_screen,
     direct_to_dashboard,
@@ -99,15 +98,8 @@ def add_patient_information(user, auth_service):
         print(MHWP_BANNER_STRING)
         print(f"Hi {user.get_username()}! Let's add patient information.")
 
-        all_users = auth_service.get_all_users()
-
         # Patients assigned to the MHWP
-        assigned_patients = [
-            patient
-            for patient in all_users.values()
-            if isinstance(patient, Patient)
-            and patient.get_assigned_mhwp() == user.get_username()
-        ]
+        assigned_patients = auth_service.get_assigned_patients(user)
 
         if not assigned_patients:
             print_system_message("No patients are currently assigned to you.")
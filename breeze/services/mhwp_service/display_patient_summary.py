@@ -1,5 +1,3 @@
-from datetime import datetime
-from breeze.models.patient import Patient
 from breeze.utils.cli_utils import (
     check_exit,
     check_previous,
@@ -10,6 +8,9 @@ from breeze.utils.cli_utils import (
 from breeze.utils.constants import MHWP_BANNER_STRING
 from breeze.utils.mood_chart_utils import plot_mood_chart
 
+MOOD_CHART_COLUMNS = 14
+MOOD_CHART_GRANULARITIES = {"d": "day", "w": "week", "m": "month"}
+
 
 def display_patient_summary(user, auth_service):
     """
@@ -25,36 +26,29 @@ def display_patient_summary(user, auth_service):
     def show_assigned_patients_table(patients):
         """Displays a table of assigned patients."""
         print("\nAssigned Patients:")
-        print("-" * 125)
+        print("-" * 164)
         print(
-            f"| {'Username':<15} | {'First Name':<15} | {'Last Name':<15} | {'Gender':<10} | {'DOB':<13} | {'Condition':<20} | {'Medication':<15} |"
+            f"| {'Username':<15} | {'First Name':<15} | {'Last Name':<15} | {'Gender':<10} | {'DOB':<13} | {'Condition':<20} | {'Medication':<15} | {'Last Mood':<10} | {'Next Appointment':<16} |"
         )
-        print("-" * 125)
+        print("-" * 164)
         for patient in patients:
-            # Get the most recent condition and prescription if there are multiple ones
-            conditions = patient.get_conditions()
-            if conditions:
-                recent_condition = max(
-                    conditions.items(),
-                    key=lambda item: max(entry["timestamp"] for entry in item[1]),
-                )
-                condition_name = recent_condition[0]
-                if len(condition_name) > 20:
-                    condition_name = condition_name[:16] + '...'
-            else:
-                condition_name = "N/A"
-
-            prescriptions = patient.to_dict()["prescriptions"]
-            if prescriptions:
-                recent_prescription = max(
-                    prescriptions,
-                    key=lambda p: datetime.strptime(p["start_date"], "%d-%m-%Y"),
-                )
-                medication_name = recent_prescription["medication"]
-                if len(medication_name) > 15:
-                    medication_name = medication_name[:12] + '...'
-            else:
-                medication_name = "N/A"
+            # The most recent condition and prescription etc. are kept up to date by the patient
+            summary = patient.get_summary()
+            condition_name = summary["condition"] or "N/A"
+            if len(condition_name) > 20:
+                condition_name = condition_name[:16] + '...'
+
+            medication_name = summary["medication"] or "N/A"
+            if len(medication_name) > 15:
+                medication_name = medication_name[:12] + '...'
+
+            last_mood = summary["last_mood"]["mood"] if summary["last_mood"] else "N/A"
+            next_appointment = summary["next_appointment"]
+            next_appointment = (
+                f"{next_appointment.get_date().strftime('%d-%m-%Y')} {next_appointment.get_time().strftime('%H:%M')}"
+                if next_appointment
+                else "N/A"
+            )
 
             print(
                 f"| {patient.get_username():<15} | "
@@ -62,10 +56,12 @@ def display_patient_summary(user, auth_service):
                 f"{patient.get_last_name() or 'N/A':<15} | "
                 f"{patient.get_gender() or 'N/A':<10} | "
                 f"{patient.get_date_of_birth() or 'N/A':<13} | "
-                f"{condition_name or 'N/A':<20} | "
-                f"{medication_name or 'N/A':<15} |"
+                f"{condition_name:<20} | "
+                f"{medication_name:<15} | "
+                f"{last_mood:<10} | "
+                f"{next_appointment:<16} |"
             )
-        print("-" * 125)
+        print("-" * 164)
 
     def show_patient_details(patient):
         """Displays detailed information for a selected patient."""
@@ -100,7 +96,7 @@ def display_patient_summary(user, auth_service):
             print("  No appointment history available.")
 
         print("\nPrescription Details:")
-        prescriptions = patient.to_dict().get("prescriptions", [])
+        prescriptions = patient.get_prescriptions()
         if prescriptions:
             for prescription in prescriptions:
                 print(f"  - Medication: {prescription['medication']}")
@@ -112,13 +108,23 @@ def display_patient_summary(user, auth_service):
         else:
             print("  No prescriptions available.")
 
-        mood_entries = patient.get_mood_entries()
-        if mood_entries:
-            plot_mood_chart(mood_entries)
+        mood_aggregates = patient.get_mood_aggregates()
+        if mood_aggregates:
+            plot_mood_chart(mood_aggregates, max_columns=MOOD_CHART_COLUMNS)
         else:
             print("  No mood records available.")
 
-        navigation = input("\nEnter [R] to return to the patient summary.\n >")
+        while True:
+            if mood_aggregates:
+                navigation = input(
+                    "\nEnter [D], [W] or [M] to see daily, weekly or monthly moods, or [R] to return to the patient summary.\n >"
+                )
+            else:
+                navigation = input("\nEnter [R] to return to the patient summary.\n >")
+            granularity = MOOD_CHART_GRANULARITIES.get(navigation.strip().lower())
+            if not (mood_aggregates and granularity):
+                break
+            plot_mood_chart(mood_aggregates, granularity, max_columns=MOOD_CHART_COLUMNS)
 
         if check_previous(navigation):
             clear_screen_and_show_banner(MHWP_BANNER_STRING)
@@ -127,13 +133,7 @@ def display_patient_summary(user, auth_service):
     # Main Summary Logic
     clear_screen_and_show_banner(MHWP_BANNER_STRING)
 
-    all_users = auth_service.get_all_users()
-    assigned_patients = [
-        patient
-        for patient in all_users.values()
-        if isinstance(patient, Patient)
-        and patient.get_assigned_mhwp() == user.get_username()
-    ]
+    assigned_patients = auth_service.get_assigned_patients(user)
 
     if not assigned_patients:
         print_system_message("No patients are currently assigned to you.")
@@ -46,5 +46,6 @@ def edit_personal_information(user, auth_service):
         print(update_message)
         print_system_message(f"First name: {user.get_first_name()}\nLast name: {user.get_last_name()}\nemail: {user.get_email()}")
 
+        auth_service.reindex_user(user)
         auth_service.save_data_to_file()
         direct_to_dashboard()
\ No newline at end of file
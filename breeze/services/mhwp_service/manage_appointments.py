@@ -1,4 +1,3 @@
-import time
 from breeze.utils.appointment_utils import (
     cancel_appointments_with_inactive_accounts,
     handle_appointment_action,
@@ -10,6 +9,7 @@ from breeze.utils.cli_utils import (
     print_system_message,
 )
 from breeze.utils.constants import MHWP_BANNER_STRING
+from breeze.utils.pacing import pause
 
 
 def manage_appointments(user, auth_service):
@@ -54,7 +54,7 @@ def manage_appointments(user, auth_service):
                 else:
                     print_system_message(str(ve))
 
-                time.sleep(1)
+                pause(1)
                 continue
 
     while True:
@@ -70,7 +70,7 @@ def manage_appointments(user, auth_service):
         )
 
         if not upcoming_appointments:
-            time.sleep(1)
+            pause(1)
             break
 
         print("\nChoose one of the following options:")
@@ -87,4 +87,4 @@ def manage_appointments(user, auth_service):
             handle_action(upcoming_appointments, "confirm", "Confirm")
         else:
             print_system_message("Please enter a valid option.")
-            time.sleep(0.5)
+            pause(0.5)
@@ -4,6 +4,7 @@ from breeze.services.mhwp_service.edit_personal_information import edit_personal
 from breeze.services.mhwp_service.manage_appointments import manage_appointments
 from breeze.services.mhwp_service.show_mhwp_dashboard import show_mhwp_dashboard
 from breeze.services.mhwp_service.view_calendar import view_calendar
+from breeze.services.mhwp_service.view_mood_trends import view_mood_trends
 
 
 class MHWPService:
@@ -25,5 +26,8 @@ class MHWPService:
     def display_patient_summary(self, user):
         display_patient_summary(user, self.auth_service)
     
+    def view_mood_trends(self, user):
+        view_mood_trends(user, self.auth_service)
+
     def edit_personal_information(self, user):
         edit_personal_information(user, self.auth_service)
@@ -19,12 +19,13 @@ def show_mhwp_dashboard(user, mhwp_service):
         print("[M] Manage Appointments (Confirm or Cancel)")
         print("[A] Add Patient Information (Condition, Notes)")
         print("[D] Display Patient Summary with Mood Chart")
+        print("[T] View Mood Trends Across My Patients")
         print("[E] Edit Personal Information")
         print("[X] Log out")
 
         user_input = input("> ").strip().lower()
 
-        if user_input in ["c", "m", "a", "d", "e", "x"]:
+        if user_input in ["c", "m", "a", "d", "t", "e", "x"]:
             match user_input:
                 case "c":
                     mhwp_service.view_calendar(user)
@@ -34,6 +35,8 @@ def show_mhwp_dashboard(user, mhwp_service):
                     mhwp_service.add_patient_information(user)
                 case "d":
                     mhwp_service.display_patient_summary(user)
+                case "t":
+                    mhwp_service.view_mood_trends(user)
                 case "e":
                     mhwp_service.edit_personal_information(user)
                 case "x":
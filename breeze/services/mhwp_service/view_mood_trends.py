@@ -0,0 +1,24 @@
+from breeze.services.mood_analytics_service import MoodAnalytics
+from breeze.utils.cli_utils import clear_screen_and_show_banner, direct_to_dashboard, print_system_message
+from breeze.utils.constants import MHWP_BANNER_STRING
+from breeze.utils.mood_chart_utils import print_mood_trends
+
+
+def view_mood_trends(user, auth_service):
+    """
+    Displays mood trends across all patients assigned to the MHWP.
+
+    Args:
+        user: The MHWP user.
+        auth_service: The authentication service instance.
+    """
+    clear_screen_and_show_banner(MHWP_BANNER_STRING)
+    print_system_message("Caseload Mood Trends")
+
+    assigned_patients = auth_service.get_assigned_patients(user)
+    if not assigned_patients:
+        print_system_message("No patients are currently assigned to you.")
+    else:
+        print_mood_trends(MoodAnalytics.from_patients(assigned_patients))
+
+    direct_to_dashboard()
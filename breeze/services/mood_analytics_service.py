@@ -0,0 +1,153 @@
+import datetime
+
+from breeze.utils.mood_aggregates import MOOD_LEVELS
+
+
+class MoodAnalytics:
+    """Mood statistics across many patients, e.g. an MHWP's caseload or every patient.
+
+    The statistics are read from each patient's MoodAggregates, which are kept up to date
+    as moods are added and removed. Nothing is copied or re-parsed when a view is built,
+    and a date window only touches the daily buckets inside it.
+    """
+
+    def __init__(self):
+        self.usernames = []
+        self.aggregates = []
+
+    @classmethod
+    def from_patients(cls, patients):
+        analytics = cls()
+        for patient in patients:
+            analytics.add_patient(patient)
+        return analytics
+
+    def add_patient(self, patient):
+        self.add(patient.get_username(), patient.get_mood_aggregates())
+
+    def add(self, username, aggregates):
+        """Adds a patient's mood aggregates (MoodAggregates) under their username."""
+        self.usernames.append(username)
+        self.aggregates.append(aggregates)
+
+    def __len__(self):
+        return sum(len(aggregates) for aggregates in self.aggregates)
+
+    def __iter_day_buckets(self, start_date, end_date):
+        for aggregates in self.aggregates:
+            yield from aggregates.get_buckets("day", start_date, end_date)
+
+    def get_distribution(self, start_date=None, end_date=None):
+        """Counts mood points per level, optionally within a date window.
+
+        Returns:
+            dict: Mood level name -> number of mood points, from "Very Sad" to "Very Happy".
+        """
+        if start_date is None and end_date is None:
+            # monthly buckets hold the same counts in far fewer buckets
+            buckets = (
+                bucket for aggregates in self.aggregates for bucket in aggregates.get_buckets("month")
+            )
+        else:
+            buckets = self.__iter_day_buckets(start_date, end_date)
+
+        totals = [0] * len(MOOD_LEVELS)
+        for _, counts in buckets:
+            for index, count in enumerate(counts):
+                totals[index] += count
+        return {name: totals[level - 1] for name, level in MOOD_LEVELS.items()}
+
+    def get_rolling_average(self, window_days=7, start_date=None, end_date=None):
+        """Computes the average mood of all patients over a trailing window for each day.
+
+        Args:
+            window_days (int, optional): Number of days in the trailing window. Defaults to 7.
+            start_date (datetime.date, optional): First day to report. Defaults to the first mood.
+            end_date (datetime.date, optional): Last day to report. Defaults to the last mood.
+
+        Returns:
+            list of tuple: (date, average mood level) for each day with moods in its window.
+        """
+        date_ranges = [aggregates.get_date_range() for aggregates in self.aggregates]
+        date_ranges = [date_range for date_range in date_ranges if date_range]
+        if not date_ranges:
+            return []
+        first_day = start_date or min(first for first, _ in date_ranges)
+        last_day = end_date or max(last for _, last in date_ranges)
+        if last_day < first_day:
+            return []
+
+        # Daily totals over the reported range plus the lead-in of the first window
+        lead_in_start = first_day - datetime.timedelta(days=window_days - 1)
+        offset = lead_in_start.toordinal()
+        span = last_day.toordinal() - offset + 1
+        sums = [0] * span
+        counts = [0] * span
+        for date, level_counts in self.__iter_day_buckets(lead_in_start, last_day):
+            index = date.toordinal() - offset
+            sums[index] += sum(level * count for level, count in enumerate(level_counts, 1))
+            counts[index] += sum(level_counts)
+
+        averages = []
+        window_sum = 0
+        window_count = 0
+        for index in range(span):
+            window_sum += sums[index]
+            window_count += counts[index]
+            if index >= window_days:
+                window_sum -= sums[index - window_days]
+                window_count -= counts[index - window_days]
+            if index >= window_days - 1 and window_count:
+                averages.append(
+                    (datetime.date.fromordinal(index + offset), window_sum / window_count)
+                )
+        return averages
+
+    def get_latest_averages(self, start_date=None, end_date=None):
+        """Returns each patient's average mood on their latest day with moods in a window.
+
+        Returns:
+            dict: username -> average mood level. Patients without moods in the window are left out.
+        """
+        latest = {}
+        for username, aggregates in zip(self.usernames, self.aggregates):
+            buckets = aggregates.get_buckets("day", start_date, end_date, last=1)
+            if buckets:
+                counts = buckets[0][1]
+                latest[username] = sum(
+                    level * count for level, count in enumerate(counts, 1)
+                ) / sum(counts)
+        return latest
+
+    def get_declining_patients(self, recent_days=14, baseline_days=28, min_drop=1.0, today=None):
+        """Finds patients whose recent average mood dropped compared to the period before.
+
+        Args:
+            recent_days (int, optional): Length of the recent period, ending today. Defaults to 14.
+            baseline_days (int, optional): Length of the period before it. Defaults to 28.
+            min_drop (float, optional): Smallest drop in average level to report. Defaults to 1.0.
+            today (datetime.date, optional): Last day of the recent period. Defaults to today.
+
+        Returns:
+            list of tuple: (username, baseline average, recent average), largest drop first.
+        """
+        today = today or datetime.date.today()
+        recent_start = today - datetime.timedelta(days=recent_days - 1)
+        baseline_start = recent_start - datetime.timedelta(days=baseline_days)
+
+        declining = []
+        for username, aggregates in zip(self.usernames, self.aggregates):
+            # [sum, count] of the baseline and recent periods
+            periods = {False: [0, 0], True: [0, 0]}
+            for date, counts in aggregates.get_buckets("day", baseline_start, today):
+                period = periods[date >= recent_start]
+                period[0] += sum(level * count for level, count in enumerate(counts, 1))
+                period[1] += sum(counts)
+            (baseline_sum, baseline_count), (recent_sum, recent_count) = periods[False], periods[True]
+            if recent_count and baseline_count:
+                baseline = baseline_sum / baseline_count
+                recent = recent_sum / recent_count
+                if baseline - recent >= min_drop:
+                    declining.append((username, baseline, recent))
+        declining.sort(key=lambda item: item[2] - item[1])
+        return declining
@@ -1,4 +1,3 @@
-import time
 from breeze.models.appointment_entry import AppointmentEntry
 from breeze.services.email_service import EmailService
 from breeze.utils.ansi_utils import colorise
@@ -18,6 +17,7 @@ from breeze.utils.cli_utils import (
     print_system_message,
 )
 from breeze.utils.constants import PATIENT_BANNER_STRING
+from breeze.utils.pacing import pause
 
 
 def manage_appointment(user, auth_service):
@@ -28,6 +28,7 @@ def manage_appointment(user, auth_service):
     def handle_confirm_appointment(user, selected_mhwp, requested_app):
         user.add_appointment(requested_app)
         selected_mhwp.add_appointment(requested_app)
+        auth_service.statistics.track_appointment(requested_app)
         print("Appointment confirmed and added.")
 
     while True:
@@ -75,14 +76,14 @@ def manage_appointment(user, auth_service):
                     print_system_message(
                         f"Your assigned MHWP (username: {assigned_mhwp_object.get_username()}) has been disabled, and you can no longer book with them.\n\nPlease contact the admin for assistance."
                     )
-                    time.sleep(5)
+                    pause(5)
                     break
 
                 if not assigned_mhwp_object:
                     print_system_message(
                         "You have no assigned MHWP at this moment, contact the admin for more info."
                     )
-                    time.sleep(1)
+                    pause(1)
                     break
 
                 if assigned_mhwp_object:
@@ -115,7 +116,7 @@ def manage_appointment(user, auth_service):
                             print_system_message(
                                 "This time slot must be booked at least 2 hours in advance for today's appointments. Please choose another slot."
                             )
-                            time.sleep(1)
+                            pause(1)
                             continue
 
                         if (
@@ -125,7 +126,7 @@ def manage_appointment(user, auth_service):
                             print_system_message(
                                 "This slot has already been requested or confirmed. Please select a different one"
                             )
-                            time.sleep(1)
+                            pause(1)
                             continue
 
                         if (
@@ -135,7 +136,7 @@ def manage_appointment(user, auth_service):
                             print_system_message(
                                 "You have another appointment at the same time. Please select a different one"
                             )
-                            time.sleep(1)
+                            pause(1)
                             continue
 
                         requested_app = AppointmentEntry(
@@ -157,7 +158,7 @@ def manage_appointment(user, auth_service):
                         )
 
                         if not is_confirmed_choice:
-                            time.sleep(1)
+                            pause(1)
                             continue
 
                         auth_service.save_data_to_file()
@@ -165,13 +166,13 @@ def manage_appointment(user, auth_service):
 
                         email_service = EmailService(requested_app, auth_service)
                         email_service.send_to_one("mhwp", "request")
-                        time.sleep(3)
+                        pause(3)
 
                         break
 
                     else:
                         print_system_message("Invalid slot, please try again!")
-                        time.sleep(1)
+                        pause(1)
 
         elif user_choice == "c":
             while True:
@@ -184,7 +185,7 @@ def manage_appointment(user, auth_service):
                 upcoming_appointments = show_upcoming_appointments(user, auth_service)
 
                 if not upcoming_appointments:
-                    time.sleep(1)
+                    pause(1)
                     break
 
                 print(
@@ -209,8 +210,8 @@ def manage_appointment(user, auth_service):
                     else:
                         print_system_message(str(ve))
 
-                    time.sleep(1)
+                    pause(1)
                     continue
         else:
             print_system_message("Please enter a valid option.")
-            time.sleep(1)
+            pause(1)
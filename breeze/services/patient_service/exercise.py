@@ -1,7 +1,7 @@
-import time
 from breeze.utils.ansi_utils import colorise
 from breeze.utils.cli_utils import check_exit, clear_screen, print_system_message, direct_to_dashboard
 from breeze.utils.constants import PATIENT_BANNER_STRING
+from breeze.utils.pacing import pause
 
 def display_exercise_dashboard(valid_keywords):
     clear_screen()
@@ -37,9 +37,9 @@ def search_exercise():
                 f"Here is your selected meditation for '{valid_keywords[choice]['name']}':"
             )
             print_system_message(colorise(text=search_url, color=63, underline=True))
-            time.sleep(1)
+            pause(1)
             direct_to_dashboard()
         else:
             print_system_message("Invalid choice. Please select a valid option.")
-            time.sleep(1)
+            pause(1)
             
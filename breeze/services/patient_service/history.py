@@ -1,41 +1,47 @@
 import json
-import time
 import datetime as dt
-from math import ceil
 
-from breeze.utils.data_utils import create_journal_entries_from_data, create_mood_entries_from_data
-from breeze.utils.cli_utils import clear_screen, print_system_message, print_user_appointments, print_journals, print_moods, check_exit
+from breeze.services.archive_service import HistoryArchive, get_archive_dir
+from breeze.services.patient_service.mood import mood_chart
+from breeze.utils.entry_cache import get_journal_cache, get_mood_cache
+from breeze.utils.history_query import (
+    HistoryQuery,
+    get_appointment_query_engine,
+    get_journal_query_engine,
+    get_mood_query_engine,
+)
+from breeze.utils.paging import ReversePagedView
+from breeze.utils.cli_utils import clear_screen, print_system_message, print_user_appointments, print_journals, print_moods, check_exit, table_creator
 from breeze.utils.constants import PATIENT_BANNER_STRING
+from breeze.utils.pacing import pause
+from breeze.utils.screen import PagedScreen
 
 def edit_journal_database(user, journal_data, edit_delete, page_no, auth_service):
+    """Edits or deletes the journal entry the user picks from the current page.
+
+    Returns:
+        bool: True if the journal entries were changed, otherwise False.
+    """
     try:                      
         journal_ind = input("> ").strip().lower()
         index = int(journal_ind)
-        if not 0 < index <= 10:
-            print_system_message('Invalid index. Please choose from available.')
-            time.sleep(2)
-            return journal_data
-        entry = -(index + (page_no - 1) * 10)
         try:
-            journal_id = journal_data[entry].get_id()
-            if edit_delete == 'a':
-                journal_data = edit_journal_data(user, journal_data, journal_id, entry, auth_service)
-            else:
-                journal_data = delete_journal_entry(user, journal_id, auth_service)
+            journal = journal_data.get(page_no, index)
         except IndexError:
             print_system_message('Invalid index. Please choose from available.')
-            time.sleep(2)
-            return journal_data
-        return journal_data
+            pause(2)
+            return False
+        if edit_delete == 'a':
+            return edit_journal_data(user, journal, auth_service)
+        return delete_journal_entry(user, journal.get_id(), auth_service)
     except ValueError:
         if journal_ind == "x":
-            return journal_data
+            return False
         print_system_message("An error occurred - invalid input.")
-        time.sleep(1)
-        return journal_data
+        pause(1)
+        return False
 
-def edit_journal_data(user, journal_data, journal_id, entry, auth_service):
-    journal = journal_data[entry]
+def edit_journal_data(user, journal, auth_service):
     entry = journal.entry
     while True:
         clear_screen()
@@ -46,18 +52,16 @@ def edit_journal_data(user, journal_data, journal_id, entry, auth_service):
         print('Continue writing to append to your journal entry, enter [S] to save, or [X] to leave without saving:')
         addition = input("> ")
         if check_exit(addition):
-            return journal_data
+            return False
         if addition.lower() == "s":
             journal.set_entry(entry)    
-            for journal_ent in user.get_journal_entries():
-                if journal_ent['id'] == journal_id:
-                    journal_ent['text'] = entry
-                    journal_ent['last_update'] = dt.datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+            user.edit_journal_entry(
+                journal.get_id(), entry, dt.datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+            )
             auth_service.save_data_to_file()
             print('Entry edited successfully.')
-            data = create_journal_entries_from_data(user.get_journal_entries())
-            time.sleep(2)
-            return data
+            pause(2)
+            return True
         else:
             entry = entry + "\n" + addition
 
@@ -65,44 +69,75 @@ def delete_journal_entry(user, journal_id, auth_service):
     user.delete_journal_entry(journal_id)
     auth_service.save_data_to_file()
     print('Entry deleted successfully.')
-    data = create_journal_entries_from_data(user.get_journal_entries())
-    time.sleep(2)
-    return data
+    pause(2)
+    return True
 
 def delete_mood_entry(user, mood_id, auth_service):
     user.delete_mood_entry(mood_id)
     auth_service.save_data_to_file()
     print('Entry deleted successfully.')
-    data = create_mood_entries_from_data(user.get_mood_entries())
-    time.sleep(1)
-    return data
+    pause(1)
+    return True
+
 
+def prompt_search_filter(query):
+    """Asks for a search term and returns the query narrowed to it, or None if left blank."""
+    print("Type a term to search by, or quit by leaving the entry blank:")
+    search_filter = input("> ").strip().lower()
+    if not search_filter:
+        return None
+    return query.with_filter(text=search_filter)
 
-def filter_journal_results(data, search_term):
-    filtered_list = []
-    for journal in data:
-        if search_term in journal.title.lower() or search_term in journal.entry.lower():
-            filtered_list.append(journal)
-    return filtered_list
+def prompt_filter_date(prompt):
+    while True:
+        print(prompt)
+        date_input = input("> ").strip()
+        if not date_input:
+            return None
+        try:
+            return dt.datetime.strptime(date_input, "%d-%m-%Y").date()
+        except ValueError:
+            print_system_message("Date is incorrectly formulated! Please use DD-MM-YYYY.")
 
-def filter_mood_results(data, search_term):
-    filtered_list = []
-    for mood in data:
-        if search_term in mood.mood.lower() or search_term in mood.comment.lower():
-            filtered_list.append(mood)
-    return filtered_list
+def prompt_date_filter(query):
+    """Asks for a date range and returns the query narrowed to it, or None if left blank."""
+    start_date = prompt_filter_date("Enter the first date to include (DD-MM-YYYY), or leave blank for no start date:")
+    end_date = prompt_filter_date("Enter the last date to include (DD-MM-YYYY), or leave blank for no end date:")
+    if not start_date and not end_date:
+        return None
+    if start_date and end_date and start_date > end_date:
+        print_system_message("The first date must not be after the last date.")
+        pause(2)
+        return None
+    return query.with_filter(start_date=start_date, end_date=end_date)
+
+def prompt_mood_filter(query):
+    """Asks for a mood colour and returns the query narrowed to it, or None if left blank."""
+    for key, mood in mood_chart.items():
+        print(f"[{key}] {mood['name'].ljust(12)} - {mood['description']}")
+    print("Enter the colour code of the mood to filter by, or quit by leaving the entry blank:")
+    while True:
+        mood_input = input("> ").strip().upper()
+        if not mood_input:
+            return None
+        if mood_input in mood_chart:
+            return query.with_filter(mood=mood_chart[mood_input]["description"])
+        print_system_message("Invalid colour code. Please choose from the options provided.")
+
+def prompt_mhwp_filter(query):
+    """Asks for an MHWP username and returns the query narrowed to it, or None if left blank."""
+    print("Type the username of the MHWP to filter by, or quit by leaving the entry blank:")
+    mhwp_filter = input("> ").strip().lower()
+    if not mhwp_filter:
+        return None
+    return query.with_filter(mhwp=mhwp_filter)
 
 def view_entry(data, page_no):
     try:
         journal_ind = input("> ").strip().lower()
         index = int(journal_ind)
-        if not 0 < index <= 10:
-            print_system_message('Invalid index. Please choose from available.')
-            time.sleep(2)
-            return
-        entry = -(index + (page_no - 1) * 10)
         try:
-            viewed = data[entry]        
+            viewed = data.get(page_no, index)
             while True:
                 clear_screen()
                 print(PATIENT_BANNER_STRING)
@@ -111,25 +146,20 @@ def view_entry(data, page_no):
                 return True
         except IndexError:
             print_system_message('Invalid index. Please choose from available.')
-            time.sleep(2)
+            pause(2)
     except ValueError:
         if journal_ind == "x":
             return
         print_system_message("An error occurred - invalid input.")
-        time.sleep(1)
+        pause(1)
         return
 
 def view_mood(data, page_no):
     try:
         ind = input("> ").strip().lower()
         index = int(ind)
-        if not 0 < index <= 10:
-            print_system_message('Invalid index. Please choose from available.')
-            time.sleep(2)
-            return
-        entry = -(index + (page_no - 1) * 10)
         try:
-            viewed = data[entry]        
+            viewed = data.get(page_no, index)
             while True:
                 clear_screen()
                 print(PATIENT_BANNER_STRING)
@@ -137,12 +167,12 @@ def view_mood(data, page_no):
                 return True
         except IndexError:
             print_system_message('Invalid index. Please choose from available.')
-            time.sleep(2)
+            pause(2)
     except ValueError:
         if ind == "x":
             return
         print_system_message("An error occurred - invalid input.")
-        time.sleep(2)
+        pause(2)
         return
 
 
@@ -150,13 +180,8 @@ def view_appt_summary(data, page_no):
     try:
         ind = input("> ").strip().lower()
         index = int(ind)
-        if not 0 < index <= 10:
-            print_system_message('Invalid index. Please choose from available.')
-            time.sleep(2)
-            return
-        entry = -(index + (page_no - 1) * 10)
         try:
-            viewed = data[entry]        
+            viewed = data.get(page_no, index)
             while True:
                 clear_screen()
                 print(PATIENT_BANNER_STRING)
@@ -165,80 +190,82 @@ def view_appt_summary(data, page_no):
                 return True
         except IndexError:
             print_system_message('Invalid index. Please choose from available.')
-            time.sleep(2)
+            pause(2)
     except ValueError:
         if ind == "x":
             return
         print_system_message("An error occurred - invalid input.")
-        time.sleep(2)
+        pause(2)
         return
 
 def show_journal_history(user, auth_service):
     # show the users journal entry in table format
     page_no = 1
-    filtered = False
+    query = previous_query = HistoryQuery()
+    engine = get_journal_query_engine(user)
+    journal_cache = get_journal_cache(user)
+    screen = PagedScreen()
     while True: 
-        clear_screen()
-        print(PATIENT_BANNER_STRING)
-        if filtered:
-            journal_data = filter_journal_results(journal_data, search_filter)
-            if not journal_data:
-                print(f'There are no results with the search term {search_filter}. Returning...')
-                time.sleep(3)
-                filtered = False
-                continue
-        else:
-            journal_dicts = user.get_journal_entries()
+        # query results are cached until the journal changes, and only entries on the page are decoded
+        journal_data = ReversePagedView(engine.run(query), decode=journal_cache.decode)
+        if not journal_data and not query.is_empty():
+            clear_screen()
+            print(PATIENT_BANNER_STRING)
+            print(f'There are no results for {query.describe()}. Returning...')
+            pause(3)
+            query, previous_query = previous_query, HistoryQuery()
+            page_no = 1
+            continue
         
-        if not journal_dicts:
+        if not journal_data:
+            clear_screen()
+            print(PATIENT_BANNER_STRING)
             print('\nYou currently have no journal entries!')
             print('Navigate to the Journaling tab on the dashboard to add your first!')
             print('Returning...')
-            time.sleep(3)
+            pause(3)
             break
-        else:
-            if not filtered:
-                journal_data = create_journal_entries_from_data(journal_dicts)
+
+        # the page is drawn as one frame, redrawing only the lines that changed since the last one
+        with screen.frame():
+            print(PATIENT_BANNER_STRING)
             if print_journals(journal_data, page_no):
-                print(f'Page [{page_no}] of [{ceil(len(journal_data)/10)}]\n')
-                print(f"Filtering by result: '{search_filter}'\n") if filtered else None
+                print(f'Page [{page_no}] of [{journal_data.get_page_count()}]\n')
+                print(f"Filtering by: {query.describe()}\n") if not query.is_empty() else None
                 print("[V] View a journal entry on this page")
                 print("[A] Add to a journal entry on this page")
                 print("[D] Delete a journal entry on this page")
             
-        valid_inputs = ["v", "a", "d", "x"]
-        
-        if not filtered:
+            valid_inputs = ["v", "a", "d", "s", "f", "o", "x"]
+
             print("[S] Search by title or text content")
-            valid_inputs.append("s")  
-        if len(journal_data) > page_no * 10:
-            print("[N] See next page")
-            valid_inputs.append("n")
-        if page_no > 1:
-            print("[P] See previous page")
-            valid_inputs.append("p")
-        if filtered:
-            print("[R] Remove filter")
-            valid_inputs.append("r")
-        print("[X] Exit")
+            print("[F] Filter by date range")
+            print("[O] Search older, archived entries")
+            if journal_data.has_next_page(page_no):
+                print("[N] See next page")
+                valid_inputs.append("n")
+            if page_no > 1:
+                print("[P] See previous page")
+                valid_inputs.append("p")
+            if not query.is_empty():
+                print("[R] Remove filters")
+                valid_inputs.append("r")
+            print("[X] Exit")
         user_input = input("> ").strip().lower()
         if check_exit(user_input):
             return
         if user_input not in valid_inputs:
             print_system_message("Invalid input. Please select from the options provided.")
-            time.sleep(1)
+            pause(1)
             continue
+        new_query = None
         match user_input:
             case "s":
-                print("Type a term to search by, or quit by leaving the entry blank:")
-                while True:
-                    search_filter = input("> ").strip().lower()
-                    if not search_filter:
-                        break
-                    else:
-                        page_no = 1
-                        filtered = True
-                        break
+                new_query = prompt_search_filter(query)
+            case "f":
+                new_query = prompt_date_filter(query)
+            case "o":
+                show_archived_history(user, auth_service, "journal")
             case "v":
                 print("Enter the index of the entry you want to view, or type [X] to exit")
                 if view_entry(journal_data, page_no):
@@ -254,13 +281,13 @@ def show_journal_history(user, auth_service):
                         return True
                     else:
                         print_system_message("Invalid choice. Please select [R] or [X].")
-                        time.sleep(1)
+                        pause(1)
             case "a":
                 print("Enter the index of the entry you want to edit, or type [X] to exit")    
-                journal_data = edit_journal_database(user, journal_data, 'a', page_no, auth_service)
+                edit_journal_database(user, journal_data, 'a', page_no, auth_service)
             case "d":
                 print("Enter the index of the entry you want to delete, or type [X] to exit")
-                journal_data = edit_journal_database(user, journal_data, 'd', page_no, auth_service)
+                edit_journal_database(user, journal_data, 'd', page_no, auth_service)
             case "n":
                 if "n" in valid_inputs:
                     page_no += 1
@@ -268,76 +295,76 @@ def show_journal_history(user, auth_service):
                 if "p" in valid_inputs:
                     page_no -= 1
             case "r":
-                filtered = False
+                query = previous_query = HistoryQuery()
+                page_no = 1
             case "x":
                 return
             case _:
                 print("An error occurred - invalid input.")
-                time.sleep(1)
+                pause(1)
                 continue
-
-def filter_appt_results(data, search_term):
-    filtered_list = []
-    for appt in data:
-        if search_term in appt.summary.lower() or search_term in appt.mhwp_username.lower():
-            filtered_list.append(appt)
-    return filtered_list
+        if new_query is not None:
+            query, previous_query = new_query, query
+            page_no = 1
     
-def show_appointment_history(user):
+def show_appointment_history(user, auth_service):
     page_no = 1
-    filtered = False
+    query = previous_query = HistoryQuery()
+    engine = get_appointment_query_engine(user)
+    screen = PagedScreen()
     while True: 
-        clear_screen()
-        print(PATIENT_BANNER_STRING)
         
-        if filtered:
-            appt_data = filter_appt_results(appt_data, search_filter)
-            if not appt_data:
-                print(f'There are no results with the search term {search_filter}. Returning...')
-                time.sleep(3)
-                filtered = False
-                continue
-        else:
-            appt_data = []
-            appts = user.get_appointments()
-            for appt in appts:
-                if appt.summary != None:
-                    appt_data.append(appt)
+        appt_data = ReversePagedView(engine.run(query))
+        if not appt_data and not query.is_empty():
+            clear_screen()
+            print(PATIENT_BANNER_STRING)
+            print(f'There are no results for {query.describe()}. Returning...')
+            pause(3)
+            query, previous_query = previous_query, HistoryQuery()
+            page_no = 1
+            continue
         if not appt_data:
+            clear_screen()
+            print(PATIENT_BANNER_STRING)
             print('\nYou currently have no appointments!')
             print('Navigate to the Appointment tab on the dashboard to schedule an appointment with your MHWP.')
             print('Returning...')
-            time.sleep(3)
+            pause(3)
             break
-        else:
-            if print_user_appointments(appt_data):
-                print(f'Page [{page_no}] of [{ceil(len(appt_data)/10)}]\n')
-                print(f"Filtering by result: '{search_filter}'\n") if filtered else None
+
+        # the page is drawn as one frame, redrawing only the lines that changed since the last one
+        with screen.frame():
+            print(PATIENT_BANNER_STRING)
+            if print_user_appointments(appt_data, page_no):
+                print(f'Page [{page_no}] of [{appt_data.get_page_count()}]\n')
+                print(f"Filtering by: {query.describe()}\n") if not query.is_empty() else None
                 print("[V] View an appointment on this page")
-        
-        valid_inputs = ["v", "x"]
 
-        if not filtered:
+            valid_inputs = ["v", "s", "f", "m", "o", "x"]
+
             print("[S] Search by MHWP, or appointment summary content")
-            valid_inputs.append("s")  
-        if len(appt_data) > page_no * 10:
-            print("[N] See next page")
-            valid_inputs.append("n")
-        if page_no > 1:
-            print("[P] See previous page")
-            valid_inputs.append("p")
-        if filtered:
-            print("[R] Remove filter")
-            valid_inputs.append("r")
-        print("[X] Exit")
+            print("[F] Filter by date range")
+            print("[M] Filter by MHWP")
+            print("[O] Search older, archived appointments")
+            if appt_data.has_next_page(page_no):
+                print("[N] See next page")
+                valid_inputs.append("n")
+            if page_no > 1:
+                print("[P] See previous page")
+                valid_inputs.append("p")
+            if not query.is_empty():
+                print("[R] Remove filters")
+                valid_inputs.append("r")
+            print("[X] Exit")
         
         user_input = input("> ").strip().lower()
         if check_exit(user_input):
             return
         if user_input not in valid_inputs:
             print_system_message("Invalid input. Please select from the options provided.")
-            time.sleep(1)
+            pause(1)
             continue
+        new_query = None
         match user_input:
             case "v":
                 print("Enter the index of the entry you want to view, or type [X] to exit")
@@ -354,17 +381,15 @@ def show_appointment_history(user):
                         return True
                     else:
                         print_system_message("Invalid choice. Please select [R] or [X].")
-                        time.sleep(1)
+                        pause(1)
             case "s":
-                print("Type a term to search by, or quit by leaving the entry blank:")
-                while True:
-                    search_filter = input("> ").strip().lower()
-                    if not search_filter:
-                        break
-                    else:
-                        page_no = 1
-                        filtered = True
-                        break
+                new_query = prompt_search_filter(query)
+            case "f":
+                new_query = prompt_date_filter(query)
+            case "m":
+                new_query = prompt_mhwp_filter(query)
+            case "o":
+                show_archived_history(user, auth_service, "appointment")
             case "n":
                 if "n" in valid_inputs:
                     page_no += 1
@@ -372,66 +397,77 @@ def show_appointment_history(user):
                 if "p" in valid_inputs:
                     page_no -= 1
             case "r":
-                filtered = False
+                query = previous_query = HistoryQuery()
+                page_no = 1
             case _:
                 print("An error occurred - invalid input.")
-                time.sleep(1)
+                pause(1)
                 continue
+        if new_query is not None:
+            query, previous_query = new_query, query
+            page_no = 1
 
 def show_mood_history(user, auth_service):
     page_no = 1
-    filtered = False
+    query = previous_query = HistoryQuery()
+    engine = get_mood_query_engine(user)
+    mood_cache = get_mood_cache(user)
+    screen = PagedScreen()
     while True: 
-        clear_screen()
-        print(PATIENT_BANNER_STRING)
 
-        if filtered:
-            mood_data = filter_mood_results(mood_data, search_filter)
-            if not mood_data:
-                print(f'There are no results with the search term {search_filter}. Returning...')
-                time.sleep(3)
-                filtered = False
-                continue
-        else:
-            mood_dicts = user.get_mood_entries()
+        # query results are cached until the moods change, and only entries on the page are decoded
+        mood_data = ReversePagedView(engine.run(query), decode=mood_cache.decode)
+        if not mood_data and not query.is_empty():
+            clear_screen()
+            print(PATIENT_BANNER_STRING)
+            print(f'There are no results for {query.describe()}. Returning...')
+            pause(3)
+            query, previous_query = previous_query, HistoryQuery()
+            page_no = 1
+            continue
         
-        if not mood_dicts:
+        if not mood_data:
+            clear_screen()
+            print(PATIENT_BANNER_STRING)
             print('\nYou currently have no mood entries!')
             print('Navigate to the Mood tab on the dashboard to add your first!')
             print('Returning...')
-            time.sleep(3)
+            pause(3)
             break
-        else:
-            if not filtered:
-                mood_data = create_mood_entries_from_data(mood_dicts)
+
+        # the page is drawn as one frame, redrawing only the lines that changed since the last one
+        with screen.frame():
+            print(PATIENT_BANNER_STRING)
             if print_moods(mood_data, page_no):
-                print(f'Page [{page_no}] of [{ceil(len(mood_data)/10)}]\n')
-                print(f"Filtering by result: '{search_filter}'\n") if filtered else None
+                print(f'Page [{page_no}] of [{mood_data.get_page_count()}]\n')
+                print(f"Filtering by: {query.describe()}\n") if not query.is_empty() else None
                 print("[V] View a mood entry on this page")
                 print("[D] Delete a mood entry on this page")
-        
-        valid_inputs = ["v", "d", "x"]
 
-        if not filtered:
+            valid_inputs = ["v", "d", "s", "f", "l", "o", "x"]
+
             print("[S] Search by title or text content")
-            valid_inputs.append("s")  
-        if len(mood_data) > page_no * 10:
-            print("[N] See next page")
-            valid_inputs.append("n")
-        if page_no > 1:
-            print("[P] See previous page")
-            valid_inputs.append("p")
-        if filtered:
-            print("[R] Remove filter")
-            valid_inputs.append("r")
-        print("[X] Exit")
+            print("[F] Filter by date range")
+            print("[L] Filter by mood level")
+            print("[O] Search older, archived entries")
+            if mood_data.has_next_page(page_no):
+                print("[N] See next page")
+                valid_inputs.append("n")
+            if page_no > 1:
+                print("[P] See previous page")
+                valid_inputs.append("p")
+            if not query.is_empty():
+                print("[R] Remove filters")
+                valid_inputs.append("r")
+            print("[X] Exit")
         user_input = input("> ").strip().lower()
         if check_exit(user_input):
             return
         if user_input not in valid_inputs:
             print_system_message("Invalid input. Please select from the options provided.")
-            time.sleep(1)
+            pause(1)
             continue
+        new_query = None
         match user_input:
             case "v":
                 print("Enter the index of the entry you want to view, or type [X] to exit")
@@ -448,39 +484,34 @@ def show_mood_history(user, auth_service):
                         return True
                     else:
                         print_system_message("Invalid choice. Please select [R] or [X].")
-                        time.sleep(1)
+                        pause(1)
             case "s":
-                print("Type a term to search by, or quit by leaving the entry blank:")
-                while True:
-                    search_filter = input("> ").strip().lower()
-                    if not search_filter:
-                        break
-                    else:
-                        page_no = 1
-                        filtered = True
-                        break
+                new_query = prompt_search_filter(query)
+            case "f":
+                new_query = prompt_date_filter(query)
+            case "l":
+                new_query = prompt_mood_filter(query)
+            case "o":
+                show_archived_history(user, auth_service, "mood")
             case "d":
                 print("Enter the index of the entry you want to delete, or type [X] to exit")
                 while True:
                     try:
                         mood_ind = input("> ").strip().lower()
                         index = int(mood_ind)
-                        if not 0 < index <= 10:
-                            print_system_message('Invalid index. Please choose from available.')
-                            continue
-                        entry = -(index + (page_no - 1) * 10)
                         try:
-                            mood_to_delete = mood_data[entry].get_mood_id()
-                            mood_data = delete_mood_entry(user, mood_to_delete, auth_service)
+                            mood_to_delete = mood_data.get(page_no, index).get_mood_id()
                         except IndexError:
                             print_system_message('Invalid index. Please choose from available.')
-                            time.sleep(2)
+                            pause(2)
+                            break
+                        delete_mood_entry(user, mood_to_delete, auth_service)
                         break
                     except ValueError:
                         if mood_ind == "x":
                             break
                         print_system_message("An error occurred - invalid input.")
-                        time.sleep(1)
+                        pause(1)
                         break
             case "n":
                 if "n" in valid_inputs:
@@ -489,13 +520,85 @@ def show_mood_history(user, auth_service):
                 if "p" in valid_inputs:
                     page_no -= 1
             case "r":
-                filtered = False
+                query = previous_query = HistoryQuery()
+                page_no = 1
             case "x":
                 return
             case _:
                 print("An error occurred - invalid input.")
-                time.sleep(1)
+                pause(1)
                 continue
+        if new_query is not None:
+            query, previous_query = new_query, query
+            page_no = 1
+
+ARCHIVED_RESULTS_SHOWN = 20
+ARCHIVED_TEXT_WIDTH = 50
+
+
+def get_archived_rows(kind, records):
+    """Returns the table headers and rows for archived journals, moods or appointments."""
+    def shorten(text):
+        text = (text or "").replace("\n", "  ")
+        return text[:ARCHIVED_TEXT_WIDTH] + "..." if len(text) > ARCHIVED_TEXT_WIDTH else text
+
+    match kind:
+        case "journal":
+            headers = ["#", "Title", "Text", "Date"]
+            fields = ["title", "text"]
+        case "mood":
+            headers = ["#", "Mood", "Comment", "Date"]
+            fields = ["mood", "comment"]
+        case _:
+            headers = ["#", "MHWP", "Appointment Summary", "Date", "Time", "Status"]
+            fields = ["mhwpUsername", "summary"]
+    rows = []
+    for index, record in enumerate(records, start=1):
+        data = record["data"]
+        row = [index] + [shorten(data.get(field)) for field in fields] + [data["date"]]
+        if kind == "appointment":
+            row += [data.get("time"), data.get("status")]
+        rows.append(row)
+    return headers, rows
+
+def show_archived_history(user, auth_service, kind):
+    """Searches the user's archived journals, moods or appointments.
+
+    Archived history is read from the compressed archive files only when asked for.
+    """
+    archive = HistoryArchive(get_archive_dir(auth_service.data_path))
+    years = archive.get_years()
+    clear_screen()
+    print(PATIENT_BANNER_STRING)
+    if not years:
+        print_system_message("There is no archived history yet.")
+        pause(2)
+        return
+
+    print(f"Older entries are archived by year (from {years[0]} to {years[-1]}).")
+    print("Type a term to search by, or leave blank to see all archived entries:")
+    text = input("> ").strip()
+    print("Enter a year to search, or leave blank to search every year:")
+    year_input = input("> ").strip()
+    search_years = None
+    if year_input:
+        if not year_input.isdigit() or int(year_input) not in years:
+            print_system_message(f"There is no archive for {year_input}.")
+            pause(2)
+            return
+        search_years = {int(year_input)}
+
+    records = archive.search(kind, user.get_username(), text, search_years)
+    clear_screen()
+    print(PATIENT_BANNER_STRING)
+    if not records:
+        print_system_message("No archived entries were found.")
+    else:
+        print(f"Found {len(records)} archived {kind} entr{'y' if len(records) == 1 else 'ies'}, newest first:")
+        table_creator(*get_archived_rows(kind, records[:ARCHIVED_RESULTS_SHOWN]))
+        if len(records) > ARCHIVED_RESULTS_SHOWN:
+            print(f"... and {len(records) - ARCHIVED_RESULTS_SHOWN} more. Search for a term or year to narrow the results.")
+    input("\nPress Enter to return to your history...")
 
 def show_history(user, auth_service):
     
@@ -514,7 +617,7 @@ def show_history(user, auth_service):
             return
         match user_input:
             case 'a':
-                if show_appointment_history(user):
+                if show_appointment_history(user, auth_service):
                     return
             case 'm':
                 if show_mood_history(user, auth_service):
@@ -524,7 +627,7 @@ def show_history(user, auth_service):
                     return
             case _:
                 print_system_message('Invalid input. Please try again.')
-                time.sleep(1)
+                pause(1)
                 continue
 
 
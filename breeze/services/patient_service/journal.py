@@ -1,5 +1,4 @@
 from datetime import datetime, time, date
-import time as tm
 from breeze.utils.cli_utils import (
     check_exit,
     clear_screen,
@@ -8,6 +7,7 @@ from breeze.utils.cli_utils import (
 )
 from breeze.utils.constants import PATIENT_BANNER_STRING
 from breeze.models.journal_entry import JournalEntry
+from breeze.utils.pacing import pause
 
 
 def print_journal_dashboard(user, title=None, body=None):
@@ -31,7 +31,7 @@ def enter_journal(user, auth_service):
             return
         if not journal_title:
             print_system_message("Your title is empty! Please try again!")
-            tm.sleep(1)
+            pause(1)
             continue
         else:
             title = journal_title
@@ -1,10 +1,10 @@
-import time
 from breeze.utils.ansi_utils import colorise
 from breeze.utils.cli_utils import (
     clear_screen,
     print_system_message,
 )
 from breeze.utils.constants import PATIENT_BANNER_STRING
+from breeze.utils.pacing import pause
 
 
 def learn_mental_health():
@@ -194,9 +194,9 @@ def learn_mental_health():
                     return
                 else:
                     print_system_message("Invalid choice. Please select [R] or [X].")
-                    time.sleep(1)
+                    pause(1)
         else:
             print_system_message(
                 "Invalid choice. Please select a valid topic or [X] to exit."
             )
-            time.sleep(1)
+            pause(1)
@@ -1,5 +1,4 @@
 from datetime import datetime
-import time
 from breeze.models.mood_entry import MoodEntry
 from breeze.utils.ansi_utils import colorise
 from breeze.utils.cli_utils import (
@@ -9,6 +8,7 @@ from breeze.utils.cli_utils import (
     direct_to_dashboard,
 )
 from breeze.utils.constants import PATIENT_BANNER_STRING
+from breeze.utils.pacing import pause
 
 mood_chart = {
     "G": {
@@ -102,4 +102,4 @@ def record_mood(user, auth_service):
             print_system_message(
                 f"Invalid color entered. Please choose from {color_names}."
             )
-            time.sleep(2)
+            pause(2)
@@ -1,6 +1,6 @@
 from breeze.utils.cli_utils import check_exit, clear_screen, direct_to_dashboard, print_system_message, is_valid_name, is_invalid_email
 from breeze.utils.constants import PATIENT_BANNER_STRING
-import time
+from breeze.utils.pacing import pause
 
 
 def show_default_layout(user, addon=0):
@@ -62,7 +62,7 @@ def edit_personal_information(user, auth_service):
         updated_gender = input("Gender: ").strip().lower()
         if updated_gender and updated_gender not in gender_dict.keys():
             print_system_message("Please select a valid option.")
-            time.sleep(1)
+            pause(1)
             continue
         elif updated_gender:
             updated_gender = gender_dict[updated_gender]
@@ -107,5 +107,6 @@ def edit_personal_information(user, auth_service):
         f"First name: {user.get_first_name()}\nLast name: {user.get_last_name()}\nEmail: {user.get_email()}\nGender: {user.get_gender()}\nEmergency contact email: {user.get_emergency_contact()}"
     )
 
+    auth_service.reindex_user(user)
     auth_service.save_data_to_file()
     direct_to_dashboard()
@@ -0,0 +1,258 @@
+"""Read-only reporting over a snapshot of the data file, in a separate process.
+
+Heavy reports (caseloads, mood analytics and appointment utilisation per MHWP) are
+computed outside the interactive app, so they never block an admin's session or compete
+with its writes. The data file is read once: save_data replaces it atomically, so that
+read is a consistent snapshot, and the reporter never writes to it. The work is split by
+MHWP across a multiprocessing pool, and the results are saved to reports/latest.json next
+to the data file, which the admin dashboard displays without recomputing anything.
+
+To run: python -m breeze.services.reporting_service [--days N] [--processes N] [--data FILE]
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+
+from breeze.services.auth_service import DATA_FILE_PATH
+from breeze.services.mood_analytics_service import MoodAnalytics
+from breeze.services.statistics_service import APPOINTMENT_STATUSES
+from breeze.utils.calendar_utils import generate_time_slots
+from breeze.utils.mood_aggregates import MOOD_LEVELS, MoodAggregates
+
+REPORT_FILE_NAME = "latest.json"
+DEFAULT_REPORT_DAYS = 28
+LOW_MOOD_LEVEL = MOOD_LEVELS["Sad"]
+
+
+def get_reports_dir(data_path):
+    """Returns the reports directory of a data file: reports/ next to it."""
+    return os.path.join(os.path.dirname(data_path) or ".", "reports")
+
+
+def get_report_path(data_path):
+    return os.path.join(get_reports_dir(data_path), REPORT_FILE_NAME)
+
+
+def load_snapshot(data_path):
+    """Reads the data file once, as a consistent read-only snapshot.
+
+    Returns:
+        tuple: (the stored data, snapshot details: path, modified time and size)
+    """
+    with open(data_path, "r") as file:
+        stat = os.fstat(file.fileno())
+        data = json.load(file)
+    details = {
+        "path": os.path.abspath(data_path),
+        "modified": datetime.datetime.fromtimestamp(stat.st_mtime).strftime("%d-%m-%Y %H:%M:%S"),
+        "bytes": stat.st_size,
+    }
+    return data, details
+
+
+def get_working_days(start_date, end_date):
+    return sum(
+        1
+        for offset in range((end_date - start_date).days + 1)
+        if (start_date + datetime.timedelta(days=offset)).weekday() < 5
+    )
+
+
+def partition_by_mhwp(data):
+    """Splits the snapshot into one (MHWP, patients, appointments) group per MHWP.
+
+    Patients without an MHWP that exists are grouped under None.
+    """
+    mhwps = {user["username"]: user for user in data.get("users", []) if user.get("role") == "MHWP"}
+    groups = {username: (mhwp, [], []) for username, mhwp in mhwps.items()}
+    for user in data.get("users", []):
+        if user.get("role") == "Patient":
+            mhwp_username = user.get("assignedMHWP")
+            key = mhwp_username if mhwp_username in groups else None
+            groups.setdefault(key, (None, [], []))[1].append(user)
+    for appointment in data.get("appointments", []):
+        group = groups.get(appointment.get("mhwpUsername"))
+        if group:
+            group[2].append(appointment)
+    return list(groups.values())
+
+
+def compute_mhwp_report(task):
+    """Computes the caseload, mood and appointment report of one MHWP (a pool worker).
+
+    Args:
+        task (tuple): (MHWP dict or None, patient dicts, appointment dicts, first date
+            ordinal, last date ordinal) of the reporting window.
+
+    Returns:
+        dict: The MHWP's report.
+    """
+    mhwp, patients, appointments, start, end = task
+    start_date, end_date = datetime.date.fromordinal(start), datetime.date.fromordinal(end)
+
+    # the same mood statistics as the app's trend views
+    analytics = MoodAnalytics()
+    for patient in patients:
+        analytics.add(patient["username"], MoodAggregates(patient.get("moods", [])))
+    mood_distribution = analytics.get_distribution(start_date, end_date)
+    latest_averages = analytics.get_latest_averages(start_date, end_date)
+    low_mood_patients = sum(1 for average in latest_averages.values() if average <= LOW_MOOD_LEVEL)
+
+    status_counts = dict.fromkeys(APPOINTMENT_STATUSES, 0)
+    for appointment in appointments:
+        day = datetime.datetime.strptime(appointment["date"], "%d-%m-%Y").toordinal()
+        if start <= day <= end and appointment.get("status") in status_counts:
+            status_counts[appointment["status"]] += 1
+
+    slots = len(generate_time_slots()) * get_working_days(start_date, end_date)
+    mood_entries = sum(mood_distribution.values())
+    return {
+        "mhwp": mhwp["username"] if mhwp else None,
+        "name": (
+            f"{mhwp['information'].get('firstName')} {mhwp['information'].get('lastName')}"
+            if mhwp
+            else "Unassigned"
+        ),
+        "is_disabled": mhwp.get("isDisabled", False) if mhwp else False,
+        "patients": len(patients),
+        "disabled_patients": sum(1 for patient in patients if patient.get("isDisabled")),
+        "mood_entries": mood_entries,
+        "mood_distribution": mood_distribution,
+        "average_mood": (
+            round(sum(MOOD_LEVELS[name] * count for name, count in mood_distribution.items()) / mood_entries, 2)
+            if mood_entries
+            else None
+        ),
+        "low_mood_patients": low_mood_patients,
+        "patients_without_mood": len(patients) - len(latest_averages),
+        "appointments": status_counts,
+        "slots": slots if mhwp else 0,
+        "utilisation": round(status_counts["confirmed"] / slots, 4) if mhwp and slots else None,
+    }
+
+
+def get_totals(mhwp_reports):
+    """Adds up the MHWP reports into one report for the whole service."""
+    totals = {
+        "patients": 0,
+        "disabled_patients": 0,
+        "mood_entries": 0,
+        "mood_distribution": dict.fromkeys(MOOD_LEVELS, 0),
+        "low_mood_patients": 0,
+        "patients_without_mood": 0,
+        "appointments": dict.fromkeys(APPOINTMENT_STATUSES, 0),
+        "slots": 0,
+    }
+    for report in mhwp_reports:
+        for key in ("patients", "disabled_patients", "mood_entries", "low_mood_patients", "patients_without_mood", "slots"):
+            totals[key] += report[key]
+        for key in ("mood_distribution", "appointments"):
+            for name, count in report[key].items():
+                totals[key][name] += count
+    totals["average_mood"] = (
+        round(
+            sum(MOOD_LEVELS[name] * count for name, count in totals["mood_distribution"].items())
+            / totals["mood_entries"],
+            2,
+        )
+        if totals["mood_entries"]
+        else None
+    )
+    totals["utilisation"] = (
+        round(totals["appointments"]["confirmed"] / totals["slots"], 4) if totals["slots"] else None
+    )
+    return totals
+
+
+def generate_reports(data_path, days=DEFAULT_REPORT_DAYS, processes=None, today=None):
+    """Computes every report from a snapshot of the data file.
+
+    Args:
+        data_path (str): The data file. It is only read.
+        days (int, optional): Length of the reporting window, ending today.
+        processes (int, optional): Pool size. Defaults to the CPU count; 1 computes in
+            this process.
+        today (datetime.date, optional): The last day of the window.
+
+    Returns:
+        dict: The reports, ready to be saved as JSON.
+    """
+    started = datetime.datetime.now()
+    data, snapshot = load_snapshot(data_path)
+    end_date = today or datetime.date.today()
+    start_date = end_date - datetime.timedelta(days=days - 1)
+    tasks = [
+        (mhwp, patients, appointments, start_date.toordinal(), end_date.toordinal())
+        for mhwp, patients, appointments in partition_by_mhwp(data)
+    ]
+    # the snapshot is no longer needed once it is partitioned
+    del data
+
+    processes = min(processes or os.cpu_count() or 1, max(len(tasks), 1))
+    if processes == 1:
+        mhwp_reports = [compute_mhwp_report(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            mhwp_reports = pool.map(compute_mhwp_report, tasks)
+
+    return {
+        "generated": started.strftime("%d-%m-%Y %H:%M:%S"),
+        "seconds": round((datetime.datetime.now() - started).total_seconds(), 3),
+        "processes": processes,
+        "snapshot": snapshot,
+        "window": {"start": start_date.strftime("%d-%m-%Y"), "end": end_date.strftime("%d-%m-%Y"), "days": days},
+        "mhwps": sorted(mhwp_reports, key=lambda report: (report["mhwp"] is None, report["mhwp"] or "")),
+        "totals": get_totals(mhwp_reports),
+    }
+
+
+def save_reports(reports, file_path):
+    """Saves the reports atomically, so the dashboard never reads a partial file."""
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "w") as file:
+        json.dump(reports, file, indent=2)
+    os.replace(temp_path, file_path)
+    return file_path
+
+
+def load_reports(data_path):
+    """Returns the latest saved reports of a data file, or None if there are none yet."""
+    try:
+        with open(get_report_path(data_path), "r") as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Computes Breeze reports from a read-only snapshot of the data file."
+    )
+    parser.add_argument("--data", help="data file (default: ./data/users.json)")
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=DEFAULT_REPORT_DAYS,
+        help=f"length of the reporting window in days (default: {DEFAULT_REPORT_DAYS})",
+    )
+    parser.add_argument("--processes", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--output", help="report file (default: reports/latest.json next to the data file)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    data_path = args.data or DATA_FILE_PATH
+    reports = generate_reports(data_path, max(args.days, 1), args.processes)
+    file_path = save_reports(reports, args.output or get_report_path(data_path))
+    print(
+        f"Reports for {len(reports['mhwps'])} MHWP group(s) computed in {reports['seconds']}s "
+        f"with {reports['processes']} process(es), saved to {file_path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
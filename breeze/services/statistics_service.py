@@ -0,0 +1,84 @@
+import datetime
+
+APPOINTMENT_STATUSES = ("requested", "confirmed", "cancelled")
+
+
+def get_week_start(date):
+    """Returns the Monday of the week containing the date."""
+    return date - datetime.timedelta(days=date.weekday())
+
+
+class AdminStatistics:
+    """Materialised counts for the admin summary, updated by every mutation path.
+
+    Keeps appointment counts per week and status, both overall and per MHWP, and active
+    and disabled user totals per role, so the summary never has to scan users or
+    appointments. Appointments report their status changes through a status listener.
+    """
+
+    def __init__(self):
+        self.__weekly = {}
+        self.__weekly_by_mhwp = {}
+        self.__tracked = {}
+        self.__user_totals = {}
+
+    def __count(self, mhwp_username, week_start, status, delta):
+        for counts in (
+            self.__weekly.setdefault(week_start, {}),
+            self.__weekly_by_mhwp.setdefault((mhwp_username, week_start), {}),
+        ):
+            counts[status] = counts.get(status, 0) + delta
+
+    def track_appointment(self, appointment):
+        """Starts counting an appointment. Appointments already tracked are ignored."""
+        if appointment.get_id() in self.__tracked:
+            return
+        key = (appointment.mhwp_username, get_week_start(appointment.get_date()))
+        self.__tracked[appointment.get_id()] = key
+        self.__count(*key, appointment.get_status(), 1)
+        appointment.set_status_listener(self.__on_status_change)
+
+    def untrack_appointment(self, appointment):
+        """Stops counting an appointment, e.g. once it is archived or no user holds it."""
+        key = self.__tracked.pop(appointment.get_id(), None)
+        if key is None:
+            return
+        self.__count(*key, appointment.get_status(), -1)
+        appointment.set_status_listener(None)
+
+    def __on_status_change(self, appointment, old_status):
+        key = self.__tracked.get(appointment.get_id())
+        if key is not None:
+            self.__count(*key, old_status, -1)
+            self.__count(*key, appointment.get_status(), 1)
+
+    def get_week_counts(self, week_start, mhwp_username=None):
+        """Returns appointment counts per status for a week, optionally for one MHWP only."""
+        if mhwp_username is None:
+            counts = self.__weekly.get(week_start, {})
+        else:
+            counts = self.__weekly_by_mhwp.get((mhwp_username, week_start), {})
+        return {status: counts.get(status, 0) for status in APPOINTMENT_STATUSES}
+
+    def get_weekly_breakdown(self, weeks=4, today=None):
+        """Returns (week start, counts per status) for the current and previous weeks, latest first."""
+        week_start = get_week_start(today or datetime.date.today())
+        return [
+            (
+                week_start - datetime.timedelta(weeks=offset),
+                self.get_week_counts(week_start - datetime.timedelta(weeks=offset)),
+            )
+            for offset in range(weeks)
+        ]
+
+    def add_user(self, user):
+        totals = self.__user_totals.setdefault(user.get_role(), {"active": 0, "disabled": 0})
+        totals["disabled" if user.get_is_disabled() else "active"] += 1
+
+    def remove_user(self, user):
+        totals = self.__user_totals.setdefault(user.get_role(), {"active": 0, "disabled": 0})
+        totals["disabled" if user.get_is_disabled() else "active"] -= 1
+
+    def get_user_totals(self):
+        """Returns role -> {"active": count, "disabled": count}."""
+        return self.__user_totals
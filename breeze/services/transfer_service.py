@@ -0,0 +1,423 @@
+import argparse
+import time
+from itertools import chain, islice
+
+from breeze.models.admin import Admin
+from breeze.models.appointment_entry import AppointmentEntry
+from breeze.models.mhwp import MHWP
+from breeze.models.patient import Patient
+from breeze.services.auth_service import DATA_FILE_PATH, AuthService
+from breeze.services.statistics_service import APPOINTMENT_STATUSES
+from breeze.utils.cli_utils import (
+    is_invalid_date,
+    is_invalid_email,
+    is_invalid_username,
+    is_valid_name,
+)
+from breeze.utils.credential_utils import hash_passwords, is_hashed
+from breeze.utils.record_utils import read_records, write_records
+
+USER_FIELDS = [
+    "role",
+    "username",
+    "password",
+    "first_name",
+    "last_name",
+    "email",
+    "gender",
+    "date_of_birth",
+    "emergency_contact_email",
+    "assigned_mhwp",
+    "is_disabled",
+]
+APPOINTMENT_FIELDS = [
+    "appointment_id",
+    "date",
+    "time",
+    "status",
+    "mhwp_username",
+    "patient_username",
+    "summary",
+]
+USER_ROLES = ("patient", "mhwp", "admin")
+GENDERS = ("Male", "Female", "Non-binary", "Transgender", "Other")
+# What Patient.get_gender and get_date_of_birth return (and to_dict saves) when a value is missing
+UNKNOWN_VALUES = ("Unkonwn", "Unknown")
+DEFAULT_BATCH_SIZE = 1000
+
+
+def get_batches(iterable, batch_size):
+    """Yields lists of up to batch_size items from an iterable."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def parse_bool(value):
+    return str(value).strip().lower() in ("true", "1", "yes")
+
+
+def get_text(record, field):
+    """Returns a record's field as stripped text, or an empty string if it is missing."""
+    value = record.get(field)
+    return str(value).strip() if value is not None else ""
+
+
+def get_known(value):
+    """Returns a patient's gender or date of birth, or None for the "Unknown" placeholders."""
+    return None if value in UNKNOWN_VALUES else value
+
+
+class TransferReport:
+    """Counts and timing of one bulk import or export.
+
+    Args:
+        description (str): What was transferred, e.g. "Imported users".
+    """
+
+    def __init__(self, description):
+        self.description = description
+        self.processed = 0
+        self.succeeded = 0
+        self.rejected = []
+        self.seconds = 0.0
+        self.__start = time.perf_counter()
+
+    def reject(self, line_no, reason):
+        self.rejected.append((line_no, reason))
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self.__start
+        return self
+
+    def get_rate(self):
+        """Returns the records processed per second."""
+        return self.processed / self.seconds if self.seconds else 0.0
+
+    def describe(self):
+        return (
+            f"{self.description}: {self.succeeded} of {self.processed} record(s), "
+            f"{len(self.rejected)} rejected, in {self.seconds:.2f}s "
+            f"({self.get_rate():.0f} records/sec)"
+        )
+
+
+class TransferService:
+    """Bulk import and export of users and appointments as CSV or JSONL files.
+
+    Imports stream the file in batches. Every record is checked with the same validators
+    as registration, the passwords of a batch are hashed together, and patients without
+    an MHWP are allocated through the MHWP allocator. Invalid records are rejected with a
+    reason and do not stop the import. The data file is saved once, after the last batch.
+
+    Args:
+        auth_service (AuthService): The service holding the users.
+        batch_size (int, optional): Records validated and hashed together.
+    """
+
+    def __init__(self, auth_service, batch_size=DEFAULT_BATCH_SIZE):
+        self.auth_service = auth_service
+        self.batch_size = batch_size
+
+    def import_users(self, file_path):
+        """Imports users from a CSV or JSONL file with USER_FIELDS columns.
+
+        Passwords may be plaintext or already hashed (e.g. from an export).
+
+        Returns:
+            TransferReport: The import's counts, rejected lines and throughput.
+        """
+        report = TransferReport("Imported users")
+        for batch in get_batches(read_records(file_path), self.batch_size):
+            # records accepted earlier in the batch, by username
+            pending = {}
+            valid = []
+            for line_no, record in batch:
+                report.processed += 1
+                try:
+                    self.__check_user(record, pending)
+                except ValueError as error:
+                    report.reject(line_no, str(error))
+                    continue
+                pending[get_text(record, "username")] = record
+                valid.append(record)
+            self.__add_users(valid)
+            report.succeeded += len(valid)
+
+        if report.succeeded:
+            self.auth_service.save_data_to_file()
+        return report.finish()
+
+    def __check_user(self, record, pending):
+        if record is None:
+            raise ValueError("line is not a JSON object")
+        role = get_text(record, "role").lower()
+        if role not in USER_ROLES:
+            raise ValueError("role must be patient, mhwp or admin")
+
+        username = get_text(record, "username")
+        if username in pending or is_invalid_username(username, self.auth_service.users, quiet=True):
+            raise ValueError(f"username '{username}' is taken or invalid")
+        for field in ("first_name", "last_name"):
+            name = get_text(record, field)
+            if not name or not is_valid_name(name, quiet=True):
+                raise ValueError(f"{field} is missing or invalid")
+        email = get_text(record, "email")
+        if not email or is_invalid_email(email, quiet=True):
+            raise ValueError("email is missing or invalid")
+        if role != "patient":
+            return
+
+        # gender and date of birth can be empty, as exports leave unknown values empty
+        date_of_birth = get_text(record, "date_of_birth")
+        if date_of_birth and is_invalid_date(date_of_birth, quiet=True):
+            raise ValueError("date_of_birth is invalid or under 16")
+        gender = get_text(record, "gender")
+        if gender and gender not in GENDERS:
+            raise ValueError(f"gender must be one of {', '.join(GENDERS)}")
+        emergency_contact_email = get_text(record, "emergency_contact_email")
+        if emergency_contact_email and is_invalid_email(emergency_contact_email, quiet=True):
+            raise ValueError("emergency_contact_email is invalid")
+        mhwp_username = get_text(record, "assigned_mhwp")
+        if not mhwp_username:
+            return
+        mhwp = self.auth_service.get_mhwps().get(mhwp_username)
+        pending_mhwp = pending.get(mhwp_username)
+        if mhwp:
+            is_disabled = mhwp.get_is_disabled()
+        elif pending_mhwp and get_text(pending_mhwp, "role").lower() == "mhwp":
+            is_disabled = parse_bool(pending_mhwp.get("is_disabled"))
+        else:
+            raise ValueError(f"assigned_mhwp '{mhwp_username}' is not an MHWP")
+        # the allocator never assigns patients to disabled MHWPs, so neither does an import
+        if is_disabled:
+            raise ValueError(f"assigned MHWP '{mhwp_username}' is disabled")
+
+    def __add_users(self, records):
+        passwords = [get_text(record, "password") for record in records]
+        hashed_passwords = iter(
+            hash_passwords([password for password in passwords if not is_hashed(password)])
+        )
+        for record, password in zip(records, passwords):
+            user = self.__create_user(
+                record, password if is_hashed(password) else next(hashed_passwords)
+            )
+            self.auth_service.add_user(user)
+            if user.get_role() == "Patient":
+                mhwp = (
+                    self.auth_service.get_mhwps().get(get_text(record, "assigned_mhwp"))
+                    or self.auth_service.find_mhwp_with_fewest_patients()
+                )
+                if mhwp:
+                    self.auth_service.assign_patient_to_mhwp(user, mhwp)
+
+    @staticmethod
+    def __create_user(record, password):
+        details = dict(
+            username=get_text(record, "username"),
+            password=password,
+            first_name=get_text(record, "first_name"),
+            last_name=get_text(record, "last_name"),
+            email=get_text(record, "email"),
+            is_disabled=parse_bool(record.get("is_disabled")),
+        )
+        match get_text(record, "role").lower():
+            case "admin":
+                return Admin(**details)
+            case "mhwp":
+                return MHWP(**details)
+            case _:
+                return Patient(
+                    **details,
+                    gender=get_text(record, "gender") or None,
+                    date_of_birth=get_text(record, "date_of_birth") or None,
+                    emergency_contact_email=get_text(record, "emergency_contact_email") or None,
+                )
+
+    def import_appointments(self, file_path):
+        """Imports appointments from a CSV or JSONL file with APPOINTMENT_FIELDS columns.
+
+        The patient and MHWP must already exist, and neither may have another appointment
+        that is not cancelled in the same slot. The booked slots are collected once up
+        front, so each record is checked in constant time.
+
+        Returns:
+            TransferReport: The import's counts, rejected lines and throughput.
+        """
+        report = TransferReport("Imported appointments")
+        appointment_ids = set()
+        # (username, date, time) slots taken by appointments that are not cancelled
+        booked = set()
+        for appointment in self.get_appointments():
+            appointment_ids.add(appointment.get_id())
+            if appointment.get_status() != "cancelled":
+                booked.update(get_slots(appointment))
+
+        for batch in get_batches(read_records(file_path), self.batch_size):
+            valid = []
+            for line_no, record in batch:
+                report.processed += 1
+                try:
+                    appointment = self.__create_appointment(record, appointment_ids, booked)
+                except ValueError as error:
+                    report.reject(line_no, str(error))
+                    continue
+                appointment_ids.add(appointment.get_id())
+                valid.append(appointment)
+
+            for appointment in valid:
+                self.auth_service.get_patients()[appointment.patient_username].add_appointment(appointment)
+                self.auth_service.get_mhwps()[appointment.mhwp_username].add_appointment(appointment)
+                self.auth_service.statistics.track_appointment(appointment)
+            report.succeeded += len(valid)
+
+        if report.succeeded:
+            self.auth_service.save_data_to_file()
+        return report.finish()
+
+    def __create_appointment(self, record, appointment_ids, booked):
+        if record is None:
+            raise ValueError("line is not a JSON object")
+        patient = self.auth_service.get_patients().get(get_text(record, "patient_username"))
+        if not patient:
+            raise ValueError("patient_username is not a patient")
+        mhwp = self.auth_service.get_mhwps().get(get_text(record, "mhwp_username"))
+        if not mhwp:
+            raise ValueError("mhwp_username is not an MHWP")
+        status = get_text(record, "status").lower()
+        if status not in APPOINTMENT_STATUSES:
+            raise ValueError(f"status must be one of {', '.join(APPOINTMENT_STATUSES)}")
+        appointment_id = get_text(record, "appointment_id") or None
+        if appointment_id in appointment_ids:
+            raise ValueError(f"appointment_id '{appointment_id}' already exists")
+
+        date, time_str = get_text(record, "date"), get_text(record, "time")
+        try:
+            appointment = AppointmentEntry(
+                date,
+                time_str,
+                status=status,
+                mhwp_username=mhwp.get_username(),
+                patient_username=patient.get_username(),
+                appointment_id=appointment_id,
+                summary=record.get("summary") or None,
+            )
+        except ValueError:
+            raise ValueError("date must be DD-MM-YYYY and time HH:MM AM/PM") from None
+
+        if status != "cancelled":
+            slots = get_slots(appointment)
+            for slot in slots:
+                if slot in booked:
+                    raise ValueError(f"{slot[0]} already has an appointment at {date} {time_str}")
+            booked.update(slots)
+        return appointment
+
+    def get_appointments(self):
+        """Yields every appointment once, as save_data stores them."""
+        seen = set()
+        for user in self.auth_service.users.values():
+            if user.get_role() == "Admin":
+                continue
+            for appointment in user.get_appointments():
+                if appointment.get_id() not in seen:
+                    seen.add(appointment.get_id())
+                    yield appointment
+
+    def export_users(self, file_path):
+        """Exports every user, with their hashed password, to a CSV or JSONL file.
+
+        MHWPs are written before patients, so the file can be imported as it is.
+        """
+        report = TransferReport("Exported users")
+        users = chain(
+            self.auth_service.get_admins().values(),
+            self.auth_service.get_mhwps().values(),
+            self.auth_service.get_patients().values(),
+        )
+        report.processed = report.succeeded = write_records(
+            file_path, USER_FIELDS, (self.get_user_record(user) for user in users)
+        )
+        return report.finish()
+
+    def export_appointments(self, file_path):
+        """Exports every appointment to a CSV or JSONL file."""
+        report = TransferReport("Exported appointments")
+        report.processed = report.succeeded = write_records(
+            file_path,
+            APPOINTMENT_FIELDS,
+            (self.get_appointment_record(appointment) for appointment in self.get_appointments()),
+        )
+        return report.finish()
+
+    @staticmethod
+    def get_user_record(user):
+        record = {
+            "role": user.get_role().lower(),
+            "username": user.get_username(),
+            "password": user.get_password(),
+            "first_name": user.get_first_name(),
+            "last_name": user.get_last_name(),
+            "email": user.get_email(),
+            "is_disabled": user.get_is_disabled(),
+        }
+        if user.get_role() == "Patient":
+            record.update(
+                gender=get_known(user.get_gender()),
+                date_of_birth=get_known(user.get_date_of_birth()),
+                emergency_contact_email=user.get_emergency_contact(),
+                assigned_mhwp=user.get_assigned_mhwp(),
+            )
+        return record
+
+    @staticmethod
+    def get_appointment_record(appointment):
+        return {
+            "appointment_id": appointment.get_id(),
+            "date": appointment.get_date().strftime("%d-%m-%Y"),
+            "time": appointment.get_time().strftime("%I:%M %p"),
+            "status": appointment.get_status(),
+            "mhwp_username": appointment.mhwp_username,
+            "patient_username": appointment.patient_username,
+            "summary": appointment.summary,
+        }
+
+
+def get_slots(appointment):
+    """Returns the (username, date, time) slots an appointment takes for its MHWP and patient."""
+    return [
+        (username, appointment.get_date(), appointment.get_time())
+        for username in (appointment.mhwp_username, appointment.patient_username)
+    ]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Bulk import or export Breeze users and appointments as CSV or JSONL."
+    )
+    parser.add_argument("action", choices=("import", "export"))
+    parser.add_argument("kind", choices=("users", "appointments"))
+    parser.add_argument("file", help="the .csv or .jsonl file to read or write")
+    parser.add_argument("--data", help="data file (default: ./data/users.json)")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"records validated and hashed together (default: {DEFAULT_BATCH_SIZE})",
+    )
+    return parser.parse_args(argv)
+
+
+# to run: python -m breeze.services.transfer_service import users clinic.csv
+def main(argv=None):
+    args = parse_args(argv)
+    service = TransferService(AuthService(args.data or DATA_FILE_PATH), args.batch_size)
+    transfer = getattr(service, f"{args.action}_{args.kind}")
+    report = transfer(args.file)
+    print(report.describe())
+    for line_no, reason in report.rejected:
+        print(f"  line {line_no}: {reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 
 FG_COLOR_TEMPLATE = "\x1b[38;5;{}m"
@@ -22,6 +23,8 @@ NAMED_COLORS = {
     "bright_white": 15,
 }
 
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 STYLES = {
     "BOLD": "\x1b[1m",
     "UNDERLINE": "\x1b[4m",
@@ -63,8 +66,18 @@ def colorise(text, color=None, background=None, bold=False, underline=False):
 
 
 def strip_ansi_codes(text):
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return ANSI_ESCAPE_PATTERN.sub("", text)
+
+
+@lru_cache(maxsize=4096)
+def get_visible_width(text):
+    """Returns the printed width of a string, ignoring ANSI escape codes.
+
+    Table cells repeat a lot (statuses, roles, colours), so widths are cached.
+    """
+    if "\x1b" not in text:
+        return len(text)
+    return len(strip_ansi_codes(text))
 
 
 def print_color_palette():
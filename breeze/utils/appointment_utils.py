@@ -1,7 +1,7 @@
-import time
 import datetime
 from breeze.utils.cli_utils import print_appointments, print_system_message
 from breeze.services.email_service import EmailService
+from breeze.utils.pacing import pause
 
 
 def confirm_user_choice(
@@ -65,13 +65,13 @@ def handle_appointment_action(
 
     if not (1 <= selected_index <= len(upcoming_appointments)):
         print_system_message("Invalid appointment index. Please try again.")
-        time.sleep(1)
+        pause(1)
         return False
 
     appointment = upcoming_appointments[selected_index - 1]
     if not appointment:
         print_system_message("No appointment found at the given index.")
-        time.sleep(1)
+        pause(1)
         return False
 
     mhwp_obj = auth_service.get_user_by_username(appointment.mhwp_username)
@@ -81,22 +81,23 @@ def handle_appointment_action(
         print_system_message(
             "This appointment cannot be confirmed or cancelled because the patient's account has been disabled. No further action is required."
         )
-        time.sleep(2)
+        pause(2)
         return False
 
     if action == "cancel" and appointment.get_status() == "cancelled":
         print_system_message("This appointment is already cancelled. No action needed.")
-        time.sleep(1)
+        pause(1)
         return False
     elif action == "confirm" and appointment.get_status() == "confirmed":
         print_system_message("This appointment is already confirmed. No action needed.")
-        time.sleep(1)
+        pause(1)
         return False
 
     if action == "cancel":
         appointment.cancel_appointment()
     elif action == "confirm":
         appointment.confirm_appointment()
+    auth_service.allocator.update(mhwp_obj)
 
     auth_service.save_data_to_file()
 
@@ -107,7 +108,7 @@ def handle_appointment_action(
 
     email_service = EmailService(appointment, auth_service)
     email_service.send_to_both(action)
-    time.sleep(2.5)
+    pause(2.5)
 
     return True
 
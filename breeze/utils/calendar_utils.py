@@ -1,7 +1,6 @@
 import datetime
-import re
 
-from breeze.utils.ansi_utils import colorise
+from breeze.utils.ansi_utils import colorise, strip_ansi_codes
 
 
 def get_next_available_days(num_days=5, include_today=False):
@@ -87,11 +86,6 @@ def get_colored_status(status):
         return status
 
 
-def strip_ansi_codes(text):
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
-
-
 if __name__ == "__main__":
     days = get_next_available_days()
     slots = generate_time_slots()
@@ -1,7 +1,12 @@
-import os
+import io
 import re
+import sys
 from datetime import datetime as dt
-from breeze.utils.calendar_utils import get_colored_status, strip_ansi_codes
+from breeze.utils.ansi_utils import get_visible_width
+from breeze.utils.calendar_utils import get_colored_status
+from breeze.utils.paging import as_paged_view
+from breeze.utils.screen import clear_screen
+from breeze.utils.table_renderer import stream_table
 
 def print_system_message(message):
     """Print the system message in a box that dynamically sizes according to the length of the message.
@@ -11,7 +16,7 @@ def print_system_message(message):
     """
     lines = message.splitlines()
 
-    max_width = max(len(strip_ansi_codes(line)) for line in lines) + 4
+    max_width = max(get_visible_width(line) for line in lines) + 4
     print("-" * max_width)
 
     for line in lines:
@@ -20,10 +25,6 @@ def print_system_message(message):
     print("-" * max_width)
 
 
-def clear_screen():
-    os.system("cls" if os.name == "nt" else "clear")
-
-
 def show_disabled_account_dashboard_menu(username):
     """
     Prompts the user with a message when their account is disabled.
@@ -49,36 +50,11 @@ def show_disabled_account_dashboard_menu(username):
         return False
 
 
-def table_creator(headers, rows):
-    column_widths = [
-        max(len(strip_ansi_codes(str(row[i]))) for row in rows + [headers])
-        for i in range(len(headers))
-    ]
-
-    separator = "+".join("-" * (width + 2) for width in column_widths)
-    separator = f"+{separator}+"
-
-    print(separator)
-    print(
-        "| "
-        + " | ".join(
-            header.center(width) for header, width in zip(headers, column_widths)
-        )
-        + " |"
-    )
-    print(separator)
-    for row in rows:
-        print(
-            "| "
-            + " | ".join(
-                str(cell).ljust(
-                    width + len(str(cell)) - len(strip_ansi_codes(str(cell)))
-                )
-                for cell, width in zip(row, column_widths)
-            )
-            + " |"
-        )
-    print(separator)
+def table_creator(headers, rows, widths=None):
+    """Prints a table in one write. Columns fit their widest cell unless fixed widths are given."""
+    buffer = io.StringIO()
+    stream_table(headers, rows, widths=widths, sample_size=None, write=buffer.write)
+    sys.stdout.write(buffer.getvalue())
 
 
 def print_appointments(appointments=[], is_own_view=True):
@@ -114,15 +90,11 @@ def print_appointments(appointments=[], is_own_view=True):
 def print_user_appointments(appointments=[], page=1):
     if not appointments:
         return
-    lower = (page - 1) * 10
-    if len(appointments) > ((page - 1) * 10 + 10):
-        upper = lower + 10
-        page_data = appointments[::-1][lower:upper]
-    elif len(appointments) > ((page - 1) * 10):
-        page_data = appointments[::-1][lower:]
-    else:
+    appointments = as_paged_view(appointments)
+    if not appointments.has_page(page):
         print("No appointments on this page!")
         return False
+    page_data = appointments.get_page(page)
 
     headers = ["#", "MHWP", "Appointment Summary", "Date", "Time"]
 
@@ -151,15 +123,11 @@ def print_user_appointments(appointments=[], page=1):
 def print_journals(journal_data=[], page=1):
     if not journal_data:
         return
-    lower = (page - 1) * 10
-    if len(journal_data) > ((page - 1) * 10 + 10):
-        upper = lower + 10
-        page_data = journal_data[::-1][lower:upper]
-    elif len(journal_data) > ((page - 1) * 10):
-        page_data = journal_data[::-1][lower:]
-    else:
+    journal_data = as_paged_view(journal_data)
+    if not journal_data.has_page(page):
         print("No journal items on this page!")
         return False
+    page_data = journal_data.get_page(page)
 
     headers = ["#", "Title", "Text", "Date", "Time", "Last Update"]
 
@@ -185,15 +153,11 @@ def print_journals(journal_data=[], page=1):
 def print_moods(mood_data=[], page=1):
     if not mood_data:
         return
-    lower = (page - 1) * 10
-    if len(mood_data) > ((page - 1) * 10 + 10):
-        upper = lower + 10
-        page_data = mood_data[::-1][lower:upper]
-    elif len(mood_data) > ((page - 1) * 10):
-        page_data = mood_data[::-1][lower:]
-    else:
+    mood_data = as_paged_view(mood_data)
+    if not mood_data.has_page(page):
         print("No journal items on this page!")
         return False
+    page_data = mood_data.get_page(page)
 
     headers = ["#", "Mood", "Comment", "Date", "Time"]
 
@@ -220,41 +184,47 @@ def is_empty(input):
         return True
 
 
-def is_valid_name(name):
+def is_valid_name(name, quiet=False):
     if len(name) == 1 and name.isalpha() == False:
-        print_system_message(
-            "Name must be longer than one character and contain only alphabetic characters. Please try again."
-        )
+        if not quiet:
+            print_system_message(
+                "Name must be longer than one character and contain only alphabetic characters. Please try again."
+            )
         return False
     elif len(name) == 1:
-        print_system_message(
-            "Name must be longer than one character. Please try again."
-        )
+        if not quiet:
+            print_system_message(
+                "Name must be longer than one character. Please try again."
+            )
         return False
     for i in name:
         if i.isalpha() == False:
-            print_system_message("Name cannot contain non-alphabetic characters.")
+            if not quiet:
+                print_system_message("Name cannot contain non-alphabetic characters.")
             return False
     return True
 
 
-def is_invalid_username(username, users):
+def is_invalid_username(username, users, quiet=False):
     if username in users:
-        print_system_message("Username already taken! Please choose another.")
+        if not quiet:
+            print_system_message("Username already taken! Please choose another.")
         return True
     elif username.lower() != username or len(username) < 2 or len(username) > 10:
-        print_system_message(
-            "Username must be in lowercase and be between two and ten characters! Please try again."
-        )
+        if not quiet:
+            print_system_message(
+                "Username must be in lowercase and be between two and ten characters! Please try again."
+            )
         return True
     elif len(username.split(" ")) > 1:
-        print_system_message("Username cannot include spaces! Please try again.")
+        if not quiet:
+            print_system_message("Username cannot include spaces! Please try again.")
         return True
     else:
         return False
 
 
-def is_invalid_date(date):
+def is_invalid_date(date, quiet=False):
     date_regex = "^(0[1-9]|[12][0-9]|3[01])-(0[1-9]|1[0-2])-([0-9]{4})$"
     if re.match(date_regex, date):
         # secondary check for invalid dates eg. 31 Sep, 31 Feb
@@ -264,25 +234,29 @@ def is_invalid_date(date):
             if dt.now() > sixteenth:
                 return False
             else:
-                print_system_message("You must be over 16 to use the Breeze service!")
+                if not quiet:
+                    print_system_message("You must be over 16 to use the Breeze service!")
                 return True
         except ValueError:
-            print_system_message(
-                "Date is invalid! Please enter a existing date of birth."
-            )
+            if not quiet:
+                print_system_message(
+                    "Date is invalid! Please enter a existing date of birth."
+                )
             return True
     else:
-        print_system_message("Date is incorrectly formulated! Please try again.")
+        if not quiet:
+            print_system_message("Date is incorrectly formulated! Please try again.")
         return True
 
 
-def is_invalid_email(email):
+def is_invalid_email(email, quiet=False):
     email_regex = "^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
     if email != "":
         if re.match(email_regex, email):
             return False
         else:
-            print_system_message("Email is formatted incorrectly! Please try again.")
+            if not quiet:
+                print_system_message("Email is formatted incorrectly! Please try again.")
             return True
 
 
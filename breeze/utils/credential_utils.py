@@ -0,0 +1,161 @@
+import hashlib
+import hmac
+import os
+from collections import OrderedDict
+
+
+HASH_ALGORITHM = "pbkdf2_sha256"
+DEFAULT_ITERATIONS = 200_000
+ITERATIONS_ENV_VAR = "BREEZE_PASSWORD_ITERATIONS"
+SALT_BYTES = 16
+
+
+def get_work_factor():
+    """Returns the configured number of PBKDF2 iterations.
+
+    The work factor can be tuned per deployment with the BREEZE_PASSWORD_ITERATIONS
+    environment variable, e.g. lowered for load tests or raised on faster hardware.
+
+    Returns:
+        int: The number of iterations used when hashing new passwords.
+    """
+    value = os.environ.get(ITERATIONS_ENV_VAR, "")
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    return DEFAULT_ITERATIONS
+
+
+def hash_password(password, iterations=None, salt=None):
+    """Hashes a password with PBKDF2-HMAC-SHA256.
+
+    Args:
+        password (str): The plaintext password.
+        iterations (int, optional): Work factor. Defaults to the configured work factor.
+        salt (bytes, optional): Salt to use. Defaults to a random salt.
+
+    Returns:
+        str: The encoded hash in the form 'pbkdf2_sha256$iterations$salt$hash'.
+    """
+    iterations = iterations or get_work_factor()
+    salt = salt or os.urandom(SALT_BYTES)
+    derived = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{HASH_ALGORITHM}${iterations}${salt.hex()}${derived.hex()}"
+
+
+def is_hashed(stored_password):
+    """Checks whether a stored password is already hashed (as opposed to legacy plaintext)."""
+    return isinstance(stored_password, str) and stored_password.startswith(
+        f"{HASH_ALGORITHM}$"
+    )
+
+
+def get_iterations(stored_password):
+    """Returns the work factor a stored hash was created with, or None for plaintext."""
+    if not is_hashed(stored_password):
+        return None
+    return int(stored_password.split("$")[1])
+
+
+def verify_password(stored_password, password):
+    """Verifies a password against a stored hash or a legacy plaintext password.
+
+    Args:
+        stored_password (str): The stored credential, hashed or plaintext.
+        password (str): The password entered by the user.
+
+    Returns:
+        bool: True if the password matches, otherwise False.
+    """
+    if stored_password is None:
+        return False
+
+    if not is_hashed(stored_password):
+        return hmac.compare_digest(stored_password.encode(), password.encode())
+
+    _, iterations, salt_hex, hash_hex = stored_password.split("$")
+    derived = hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), bytes.fromhex(salt_hex), int(iterations)
+    )
+    return hmac.compare_digest(derived.hex(), hash_hex)
+
+
+def needs_rehash(stored_password, iterations=None):
+    """Checks whether a stored password should be re-hashed.
+
+    Plaintext passwords and hashes created with a different work factor both need rehashing.
+    """
+    return get_iterations(stored_password) != (iterations or get_work_factor())
+
+
+def hash_passwords(passwords, iterations=None, max_workers=None):
+    """Hashes many passwords at once, e.g. for bulk migration or bulk import.
+
+    hashlib releases the GIL while deriving keys, so a thread pool hashes in parallel
+    across all available cores.
+
+    Args:
+        passwords (list of str): Plaintext passwords.
+        iterations (int, optional): Work factor. Defaults to the configured work factor.
+        max_workers (int, optional): Number of threads. Defaults to the CPU count.
+
+    Returns:
+        list of str: The encoded hashes, in the same order as the passwords.
+    """
+    # Imported here, as concurrent.futures is slow to import and only bulk hashing needs it
+    from concurrent.futures import ThreadPoolExecutor
+
+    iterations = iterations or get_work_factor()
+    max_workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(lambda password: hash_password(password, iterations), passwords)
+        )
+
+
+class VerifiedCredentialCache:
+    """A bounded, in-memory LRU cache of recently verified credentials.
+
+    Only a keyed HMAC fingerprint of the password is kept, using a key that never leaves
+    the process. An entry is tied to the stored hash it was verified against, so a
+    password change or rehash invalidates it automatically.
+    """
+
+    def __init__(self, max_size=1024):
+        self.__max_size = max_size
+        self.__key = os.urandom(32)
+        self.__entries = OrderedDict()
+
+    def __fingerprint(self, password):
+        return hmac.new(self.__key, password.encode(), hashlib.sha256).digest()
+
+    def contains(self, username, stored_password, password):
+        """Checks whether this username/password pair was recently verified.
+
+        Returns:
+            bool: True on a cache hit, otherwise False.
+        """
+        entry = self.__entries.get(username)
+        if entry is None:
+            return False
+
+        cached_stored_password, fingerprint = entry
+        if cached_stored_password != stored_password or not hmac.compare_digest(
+            fingerprint, self.__fingerprint(password)
+        ):
+            return False
+
+        self.__entries.move_to_end(username)
+        return True
+
+    def add(self, username, stored_password, password):
+        """Remembers a successfully verified credential, evicting the oldest entry if full."""
+        self.__entries[username] = (stored_password, self.__fingerprint(password))
+        self.__entries.move_to_end(username)
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    def invalidate(self, username):
+        self.__entries.pop(username, None)
+
+    def __len__(self):
+        return len(self.__entries)
@@ -1,4 +1,5 @@
 import json
+import os
 from datetime import datetime
 from breeze.models.admin import Admin
 from breeze.models.mhwp import MHWP
@@ -6,6 +7,7 @@ from breeze.models.patient import Patient
 from breeze.models.appointment_entry import AppointmentEntry
 from breeze.models.journal_entry import JournalEntry
 from breeze.models.mood_entry import MoodEntry
+from breeze.utils.instrumentation import increment, timed
 
 
 def decode_user(user_data, appointments_data):
@@ -76,6 +78,7 @@ def decode_user(user_data, appointments_data):
     return user_data
 
 
+@timed("load_data")
 def load_data(file_path):
     """
     Loads and decodes user data from a JSON file.
@@ -89,6 +92,7 @@ def load_data(file_path):
     try:
         with open(file_path, "r") as file:
             data = json.load(file)
+            increment("bytes_read", file.tell())
 
             appointment_entries = create_appointments_from_data(
                 data.get("appointments", [])
@@ -109,6 +113,7 @@ def load_data(file_path):
         return {}, {}
 
 
+@timed("save_data")
 def save_data(file_path, user_object_list):
     """
     Saves data to a JSON file.
@@ -132,8 +137,14 @@ def save_data(file_path, user_object_list):
 
     data_to_save = {"appointments": appointments_dict_list, "users": users_dict_list}
 
-    with open(file_path, "w") as file:
+    # written next to the file and moved into place, so readers (e.g. the reporting
+    # process) always see a complete snapshot, never a half-written file
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "w") as file:
         json.dump(data_to_save, file, indent=4)
+        increment("saves")
+        increment("bytes_written", file.tell())
+    os.replace(temp_path, file_path)
 
         
 def create_appointments_from_data(appointments_data):
@@ -170,6 +181,26 @@ def create_appointments_from_data(appointments_data):
     return appointment_entries
 
 
+def create_journal_entry_from_data(entry):
+    """Convert a single journal entry (dictionary) into a JournalEntry object
+
+    Args:
+       entry (dict): A journal entry as stored in the data file
+
+    Returns:
+        JournalEntry: The decoded journal entry
+    """
+    dt = entry.get("date")
+    return JournalEntry(
+        entry.get("title"),
+        entry.get("text"),
+        dt[:10],
+        dt[11:],
+        journal_id=entry.get("id"),
+        last_update=entry.get("last_update")
+    )
+
+
 def create_journal_entries_from_data(journal_data):
     """Convert each journal entry (dictionary) into JournalEntry object
 
@@ -179,28 +210,26 @@ def create_journal_entries_from_data(journal_data):
     Returns:
         journal_entries: JournalEntry objects
     """
-    journal_entries = []
-
-    for entry in journal_data:
-        journal_id = entry.get("id")
-        title = entry.get("title")
-        body = entry.get("text")
-        dt = entry.get("date")
-        last_update = entry.get("last_update")
-        date = dt[:10]
-        time = dt[11:]
-        journal_entries.append(
-            JournalEntry(
-                title,
-                body,
-                date,
-                time,
-                journal_id=journal_id,
-                last_update=last_update
-            )
-        )
+    return [create_journal_entry_from_data(entry) for entry in journal_data]
 
-    return journal_entries
+
+def create_mood_entry_from_data(entry):
+    """Convert a single mood entry (dictionary) into a MoodEntry object
+
+    Args:
+       entry (dict): A mood entry as stored in the data file
+
+    Returns:
+        MoodEntry: The decoded mood entry
+    """
+    date_time = datetime.strptime(entry.get("date"), "%d-%m-%Y %H:%M:%S")
+    return MoodEntry(
+        entry.get("mood"),
+        entry.get("comment"),
+        date_time.date(),
+        date_time.time(),
+        mood_id=entry.get("id")
+    )
 
 
 def create_mood_entries_from_data(mood_data):
@@ -212,26 +241,7 @@ def create_mood_entries_from_data(mood_data):
     Returns:
         list of MoodEntry objects
     """
-    mood_entries = []
-
-    for entry in mood_data:
-        mood_id = entry.get("id")
-        mood = entry.get("mood")
-        comment = entry.get("comment")
-        dt = entry.get("date")
-        date = datetime.strptime(dt, "%d-%m-%Y %H:%M:%S").date()
-        time = datetime.strptime(dt, "%d-%m-%Y %H:%M:%S").time()
-        mood_entries.append(
-            MoodEntry(
-                mood,
-                comment,
-                date,
-                time,
-                mood_id=mood_id
-            )
-        )
-
-    return mood_entries
+    return [create_mood_entry_from_data(entry) for entry in mood_data]
 
 
 # for testing, to run: python -m breeze.utils.data_utils
@@ -0,0 +1,64 @@
+import weakref
+
+from breeze.utils.data_utils import create_journal_entry_from_data, create_mood_entry_from_data
+
+
+class DecodedEntryCache:
+    """Decoded journal or mood entries of one patient, keyed by entry id.
+
+    The whole cache is dropped as soon as the patient's version for that kind of entry
+    changes (an entry was added, edited or deleted), so a cached object is never stale.
+
+    Args:
+        patient (Patient): The patient the entries belong to. Only a weak reference is kept.
+        decode (callable): Converts a stored entry (dict) into a JournalEntry or MoodEntry.
+        get_version (callable): Returns the patient's current version for the entries.
+    """
+
+    def __init__(self, patient, decode, get_version):
+        self.__patient = weakref.ref(patient)
+        self.__decode = decode
+        self.__get_version = get_version
+        self.__version = None
+        self.__entries = {}
+
+    def decode(self, entry):
+        """Returns the decoded entry, decoding it only if it is not cached yet."""
+        version = self.__get_version(self.__patient())
+        if version != self.__version:
+            self.__entries = {}
+            self.__version = version
+
+        entry_id = entry.get("id")
+        decoded = self.__entries.get(entry_id)
+        if decoded is None:
+            decoded = self.__entries[entry_id] = self.__decode(entry)
+        return decoded
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+# Caches live as long as their patient does
+_journal_caches = weakref.WeakKeyDictionary()
+_mood_caches = weakref.WeakKeyDictionary()
+
+
+def get_journal_cache(patient):
+    """Returns the decoded journal entry cache of a patient."""
+    cache = _journal_caches.get(patient)
+    if cache is None:
+        cache = _journal_caches[patient] = DecodedEntryCache(
+            patient, create_journal_entry_from_data, type(patient).get_journal_version
+        )
+    return cache
+
+
+def get_mood_cache(patient):
+    """Returns the decoded mood entry cache of a patient."""
+    cache = _mood_caches.get(patient)
+    if cache is None:
+        cache = _mood_caches[patient] = DecodedEntryCache(
+            patient, create_mood_entry_from_data, type(patient).get_mood_version
+        )
+    return cache
@@ -0,0 +1,85 @@
+import bisect
+
+
+def get_timestamp_key(timestamp):
+    """Sort key of a stored "DD-MM-YYYY" or "DD-MM-YYYY HH:MM:SS" timestamp ("YYYYMMDDHH:MM:SS")."""
+    return timestamp[6:10] + timestamp[3:5] + timestamp[:2] + timestamp[11:]
+
+
+def get_entry_date_key(entry):
+    """Sort key of a stored journal or mood entry."""
+    return get_timestamp_key(entry["date"])
+
+
+class EntryMap:
+    """Journal or mood entries (dicts with an "id" and a "date") keyed by id, in date order.
+
+    Entries are looked up, edited and deleted by id in O(1) through a dict, while a sorted
+    list of (date key, id) pairs keeps the chronological order, so iterating over the map
+    or indexing it by position gives the entries oldest first, like the stored list.
+
+    Args:
+        entries (iterable of dict, optional): The initial entries.
+    """
+
+    def __init__(self, entries=()):
+        self.__entries = {entry["id"]: entry for entry in entries}
+        self.__order = sorted(
+            (get_entry_date_key(entry), entry_id) for entry_id, entry in self.__entries.items()
+        )
+
+    def add(self, entry):
+        """Adds an entry, replacing any entry with the same id.
+
+        Returns:
+            dict: The replaced entry, or None.
+        """
+        replaced = self.remove(entry["id"])
+        self.__entries[entry["id"]] = entry
+        # new entries are usually the latest, so this is normally an append
+        bisect.insort(self.__order, (get_entry_date_key(entry), entry["id"]))
+        return replaced
+
+    def get(self, entry_id):
+        return self.__entries.get(entry_id)
+
+    def update(self, entry_id, **fields):
+        """Updates fields of an entry in place. The date of an entry cannot be changed.
+
+        Returns:
+            dict: The updated entry, or None if there is no entry with that id.
+        """
+        entry = self.__entries.get(entry_id)
+        if entry is not None:
+            entry.update(fields)
+        return entry
+
+    def remove(self, entry_id):
+        """Removes an entry by id.
+
+        Returns:
+            dict: The removed entry, or None if there is no entry with that id.
+        """
+        entry = self.__entries.pop(entry_id, None)
+        if entry is not None:
+            position = bisect.bisect_left(self.__order, (get_entry_date_key(entry), entry_id))
+            del self.__order[position]
+        return entry
+
+    def __contains__(self, entry_id):
+        return entry_id in self.__entries
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __iter__(self):
+        for _, entry_id in self.__order:
+            yield self.__entries[entry_id]
+
+    def __getitem__(self, position):
+        """Returns the entry at a chronological position (supports negative positions)."""
+        return self.__entries[self.__order[position][1]]
+
+    def to_list(self):
+        """Returns the entries oldest first, in the form they are saved in."""
+        return list(self)
@@ -0,0 +1,230 @@
+import bisect
+import datetime
+import weakref
+from collections import OrderedDict
+
+from breeze.utils.entry_map import get_entry_date_key
+from breeze.utils.instrumentation import increment, timed
+
+MAX_CACHED_QUERIES = 32
+
+
+class HistoryQuery:
+    """An immutable set of filters over a patient's history.
+
+    Filters stack: each one narrows the results of the others. Unset filters are None.
+
+    Args:
+        text (str, optional): Search term matched against the entry text.
+        mood (str, optional): Mood level, e.g. "Happy" (mood entries only).
+        start_date (datetime.date, optional): First day to include.
+        end_date (datetime.date, optional): Last day to include.
+        mhwp (str, optional): MHWP username (appointments only).
+    """
+
+    FIELDS = ("text", "mood", "start_date", "end_date", "mhwp")
+
+    def __init__(self, text=None, mood=None, start_date=None, end_date=None, mhwp=None):
+        self.text = text
+        self.mood = mood
+        self.start_date = start_date
+        self.end_date = end_date
+        self.mhwp = mhwp
+
+    def key(self):
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    def with_filter(self, **filters):
+        """Returns a copy of the query with the given filters added or replaced."""
+        values = {field: getattr(self, field) for field in self.FIELDS}
+        values.update(filters)
+        return HistoryQuery(**values)
+
+    def is_empty(self):
+        return all(value is None for value in self.key())
+
+    def describe(self):
+        """Returns a short, human readable summary of the active filters."""
+        parts = []
+        if self.text:
+            parts.append(f"'{self.text}'")
+        if self.mood:
+            parts.append(f"mood {self.mood}")
+        if self.mhwp:
+            parts.append(f"MHWP {self.mhwp}")
+        if self.start_date or self.end_date:
+            start = self.start_date.strftime("%d-%m-%Y") if self.start_date else "the start"
+            end = self.end_date.strftime("%d-%m-%Y") if self.end_date else "today"
+            parts.append(f"from {start} to {end}")
+        return ", ".join(parts)
+
+
+def get_appointment_date_key(appointment):
+    return appointment.date.strftime("%Y%m%d") + str(appointment.time)
+
+
+def get_day_key(date):
+    return date.strftime("%Y%m%d")
+
+
+class HistoryQueryEngine:
+    """Answers HistoryQuery objects over one kind of patient history.
+
+    Items are kept in a date-sorted index that is rebuilt only when the patient's version
+    changes. A date range is found by binary search, and the remaining filters are applied
+    lazily, one generator stage at a time, to the items inside that range. A text query
+    starts from the ranked search results instead, so the ranking is kept. Results are
+    cached per query until the history changes.
+
+    Args:
+        patient (Patient): The patient whose history is queried. Only a weak reference is kept.
+        get_items (callable): Returns the items (entries or appointments) of a patient.
+        get_version (callable): Returns the patient's version for the items.
+        get_date_key (callable): Returns a sortable "YYYYMMDD..." key for an item.
+        search (callable): Returns the ids of a patient's items matching a search term,
+            best match first.
+        get_id (callable): Returns the id of an item.
+    """
+
+    def __init__(self, patient, get_items, get_version, get_date_key, search, get_id):
+        self.__patient = weakref.ref(patient)
+        self.__get_items = get_items
+        self.__get_version = get_version
+        self.__get_date_key = get_date_key
+        self.__search = search
+        self.__get_id = get_id
+        self.__version = None
+        self.__keys = []
+        self.__items = []
+        self.__keyed_items_by_id = {}
+        self.__results = OrderedDict()
+
+    def __refresh(self):
+        patient = self.__patient()
+        version = self.__get_version(patient)
+        if version == self.__version:
+            return
+        indexed = sorted(
+            (
+                (self.__get_date_key(item), position, item)
+                for position, item in enumerate(self.__get_items(patient))
+            ),
+            key=lambda indexed_item: indexed_item[:2],
+        )
+        self.__keys = [key for key, _, _ in indexed]
+        self.__items = [item for _, _, item in indexed]
+        self.__keyed_items_by_id = {self.__get_id(item): (key, item) for key, _, item in indexed}
+        self.__results.clear()
+        self.__version = version
+
+    def __iter_date_range(self, start_date, end_date):
+        lower = bisect.bisect_left(self.__keys, get_day_key(start_date)) if start_date else 0
+        upper = (
+            bisect.bisect_left(self.__keys, get_day_key(end_date + datetime.timedelta(days=1)))
+            if end_date
+            else len(self.__keys)
+        )
+        for position in range(lower, upper):
+            yield self.__items[position]
+
+    def __iter_ranked(self, text, start_date, end_date):
+        """Yields the items matching a search term within a date range, best match last."""
+        lower = get_day_key(start_date) if start_date else ""
+        upper = get_day_key(end_date + datetime.timedelta(days=1)) if end_date else None
+        for item_id in reversed(self.__search(self.__patient(), text)):
+            keyed_item = self.__keyed_items_by_id.get(item_id)
+            if keyed_item is None:
+                continue
+            key, item = keyed_item
+            if key >= lower and (upper is None or key < upper):
+                yield item
+
+    def iter_results(self, query):
+        """Lazily yields the items matching the query.
+
+        Items come oldest first or, for a text query, in reverse rank order. History pages
+        show the last item first, so either way the newest or best match is shown first.
+        """
+        self.__refresh()
+        if query.text:
+            items = self.__iter_ranked(query.text, query.start_date, query.end_date)
+        else:
+            items = self.__iter_date_range(query.start_date, query.end_date)
+        if query.mood:
+            items = (item for item in items if item.get("mood") == query.mood)
+        if query.mhwp:
+            items = (item for item in items if item.mhwp_username == query.mhwp)
+        return items
+
+    @timed("history.search")
+    def run(self, query):
+        """Returns the items matching the query, in the order of iter_results.
+
+        Returns:
+            list: The matching items. Callers must not modify it, as it is cached.
+        """
+        self.__refresh()
+        key = query.key()
+        results = self.__results.get(key)
+        if results is None:
+            increment("history.cache_misses")
+            results = self.__results[key] = list(self.iter_results(query))
+            if len(self.__results) > MAX_CACHED_QUERIES:
+                self.__results.popitem(last=False)
+        else:
+            increment("history.cache_hits")
+            self.__results.move_to_end(key)
+        return results
+
+
+def get_summarised_appointments(patient):
+    return [app for app in patient.get_appointments() if app.summary is not None]
+
+
+# Engines live as long as their patient does
+_journal_engines = weakref.WeakKeyDictionary()
+_mood_engines = weakref.WeakKeyDictionary()
+_appointment_engines = weakref.WeakKeyDictionary()
+
+
+def get_journal_query_engine(patient):
+    engine = _journal_engines.get(patient)
+    if engine is None:
+        engine = _journal_engines[patient] = HistoryQueryEngine(
+            patient,
+            type(patient).get_journal_entries,
+            type(patient).get_journal_version,
+            get_entry_date_key,
+            type(patient).search_journal_entries,
+            lambda journal: journal["id"],
+        )
+    return engine
+
+
+def get_mood_query_engine(patient):
+    engine = _mood_engines.get(patient)
+    if engine is None:
+        engine = _mood_engines[patient] = HistoryQueryEngine(
+            patient,
+            type(patient).get_mood_entries,
+            type(patient).get_mood_version,
+            get_entry_date_key,
+            type(patient).search_mood_entries,
+            lambda mood: mood["id"],
+        )
+    return engine
+
+
+def get_appointment_query_engine(patient):
+    """Query engine over the appointments of a patient that have a summary."""
+    engine = _appointment_engines.get(patient)
+    if engine is None:
+        engine = _appointment_engines[patient] = HistoryQueryEngine(
+            patient,
+            get_summarised_appointments,
+            type(patient).get_appointment_version,
+            get_appointment_date_key,
+            type(patient).search_appointments,
+            lambda appointment: appointment.get_id(),
+        )
+    return engine
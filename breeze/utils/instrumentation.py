@@ -0,0 +1,167 @@
+"""Opt-in timers, counters and profiling for finding where time goes in a session.
+
+Everything here is a no-op until enable() is called, which main.py does when the
+BREEZE_INSTRUMENT environment variable or the --instrument flag is set. When enabled,
+timers record the count, total and worst duration of each named operation, counters
+accumulate values such as bytes written, and on exit the metrics (and optionally a
+cProfile profile) are written to files.
+"""
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+INSTRUMENT_ENV_VAR = "BREEZE_INSTRUMENT"
+METRICS_FILE_ENV_VAR = "BREEZE_METRICS_FILE"
+METRICS_INTERVAL_ENV_VAR = "BREEZE_METRICS_INTERVAL"
+PROFILE_FILE_ENV_VAR = "BREEZE_PROFILE_FILE"
+DEFAULT_METRICS_FILE = "breeze_metrics.json"
+
+_enabled = False
+_timers = {}
+_counters = {}
+_lock = threading.Lock()
+
+
+def is_enabled():
+    return _enabled
+
+
+def is_requested_by_environment():
+    """Returns True if the BREEZE_INSTRUMENT environment variable asks for instrumentation."""
+    return os.environ.get(INSTRUMENT_ENV_VAR, "").strip().lower() not in ("", "0", "false", "no")
+
+
+def record_time(name, seconds):
+    """Adds one duration to a named timer."""
+    with _lock:
+        stats = _timers.get(name)
+        if stats is None:
+            stats = _timers[name] = {"count": 0, "total_s": 0.0, "max_s": 0.0}
+        stats["count"] += 1
+        stats["total_s"] += seconds
+        stats["max_s"] = max(stats["max_s"], seconds)
+
+
+def increment(name, amount=1):
+    """Adds an amount to a named counter, if instrumentation is enabled."""
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + amount
+
+
+@contextlib.contextmanager
+def timer(name):
+    """Times the body of a with block under a name, if instrumentation is enabled."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_time(name, time.perf_counter() - start)
+
+
+def timed(name):
+    """Decorator that times every call of a function under a name."""
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record_time(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def get_metrics():
+    """Returns a snapshot of every timer and counter."""
+    with _lock:
+        timers = {
+            name: dict(stats, mean_s=stats["total_s"] / stats["count"])
+            for name, stats in _timers.items()
+        }
+        return {"timers": timers, "counters": dict(_counters)}
+
+
+def write_metrics(file_path):
+    """Writes the current metrics to a JSON file, replacing it in one step."""
+    metrics = get_metrics()
+    metrics["written"] = time.strftime("%d-%m-%Y %H:%M:%S")
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "w") as file:
+        json.dump(metrics, file, indent=4)
+    os.replace(temp_path, file_path)
+
+
+def _write_periodically(file_path, interval, stop_event):
+    while not stop_event.wait(interval):
+        write_metrics(file_path)
+
+
+def enable(metrics_path=DEFAULT_METRICS_FILE, profile_path=None, interval=None):
+    """Turns instrumentation on for the rest of the process.
+
+    Args:
+        metrics_path (str, optional): File the metrics summary is written to on exit.
+        profile_path (str, optional): File to dump a cProfile profile to on exit, readable
+            with pstats. Defaults to no profiling.
+        interval (float, optional): Also write the metrics every this many seconds.
+    """
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+
+    profiler = None
+    if profile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    stop_event = threading.Event()
+    if interval:
+        threading.Thread(
+            target=_write_periodically,
+            args=(metrics_path, interval, stop_event),
+            daemon=True,
+        ).start()
+
+    def write_on_exit():
+        stop_event.set()
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        if metrics_path:
+            write_metrics(metrics_path)
+
+    atexit.register(write_on_exit)
+
+
+def enable_from_environment(metrics_path=None, profile_path=None, interval=None):
+    """Enables instrumentation, taking any setting not passed in from the environment.
+
+    Reads BREEZE_METRICS_FILE, BREEZE_PROFILE_FILE and BREEZE_METRICS_INTERVAL (seconds).
+    """
+    if interval is None:
+        try:
+            interval = float(os.environ.get(METRICS_INTERVAL_ENV_VAR, ""))
+        except ValueError:
+            interval = None
+    enable(
+        metrics_path=metrics_path or os.environ.get(METRICS_FILE_ENV_VAR) or DEFAULT_METRICS_FILE,
+        profile_path=profile_path or os.environ.get(PROFILE_FILE_ENV_VAR) or None,
+        interval=interval if interval and interval > 0 else None,
+    )
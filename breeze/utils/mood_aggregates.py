@@ -0,0 +1,110 @@
+import bisect
+import datetime
+
+MOOD_LEVELS = {
+    "Very Sad": 1,
+    "Sad": 2,
+    "Neutral": 3,
+    "Happy": 4,
+    "Very Happy": 5,
+}
+
+GRANULARITIES = ("day", "week", "month")
+
+
+def parse_entry_date(date_str):
+    """Returns the date of a stored "DD-MM-YYYY HH:MM:SS" timestamp without calling strptime."""
+    return datetime.date(int(date_str[6:10]), int(date_str[3:5]), int(date_str[:2]))
+
+
+def get_bucket_start(date, granularity):
+    """Returns the first day of the day, week (Monday) or month bucket containing the date."""
+    if granularity == "day":
+        return date
+    if granularity == "week":
+        return date - datetime.timedelta(days=date.weekday())
+    if granularity == "month":
+        return date.replace(day=1)
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+class MoodAggregates:
+    """Daily, weekly and monthly histograms of mood levels, maintained incrementally.
+
+    Each bucket holds one count per mood level (index 0 is "Very Sad"). Adding or removing
+    a mood entry touches one bucket per granularity, so charts and trends never need to
+    rescan or re-parse a patient's full mood history.
+
+    Args:
+        mood_entries (iterable of dict, optional): Stored mood entries to start from.
+    """
+
+    def __init__(self, mood_entries=()):
+        self.__buckets = {granularity: {} for granularity in GRANULARITIES}
+        self.__bucket_dates = {granularity: [] for granularity in GRANULARITIES}
+        for entry in mood_entries:
+            self.add(entry)
+
+    def __update(self, entry, delta):
+        level = MOOD_LEVELS.get(entry.get("mood"))
+        if level is None:
+            return
+        date = parse_entry_date(entry["date"])
+        for granularity in GRANULARITIES:
+            buckets = self.__buckets[granularity]
+            bucket_start = get_bucket_start(date, granularity)
+            counts = buckets.get(bucket_start)
+            if counts is None:
+                counts = buckets[bucket_start] = [0] * len(MOOD_LEVELS)
+                bisect.insort(self.__bucket_dates[granularity], bucket_start)
+            counts[level - 1] += delta
+            if not any(counts):
+                del buckets[bucket_start]
+                bucket_dates = self.__bucket_dates[granularity]
+                del bucket_dates[bisect.bisect_left(bucket_dates, bucket_start)]
+
+    def add(self, entry):
+        """Counts a stored mood entry (dict with "mood" and "date")."""
+        self.__update(entry, 1)
+
+    def remove(self, entry):
+        """Stops counting a stored mood entry that was previously added."""
+        self.__update(entry, -1)
+
+    def get_buckets(self, granularity="day", start_date=None, end_date=None, last=None):
+        """Returns the non-empty buckets that start within a window, oldest first.
+
+        Args:
+            granularity (str, optional): "day", "week" or "month". Defaults to "day".
+            start_date (datetime.date, optional): Earliest bucket start to include.
+            end_date (datetime.date, optional): Latest bucket start to include.
+            last (int, optional): Only return this many of the latest buckets in the window.
+
+        Returns:
+            list of tuple: (bucket start date, list of counts per mood level)
+        """
+        bucket_dates = self.__bucket_dates[granularity]
+        lower = bisect.bisect_left(bucket_dates, start_date) if start_date else 0
+        upper = bisect.bisect_right(bucket_dates, end_date) if end_date else len(bucket_dates)
+        if last:
+            lower = max(lower, upper - last)
+        buckets = self.__buckets[granularity]
+        return [(date, buckets[date]) for date in bucket_dates[lower:upper]]
+
+    def get_date_range(self):
+        """Returns the (first, last) days with moods, or None if there are none."""
+        bucket_dates = self.__bucket_dates["day"]
+        return (bucket_dates[0], bucket_dates[-1]) if bucket_dates else None
+
+    def get_average(self, granularity="day", start_date=None, end_date=None):
+        """Returns (bucket start date, average mood level) for each bucket in a window."""
+        averages = []
+        for date, counts in self.get_buckets(granularity, start_date, end_date):
+            total = sum(counts)
+            averages.append(
+                (date, sum(level * count for level, count in enumerate(counts, 1)) / total)
+            )
+        return averages
+
+    def __len__(self):
+        return sum(sum(counts) for counts in self.__buckets["month"].values())
@@ -1,42 +1,92 @@
-from datetime import datetime
+import datetime
 
+from breeze.utils.mood_aggregates import MOOD_LEVELS, MoodAggregates
 
-def plot_mood_chart(mood_entries):
+BUCKET_LABEL_FORMATS = {
+    "day": "%b %d",
+    "week": "%b %d",
+    "month": "%b %y",
+}
+
+
+def plot_mood_chart(
+    mood_data, granularity="day", start_date=None, end_date=None, max_columns=None
+):
     """
     Plots a simple ASCII mood chart with month and date on the x-axis.
+
+    The chart is drawn from pre-aggregated mood buckets, so its cost depends on the number
+    of columns shown rather than on the number of mood entries.
+
+    Args:
+        mood_data (MoodAggregates or list of dict): Aggregated moods, or stored mood entries.
+        granularity (str, optional): "day", "week" or "month" per column. Defaults to "day".
+        start_date (datetime.date, optional): First bucket to show.
+        end_date (datetime.date, optional): Last bucket to show.
+        max_columns (int, optional): Only show this many of the most recent buckets.
     """
-    mood_levels = {
-        "Very Sad": 1,
-        "Sad": 2,
-        "Neutral": 3,
-        "Happy": 4,
-        "Very Happy": 5,
-    }
-
-    dates = [
-        datetime.strptime(entry["date"], "%d-%m-%Y %H:%M:%S").date()
-        for entry in mood_entries
-    ]
-    moods = [mood_levels[entry["mood"]] for entry in mood_entries]
-    unique_dates = sorted(set(dates))
+    aggregates = (
+        mood_data if isinstance(mood_data, MoodAggregates) else MoodAggregates(mood_data)
+    )
+    buckets = aggregates.get_buckets(granularity, start_date, end_date, last=max_columns)
 
     cell_width = 7  # Width of each date column
-    print("\nMood Chart")
-    print("-" * (len(unique_dates) * cell_width + 11))  # Adjust line length dynamically
+    title = {"day": "Mood Chart", "week": "Weekly Mood Chart", "month": "Monthly Mood Chart"}
+    print(f"\n{title[granularity]}")
+    print("-" * (len(buckets) * cell_width + 11))  # Adjust line length dynamically
 
     # Print y-axis and mood points
-    for level_name, level in sorted(mood_levels.items(), key=lambda x: -x[1]):
+    for level_name, level in sorted(MOOD_LEVELS.items(), key=lambda x: -x[1]):
         row = f"{level_name:<10}|"
-        for date in unique_dates:
+        for _, counts in buckets:
             # Center the * in the cell
-            row += f"{' * ' if any(mood == level and date == d for d, mood in zip(dates, moods)) else '   ':^{cell_width}}"
+            row += f"{' * ' if counts[level - 1] else '   ':^{cell_width}}"
         print(row)
 
     # Print x-axis
-    print(
-        " " * 11 + "-" * (len(unique_dates) * cell_width)
-    )  # Adjust x-axis line length
+    print(" " * 11 + "-" * (len(buckets) * cell_width))  # Adjust x-axis line length
+    label_format = BUCKET_LABEL_FORMATS[granularity]
     x_labels = " " * 11 + "".join(
-        f"{date.strftime('%b %d'):<{cell_width}}" for date in unique_dates
+        f"{date.strftime(label_format):<{cell_width}}" for date, _ in buckets
     )
     print(x_labels)
+
+
+def print_mood_trends(analytics, days=14, window_days=7, today=None):
+    """
+    Prints mood trends across a group of patients: the recent mood distribution, the rolling
+    average mood for each recent day and the patients whose mood is declining.
+
+    Args:
+        analytics (MoodAnalytics): Mood points of the patients to summarise.
+        days (int, optional): Number of recent days to report on. Defaults to 14.
+        window_days (int, optional): Days in each rolling average. Defaults to 7.
+        today (datetime.date, optional): Last day to report on. Defaults to today.
+    """
+    today = today or datetime.date.today()
+    start_date = today - datetime.timedelta(days=days - 1)
+    print(f"\nMood points: {len(analytics)} across {len(analytics.usernames)} patient(s)")
+
+    distribution = analytics.get_distribution(start_date, today)
+    total = sum(distribution.values())
+    print(f"\nMood distribution over the last {days} days")
+    for level_name, count in sorted(distribution.items(), key=lambda x: -MOOD_LEVELS[x[0]]):
+        share = count / total if total else 0
+        print(f"{level_name:<10}| {'#' * round(share * 40):<40} {count:>6} ({share:.0%})")
+
+    print(f"\n{window_days}-day rolling average mood (1 = Very Sad, 5 = Very Happy)")
+    averages = analytics.get_rolling_average(window_days, start_date, today)
+    if averages:
+        for date, average in averages:
+            print(f"{date.strftime('%b %d'):<10}| {'#' * round(average * 8):<40} {average:.2f}")
+    else:
+        print("  No mood records in this period.")
+
+    declining = analytics.get_declining_patients(recent_days=days, today=today)
+    print(f"\nPatients with a declining mood ({len(declining)})")
+    if declining:
+        print(f"{'Patient':<15} | {'Before':>6} | {'Recent':>6}")
+        for username, baseline, recent in declining:
+            print(f"{username:<15} | {baseline:>6.2f} | {recent:>6.2f}")
+    else:
+        print("  No declining moods detected.")
@@ -0,0 +1,93 @@
+"""Central pacing for pauses in the CLI, e.g. after a message is shown.
+
+Screens call pause() instead of time.sleep(), and the deployment decides what a pause
+does through the BREEZE_PACING environment variable or main.py's --pacing flag:
+
+- "sleep" (default): wait, with the duration multiplied by BREEZE_PACING_SCALE.
+- "none": do not wait at all, for power users, tests and load runs.
+- "prompt": wait for the user to press Enter instead of a fixed time.
+
+The time spent waiting is tracked, and also recorded by the instrumentation when enabled.
+"""
+import os
+import time
+
+from breeze.utils.instrumentation import increment, is_enabled, record_time
+
+PACING_ENV_VAR = "BREEZE_PACING"
+PACING_SCALE_ENV_VAR = "BREEZE_PACING_SCALE"
+PACING_POLICIES = ("sleep", "none", "prompt")
+DEFAULT_POLICY = "sleep"
+CONTINUE_PROMPT = "Press Enter to continue..."
+
+_policy = None
+_scale = 1.0
+_stats = {"pauses": 0, "requested_s": 0.0, "waited_s": 0.0}
+
+
+def _read_environment():
+    global _policy, _scale
+    policy = os.environ.get(PACING_ENV_VAR, "").strip().lower()
+    _policy = policy if policy in PACING_POLICIES else DEFAULT_POLICY
+    try:
+        _scale = max(float(os.environ.get(PACING_SCALE_ENV_VAR, "")), 0.0)
+    except ValueError:
+        _scale = 1.0
+
+
+def set_policy(policy, scale=None):
+    """Chooses what pauses do for the rest of the process, overriding the environment.
+
+    Args:
+        policy (str): "sleep", "none" or "prompt".
+        scale (float, optional): Multiplier for sleep durations. Defaults to unchanged.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    global _policy, _scale
+    if policy not in PACING_POLICIES:
+        raise ValueError(f"Unknown pacing policy: {policy}")
+    if _policy is None:
+        _read_environment()
+    _policy = policy
+    if scale is not None:
+        _scale = max(scale, 0.0)
+
+
+def get_policy():
+    if _policy is None:
+        _read_environment()
+    return _policy
+
+
+def pause(seconds):
+    """Pauses after a message so the user can read it, as the pacing policy decides.
+
+    Args:
+        seconds (float): How long the screen would sleep with the default policy.
+    """
+    policy = get_policy()
+    _stats["pauses"] += 1
+    _stats["requested_s"] += seconds
+    if is_enabled():
+        increment("pacing.pauses")
+        increment("pacing.requested_ms", round(seconds * 1000))
+    if policy == "none":
+        return
+
+    start = time.perf_counter()
+    if policy == "prompt":
+        input(CONTINUE_PROMPT)
+    else:
+        time.sleep(seconds * _scale)
+    waited = time.perf_counter() - start
+
+    _stats["waited_s"] += waited
+    if is_enabled():
+        record_time("pacing.wait", waited)
+
+
+def get_pacing_stats():
+    """Returns the number of pauses, the seconds they asked for and the seconds waited."""
+    return dict(_stats)
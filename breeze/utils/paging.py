@@ -0,0 +1,69 @@
+from math import ceil
+
+PAGE_SIZE = 10
+
+
+class ReversePagedView:
+    """A newest-first, paged view over a chronologically ordered sequence.
+
+    Pages are read straight from the underlying sequence by position, walking backwards from
+    the end, so rendering a page costs O(page size) no matter how long the history is. Items
+    are only decoded (e.g. from dicts into JournalEntry objects) when they are on a page.
+
+    Args:
+        items (sequence): Items in chronological order (oldest first).
+        decode (callable, optional): Converts a raw item into the object to display.
+        page_size (int, optional): Number of items per page. Defaults to 10.
+    """
+
+    def __init__(self, items, decode=None, page_size=PAGE_SIZE):
+        self.__items = items
+        self.__decode = decode
+        self.__page_size = page_size
+        self.__decoded = {}
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __getitem__(self, position):
+        """Returns the item at a newest-first position (0 is the newest item)."""
+        if not 0 <= position < len(self.__items):
+            raise IndexError("paged view index out of range")
+        item_index = len(self.__items) - 1 - position
+        if self.__decode is None:
+            return self.__items[item_index]
+        if item_index not in self.__decoded:
+            self.__decoded[item_index] = self.__decode(self.__items[item_index])
+        return self.__decoded[item_index]
+
+    def get_page_count(self):
+        return ceil(len(self.__items) / self.__page_size)
+
+    def has_page(self, page_no):
+        return page_no >= 1 and len(self.__items) > (page_no - 1) * self.__page_size
+
+    def has_next_page(self, page_no):
+        return len(self.__items) > page_no * self.__page_size
+
+    def get_page(self, page_no):
+        """Returns the items on a 1-based page, newest first."""
+        start = (page_no - 1) * self.__page_size
+        stop = min(start + self.__page_size, len(self.__items))
+        return [self[position] for position in range(start, stop)]
+
+    def get(self, page_no, index):
+        """Returns the item shown at a 1-based index on a 1-based page.
+
+        Raises:
+            IndexError: If there is no item at that index.
+        """
+        if not 1 <= index <= self.__page_size:
+            raise IndexError("page index out of range")
+        return self[(page_no - 1) * self.__page_size + index - 1]
+
+
+def as_paged_view(data, page_size=PAGE_SIZE):
+    """Wraps a chronological list in a ReversePagedView, unless it already is one."""
+    if isinstance(data, ReversePagedView):
+        return data
+    return ReversePagedView(data, page_size=page_size)
@@ -0,0 +1,99 @@
+import bisect
+import difflib
+from itertools import islice
+
+
+class PrefixIndex:
+    """A sorted prefix index from case-folded search terms to keys (e.g. usernames).
+
+    Every (term, key) pair is kept in one sorted list, so a prefix lookup is a binary
+    search followed by a walk over the contiguous range of matching terms. Results are
+    produced lazily, which keeps search-as-you-type and paging cheap for large indexes.
+    """
+
+    def __init__(self):
+        self.__entries = []
+        self.__terms_by_key = {}
+
+    @staticmethod
+    def __normalise_terms(terms):
+        return {term.strip().casefold() for term in terms if term and term.strip()}
+
+    def build(self, items):
+        """Rebuilds the whole index in one sort.
+
+        Args:
+            items (iterable of (key, terms)): The keys and their searchable terms.
+        """
+        self.__terms_by_key = {key: self.__normalise_terms(terms) for key, terms in items}
+        self.__entries = sorted(
+            (term, key) for key, terms in self.__terms_by_key.items() for term in terms
+        )
+
+    def add(self, key, terms):
+        """Adds a key to the index, replacing any terms it was indexed under before."""
+        self.remove(key)
+        terms = self.__normalise_terms(terms)
+        for term in terms:
+            bisect.insort(self.__entries, (term, key))
+        self.__terms_by_key[key] = terms
+
+    def remove(self, key):
+        """Removes a key and all of its terms from the index."""
+        for term in self.__terms_by_key.pop(key, ()):
+            position = bisect.bisect_left(self.__entries, (term, key))
+            if position < len(self.__entries) and self.__entries[position] == (term, key):
+                del self.__entries[position]
+
+    def iter_prefix(self, prefix):
+        """Yields each key with a term starting with the prefix once, in term order."""
+        seen = set()
+        for _, key in self.__range(prefix.strip().casefold()):
+            if key not in seen:
+                seen.add(key)
+                yield key
+
+    def search(self, prefix, page=1, page_size=10):
+        """Returns one page of keys matching the prefix.
+
+        Args:
+            prefix (str): The (partial) search term.
+            page (int, optional): 1-based page number. Defaults to 1.
+            page_size (int, optional): Number of keys per page. Defaults to 10.
+
+        Returns:
+            tuple: (list of keys on the page, bool whether there is a next page)
+        """
+        start = (page - 1) * page_size
+        keys = list(islice(self.iter_prefix(prefix), start, start + page_size + 1))
+        return keys[:page_size], len(keys) > page_size
+
+    def fuzzy_search(self, term, limit=10, cutoff=0.6):
+        """Returns keys whose terms closely match a (possibly misspelt) term.
+
+        Only terms sharing the first character are compared, which keeps the candidate set
+        small without a full scan.
+        """
+        term = term.strip().casefold()
+        if not term:
+            return []
+
+        candidates = {}
+        for candidate, key in islice(self.__range(term[0]), 5000):
+            candidates.setdefault(candidate, []).append(key)
+
+        keys = []
+        for match in difflib.get_close_matches(term, candidates, n=limit, cutoff=cutoff):
+            for key in candidates[match]:
+                if key not in keys:
+                    keys.append(key)
+        return keys[:limit]
+
+    def __range(self, prefix):
+        position = bisect.bisect_left(self.__entries, (prefix,))
+        while position < len(self.__entries) and self.__entries[position][0].startswith(prefix):
+            yield self.__entries[position]
+            position += 1
+
+    def __len__(self):
+        return len(self.__terms_by_key)
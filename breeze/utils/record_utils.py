@@ -0,0 +1,79 @@
+import csv
+import json
+import os
+
+RECORD_FORMATS = ("csv", "jsonl")
+
+
+def get_record_format(file_path):
+    """Returns "csv" or "jsonl" from a file's extension.
+
+    Raises:
+        ValueError: If the extension is neither .csv nor .jsonl.
+    """
+    extension = os.path.splitext(file_path)[1].lower().lstrip(".")
+    if extension not in RECORD_FORMATS:
+        raise ValueError(f"Unsupported file type: {file_path} (expected .csv or .jsonl)")
+    return extension
+
+
+def read_records(file_path):
+    """Reads records from a CSV or JSONL file one at a time.
+
+    Empty CSV cells are read as None, so both formats give the same records.
+
+    Yields:
+        tuple: (line number, record dict). The record is None for a JSONL line that is
+            not a JSON object, so one bad line does not stop the rest. Blank lines are skipped.
+    """
+    record_format = get_record_format(file_path)
+    with open(file_path, newline="" if record_format == "csv" else None) as file:
+        if record_format == "csv":
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, {
+                    field: value if value != "" else None for field, value in record.items()
+                }
+            return
+
+        for line_no, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield line_no, record if isinstance(record, dict) else None
+
+
+def write_records(file_path, fieldnames, records):
+    """Writes records to a CSV or JSONL file one at a time.
+
+    The file is written next to the destination and moved into place once complete, so
+    an interrupted export never leaves a partial file behind.
+
+    Args:
+        file_path (str): The .csv or .jsonl file to write.
+        fieldnames (list of str): The fields of each record, in column order.
+        records (iterable of dict): The records. Can be a generator.
+
+    Returns:
+        int: The number of records written.
+    """
+    record_format = get_record_format(file_path)
+    temp_path = f"{file_path}.tmp"
+    written = 0
+    with open(temp_path, "w", newline="" if record_format == "csv" else None) as file:
+        if record_format == "csv":
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                written += 1
+        else:
+            for record in records:
+                file.write(json.dumps({field: record.get(field) for field in fieldnames}))
+                file.write("\n")
+                written += 1
+    os.replace(temp_path, file_path)
+    return written
@@ -0,0 +1,118 @@
+"""Buffered screen output for the CLI.
+
+Printing a screen line by line (or cell by cell) costs one terminal write per line when
+stdout is a terminal. buffered_output() collects everything printed inside a with block
+and writes it once, and PagedScreen does the same for paged views while only redrawing
+the lines that changed since its previous frame.
+"""
+import io
+import os
+import shutil
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+from breeze.utils.instrumentation import increment
+
+# Move the cursor home, clear the screen and its scrollback, as "clear" does
+CLEAR_SCREEN_SEQUENCE = "\033[H\033[2J\033[3J"
+CLEAR_LINE_END = "\033[K"
+CLEAR_SCREEN_END = "\033[J"
+# Rows kept free below a redrawn frame for prompts and messages, so the screen never
+# scrolls between frames and the rows of the previous frame stay where they were drawn
+REDRAW_MARGIN = 10
+
+_clear_count = 0
+
+
+def supports_ansi(stream=None):
+    stream = stream or sys.stdout
+    return os.name != "nt" and stream.isatty()
+
+
+def move_cursor(row, column=1):
+    return f"\033[{row};{column}H"
+
+
+def clear_screen(text=""):
+    """Clears the screen, then writes text to it in the same write."""
+    global _clear_count
+    _clear_count += 1
+    if os.name == "nt":
+        os.system("cls")
+        sys.stdout.write(text)
+    else:
+        sys.stdout.write(CLEAR_SCREEN_SEQUENCE + text)
+    sys.stdout.flush()
+
+
+@contextmanager
+def buffered_output():
+    """Collects everything printed inside the with block and writes it to stdout at once.
+
+    Only wrap output: a prompt printed by input() inside the block would not be shown
+    until the block ends.
+    """
+    stdout = sys.stdout
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield buffer
+    finally:
+        stdout.write(buffer.getvalue())
+        stdout.flush()
+
+
+class PagedScreen:
+    """Draws the frames of a paged view, redrawing only the lines that changed.
+
+    The first frame, and any frame after the screen was cleared elsewhere, clears the
+    screen and is drawn in full. Later frames move the cursor to each changed line and
+    rewrite it, then clear whatever was printed below the previous frame. Terminals
+    without ANSI support, and output that is not a terminal, always get full frames.
+    """
+
+    def __init__(self):
+        self.__lines = None
+        self.__clear_count = None
+
+    def __can_redraw(self, lines, stream):
+        return (
+            self.__lines is not None
+            and self.__clear_count == _clear_count
+            and supports_ansi(stream)
+            and len(lines) + REDRAW_MARGIN <= shutil.get_terminal_size().lines
+        )
+
+    def show(self, text):
+        """Draws a frame, given as the text of the whole screen."""
+        if not text.endswith("\n"):
+            text += "\n"
+        lines = text.split("\n")
+        stream = sys.stdout
+
+        if self.__can_redraw(lines, stream):
+            previous_lines = self.__lines
+            changed = [
+                move_cursor(row) + line + CLEAR_LINE_END
+                for row, line in enumerate(lines, start=1)
+                if row > len(previous_lines) or previous_lines[row - 1] != line
+            ]
+            # leave the cursor below the frame, where it would be after a full draw
+            stream.write("".join(changed) + move_cursor(len(lines)) + CLEAR_SCREEN_END)
+            stream.flush()
+            increment("screen.lines_redrawn", len(changed))
+        else:
+            clear_screen(text)
+            increment("screen.lines_redrawn", len(lines) - 1)
+        increment("screen.frames")
+
+        self.__lines = lines
+        self.__clear_count = _clear_count
+
+    @contextmanager
+    def frame(self):
+        """Collects everything printed inside the with block and draws it as one frame."""
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            yield buffer
+        self.show(buffer.getvalue())
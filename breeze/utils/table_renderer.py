@@ -0,0 +1,94 @@
+import sys
+from itertools import chain, islice
+
+from breeze.utils.ansi_utils import get_visible_width, strip_ansi_codes
+
+DEFAULT_SAMPLE_SIZE = 100
+
+
+def fit_cell(cell, width):
+    """Pads a cell to a visible width, truncating it with "..." if it is too wide."""
+    text = str(cell)
+    visible_width = get_visible_width(text)
+    if visible_width > width:
+        text = strip_ansi_codes(text)
+        text = text[: max(width - 3, 0)] + "..." if width > 3 else text[:width]
+        visible_width = len(text)
+    return text + " " * (width - visible_width)
+
+
+def get_column_widths(headers, rows):
+    """Returns the widest visible width of each column over the headers and rows."""
+    widths = [get_visible_width(str(header)) for header in headers]
+    for row in rows:
+        for index, cell in enumerate(row):
+            widths[index] = max(widths[index], get_visible_width(str(cell)))
+    return widths
+
+
+def stream_table(
+    headers,
+    rows,
+    widths=None,
+    sample_size=DEFAULT_SAMPLE_SIZE,
+    max_width=None,
+    page_size=None,
+    on_page_end=None,
+    write=None,
+):
+    """Writes a table row by row, without building the whole table in memory.
+
+    Column widths are either fixed or taken from a sample of the first rows. Later cells
+    that do not fit are truncated, so every row costs the same however many rows follow.
+
+    Args:
+        headers (list of str): Column headers.
+        rows (iterable of list): The rows. Can be a generator.
+        widths (list of int, optional): Fixed column widths. Defaults to sampled widths.
+        sample_size (int, optional): Number of rows to size the columns from. None samples
+            every row, which is only sensible for rows that are already in memory.
+        max_width (int, optional): Widest a sampled column can be. Wider cells are
+            truncated with "...".
+        page_size (int, optional): Rows per page. The frame is closed after each page.
+        on_page_end (callable, optional): Called with the page number after each full page;
+            return False to stop printing.
+        write (callable, optional): Writes a string. Defaults to sys.stdout.write.
+
+    Returns:
+        int: The number of rows written.
+    """
+    write = write or sys.stdout.write
+    rows = iter(rows)
+    if widths is None:
+        sample = list(rows if sample_size is None else islice(rows, sample_size))
+        widths = get_column_widths(headers, sample)
+        if max_width:
+            widths = [min(width, max_width) for width in widths]
+        rows = chain(sample, rows)
+
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+\n"
+    header_line = (
+        "| "
+        + " | ".join(str(header).center(width) for header, width in zip(headers, widths))
+        + " |\n"
+    )
+    blank_cells = [""] * len(widths)
+
+    def write_header():
+        write(separator)
+        write(header_line)
+        write(separator)
+
+    write_header()
+    written = 0
+    for row in rows:
+        if page_size and written and written % page_size == 0:
+            write(separator)
+            if on_page_end and on_page_end(written // page_size) is False:
+                return written
+            write_header()
+        cells = chain(row, blank_cells[len(row):])
+        write("| " + " | ".join(fit_cell(cell, width) for cell, width in zip(cells, widths)) + " |\n")
+        written += 1
+    write(separator)
+    return written
@@ -0,0 +1,103 @@
+import bisect
+import math
+import re
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenise(*texts):
+    """Splits texts into case-folded word tokens.
+
+    Returns:
+        list of str: The tokens, in order of appearance.
+    """
+    tokens = []
+    for text in texts:
+        if text:
+            tokens.extend(TOKEN_PATTERN.findall(str(text).casefold()))
+    return tokens
+
+
+class InvertedIndex:
+    """An incrementally maintained inverted index over short documents.
+
+    Each document (e.g. a journal entry) is stored as token counts under its id. A sorted
+    vocabulary allows every query token to match as a prefix, so "anx" finds "anxiety".
+    Results are ranked with a simple TF-IDF score.
+    """
+
+    def __init__(self):
+        self.__postings = {}
+        self.__documents = {}
+        self.__vocabulary = []
+
+    def add(self, doc_id, *texts):
+        """Indexes a document, replacing any previous version with the same id."""
+        self.remove(doc_id)
+        counts = Counter(tokenise(*texts))
+        self.__documents[doc_id] = counts
+        for token, count in counts.items():
+            postings = self.__postings.get(token)
+            if postings is None:
+                postings = self.__postings[token] = {}
+                bisect.insort(self.__vocabulary, token)
+            postings[doc_id] = count
+
+    def remove(self, doc_id):
+        """Removes a document from the index."""
+        for token in self.__documents.pop(doc_id, ()):
+            postings = self.__postings[token]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.__postings[token]
+                position = bisect.bisect_left(self.__vocabulary, token)
+                del self.__vocabulary[position]
+
+    def __expand(self, prefix):
+        position = bisect.bisect_left(self.__vocabulary, prefix)
+        while position < len(self.__vocabulary) and self.__vocabulary[position].startswith(prefix):
+            yield self.__vocabulary[position]
+            position += 1
+
+    def search(self, query):
+        """Finds the documents that match every token of the query as a word prefix.
+
+        Args:
+            query (str): The search query.
+
+        Returns:
+            list: Matching document ids, best match first.
+        """
+        query_tokens = tokenise(query)
+        if not query_tokens:
+            return []
+
+        total_documents = len(self.__documents)
+        scores = None
+        for query_token in query_tokens:
+            token_scores = {}
+            for token in self.__expand(query_token):
+                postings = self.__postings[token]
+                idf = math.log(1 + total_documents / len(postings))
+                for doc_id, count in postings.items():
+                    token_scores[doc_id] = token_scores.get(doc_id, 0) + count * idf
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    doc_id: score + token_scores[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in token_scores
+                }
+            if not scores:
+                return []
+
+        return sorted(scores, key=scores.get, reverse=True)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.__documents
+
+    def __len__(self):
+        return len(self.__documents)
@@ -1,19 +1,38 @@
+import argparse
 import os
 import json
 import random
+import shutil
+import tempfile
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+DEFAULT_OUTPUT_PATH = os.path.join("data", "users.json")
+
+# Fixed "now" for the whole run, so every generated date agrees with the others and a
+# seeded run can be reproduced exactly with --today
+reference_time = None
+
+
+def current_time():
+    return reference_time or datetime.now()
+
+
+def random_uuid():
+    """Returns a random version 4 UUID drawn from the seeded generator, unlike uuid.uuid4()."""
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
 
 
 def random_datetime_within_week():
-    today = datetime.now()
+    today = current_time()
     start_of_week = today - timedelta(days=today.weekday())  # Monday
     end_of_week = start_of_week + timedelta(days=6)  # Sunday
     return random_datetime(start_of_week, end_of_week)
 
 
 def random_date_next_weekdays():
-    today = datetime.now()
+    today = current_time()
 
     weekdays = [today]
     for i in range(1, 6):
@@ -34,7 +53,7 @@ def random_date_next_last(next_last):
     for i in range(7):
         if next_last == "last":
             i += 1
-        last_day = (datetime.now() + timedelta(days=i * j)).date()
+        last_day = (current_time() + timedelta(days=i * j)).date()
         if last_day.weekday() in (5, 6):
             continue
         else:
@@ -49,7 +68,7 @@ def random_datetime(start, end):
 
 
 def random_date_of_birth(min_age=18, max_age=80):
-    today = datetime.now()
+    today = current_time()
     birth_year = today.year - random.randint(min_age, max_age)
     birth_month = random.randint(1, 12)
     birth_day = random.randint(1, 28)  # Avoid invalid dates
@@ -121,7 +140,39 @@ def random_first_last_name():
     return first_name, last_name
 
 
-def generate_mood_entries(num_entries):
+@lru_cache(maxsize=4)
+def get_day_prefixes(end, history_days):
+    """Returns the "DD-MM-YYYY" dates of the last history_days days ending on end, oldest first."""
+    return [(end - timedelta(days=day)).strftime("%d-%m-%Y") for day in range(history_days - 1, -1, -1)]
+
+
+def random_timestamps(num_entries=None, history_days=7, per_day=None):
+    """Returns sorted "DD-MM-YYYY HH:MM:SS" timestamps over the last history_days days.
+
+    Either num_entries timestamps are spread at random over the whole period, or each day
+    gets per_day timestamps on average (a fractional part is a chance of one more).
+    """
+    end = current_time()
+    start = end - timedelta(days=history_days)
+    if per_day is None:
+        dates = sorted(random_datetime(start, end) for _ in range(num_entries))
+        return [date.strftime("%d-%m-%Y %H:%M:%S") for date in dates]
+
+    # Dates are formatted once per run and times are built from seconds after midnight
+    whole, fraction = divmod(per_day, 1)
+    last_second = end.hour * 3600 + end.minute * 60 + end.second
+    prefixes = get_day_prefixes(end, history_days)
+    timestamps = []
+    for day, prefix in enumerate(prefixes):
+        day_seconds = last_second + 1 if day == history_days - 1 else 86400
+        count = int(whole) + (random.random() < fraction)
+        for second in sorted(random.randrange(day_seconds) for _ in range(count)):
+            minutes, second = divmod(second, 60)
+            timestamps.append(f"{prefix} {minutes // 60:02d}:{minutes % 60:02d}:{second:02d}")
+    return timestamps
+
+
+def generate_mood_entries(num_entries, history_days=7, per_day=None):
     moods = {
         "Very Happy": [":D", "Feeling awesome!", "Love this feeling!"],
         "Happy": [":)", "Feel good.", "Life is good."],
@@ -129,31 +180,25 @@ def generate_mood_entries(num_entries):
         "Sad": ["Feeling bad.", "Feeling a bit down.", ":/"],
         "Very Sad": ["Feel terrible.", "Feeling awful right now.", ":("],
     }
+    mood_names = list(moods)
 
-    dates = [
-        random_datetime(datetime.now() - timedelta(days=7), datetime.now()).strftime("%d-%m-%Y %H:%M:%S")
-        for i in range(num_entries)
-    ]
-    dates = sorted(dates)
-    moods_list = [random.choice(list(moods.keys())) for i in range(num_entries)]
-    return [
-        {
-            "id": str(uuid.uuid4()),
-            "mood": moods_list[i - 1],
-            "comment": random.choice(moods[moods_list[i - 1]]),
-            "date": dates[i],
-        }
-        for i in range(num_entries)
-    ]
+    entries = []
+    for date in random_timestamps(num_entries, history_days, per_day):
+        mood = random.choice(mood_names)
+        entries.append(
+            {
+                "id": random_uuid(),
+                "mood": mood,
+                "comment": random.choice(moods[mood]),
+                "date": date,
+            }
+        )
+    return entries
 
 
-def generate_journals(num_entries):
+def generate_journals(num_entries, history_days=7, per_day=None):
 
-    dates = [
-        random_datetime(datetime.now() - timedelta(days=7), datetime.now()).strftime("%d-%m-%Y %H:%M:%S")
-        for i in range(num_entries)
-    ]
-    dates = sorted(dates)
+    dates = random_timestamps(num_entries, history_days, per_day)
     journal_texts = [
         "Today was amazing! I felt so accomplished after finishing my project. Everything just clicked.",
         "I had a rough day. It feels like nothing I do is enough, and it's weighing on me.",
@@ -179,13 +224,13 @@ def generate_journals(num_entries):
 
     return [
         {
-            "id": str(uuid.uuid4()),
+            "id": random_uuid(),
             "title": f"Journal Entry {i + 1}",
             "text": random.choice(journal_texts),
-            "date": dates[i],
-            "last_update": dates[i],
+            "date": date,
+            "last_update": date,
         }
-        for i in range(num_entries)
+        for i, date in enumerate(dates)
     ]
 
 
@@ -195,7 +240,7 @@ def generate_conditions():
         random.choice(conditions): [
             {
                 "note": f"Details about {random.choice(conditions)}.",
-                "timestamp": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+                "timestamp": current_time().strftime("%d-%m-%Y %H:%M:%S"),
             }
         ]
     }
@@ -208,39 +253,39 @@ def generate_prescriptions():
             "medication": random.choice(medications),
             "dosage": f"{random.randint(1, 3)} mg",
             "frequency": "once daily",
-            "start_date": (datetime.now() - timedelta(days=30)).strftime("%d-%m-%Y"),
-            "end_date": (datetime.now() + timedelta(days=180)).strftime("%d-%m-%Y"),
+            "start_date": (current_time() - timedelta(days=30)).strftime("%d-%m-%Y"),
+            "end_date": (current_time() + timedelta(days=180)).strftime("%d-%m-%Y"),
             "notes": "Take with food.",
         }
     ]
 
 
-def generate_appointments(patients, mhwps):
-    statuses = ["requested", "confirmed", "cancelled"]
-    summaries = [
-        "Discussed coping strategies for anxiety, set goals.",
-        "Reviewed sleep habits; introduced mindfulness exercises.",
-        "Explored stress triggers; created a relaxation plan.",
-        "Focused on emotional regulation; reviewed progress.",
-        "Addressed work-life balance challenges; set boundaries.",
-        "Discussed past trauma and initiated processing therapy.",
-        "Worked on social anxiety; practiced exposure techniques.",
-        "Identified cognitive distortions; introduced CBT tools.",
-        "Explored grief and coping strategies for loss.",
-        "Focused on self-esteem building activities and affirmations.",
-        "Reviewed progress on anger management techniques.",
-        "Introduced journaling as a tool for emotional expression.",
-        "Worked on communication skills in relationships.",
-        "Explored values and goal alignment in life planning.",
-        "Discussed medication effects; adjusted treatment plan.",
-        "Processed recent life changes; emphasized resilience.",
-        "Focused on grounding techniques for managing panic.",
-        "Explored triggers for depression; planned positive activities.",
-        "Reviewed progress with therapy goals and setbacks.",
-        "Addressed guilt and worked on self-forgiveness strategies.",
-    ]
-
-    appointments = []
+APPOINTMENT_STATUSES = ["requested", "confirmed", "cancelled"]
+APPOINTMENT_SUMMARIES = [
+    "Discussed coping strategies for anxiety, set goals.",
+    "Reviewed sleep habits; introduced mindfulness exercises.",
+    "Explored stress triggers; created a relaxation plan.",
+    "Focused on emotional regulation; reviewed progress.",
+    "Addressed work-life balance challenges; set boundaries.",
+    "Discussed past trauma and initiated processing therapy.",
+    "Worked on social anxiety; practiced exposure techniques.",
+    "Identified cognitive distortions; introduced CBT tools.",
+    "Explored grief and coping strategies for loss.",
+    "Focused on self-esteem building activities and affirmations.",
+    "Reviewed progress on anger management techniques.",
+    "Introduced journaling as a tool for emotional expression.",
+    "Worked on communication skills in relationships.",
+    "Explored values and goal alignment in life planning.",
+    "Discussed medication effects; adjusted treatment plan.",
+    "Processed recent life changes; emphasized resilience.",
+    "Focused on grounding techniques for managing panic.",
+    "Explored triggers for depression; planned positive activities.",
+    "Reviewed progress with therapy goals and setbacks.",
+    "Addressed guilt and worked on self-forgiveness strategies.",
+]
+
+
+def get_time_slots():
     time_slots = []
     for hour in range(9, 17):
         for minute in ["00", "30"]:
@@ -250,96 +295,83 @@ def generate_appointments(patients, mhwps):
             display_hour = 12 if hour == 12 else display_hour
 
             time_slots.append(f"{display_hour}:{minute} {am_pm}")
+    return time_slots
 
-    generated_appointments = set()
 
-    for patient in patients:
-        assigned_mhwp = patient["assignedMHWP"]
-        if assigned_mhwp:
-            for i in range(2):
-                # generate elapsed appointments first
-                next_last = "last" if i == 0 else "next"
-                num_appointments = random.randint(
-                    1, 3
-                )  # Generate 1-3 appointments per patient
-                for _ in range(num_appointments):
-                    appointment_date = random_date_next_last(next_last).strftime(
-                        "%d-%m-%Y"
-                    )
-                    appointment_time = random.choice(time_slots)
-
-                    appointment_key = (
-                        appointment_date,
-                        appointment_time,
-                        assigned_mhwp,
-                    )
-
-                    if appointment_key in generated_appointments:
-                        continue
-                    else:
-                        generated_appointments.add(appointment_key)
-
-                    appointment = {
-                        "appointmentId": str(uuid.uuid4()),
-                        "date": appointment_date,
-                        "time": appointment_time,
-                        "status": random.choice(statuses) if i == 1 else "confirmed",
-                        "mhwpUsername": assigned_mhwp,
-                        "patientUsername": patient["username"],
-                    }
-
-                    # Add comment if appointment was in the past
-                    if i == 0:
-                        appointment["summary"] = random.choice(summaries)
-
-                    # Add the appointment to the global list
-                    appointments.append(appointment)
-
-                    # Link the appointment ID to the patient
-                    if "appointments" not in patient:
-                        patient["appointments"] = []
-                    patient["appointments"].append(appointment["appointmentId"])
-
-                    # Link the appointment ID to the assigned MHWP
-                    for mhwp in mhwps:
-                        if mhwp["username"] == assigned_mhwp:
-                            if "appointments" not in mhwp:
-                                mhwp["appointments"] = []
-                            mhwp["appointments"].append(appointment["appointmentId"])
-                            break
+def generate_patient_appointments(patient, mhwp, time_slots, generated_appointments):
+    """Generates past and upcoming appointments of a patient with their assigned MHWP.
+
+    The appointment IDs are linked to both the patient and the MHWP. Slots already in
+    generated_appointments are skipped, so an MHWP is never double booked.
+    """
+    appointments = []
+    assigned_mhwp = mhwp["username"]
+    for i in range(2):
+        # generate elapsed appointments first
+        next_last = "last" if i == 0 else "next"
+        num_appointments = random.randint(1, 3)  # Generate 1-3 appointments per patient
+        for _ in range(num_appointments):
+            appointment_date = random_date_next_last(next_last).strftime("%d-%m-%Y")
+            appointment_time = random.choice(time_slots)
+
+            appointment_key = (
+                appointment_date,
+                appointment_time,
+                assigned_mhwp,
+            )
+
+            if appointment_key in generated_appointments:
+                continue
+            else:
+                generated_appointments.add(appointment_key)
+
+            appointment = {
+                "appointmentId": random_uuid(),
+                "date": appointment_date,
+                "time": appointment_time,
+                "status": random.choice(APPOINTMENT_STATUSES) if i == 1 else "confirmed",
+                "mhwpUsername": assigned_mhwp,
+                "patientUsername": patient["username"],
+            }
+
+            # Add comment if appointment was in the past
+            if i == 0:
+                appointment["summary"] = random.choice(APPOINTMENT_SUMMARIES)
+
+            appointments.append(appointment)
+
+            # Link the appointment ID to the patient and the assigned MHWP
+            patient.setdefault("appointments", []).append(appointment["appointmentId"])
+            mhwp.setdefault("appointments", []).append(appointment["appointmentId"])
 
     return appointments
 
 
-def generate_patients(num_patients, mhwp_usernames):
+def generate_patient(index, assigned_mhwp, history_days=7, moods_per_day=None, journals_per_day=None):
+    """Generates one patient. Without a rate per day, 2-15 moods and 1-5 journals are spread
+    over the history."""
     genders = ["Male", "Female", "Non-binary", "Other"]
-    patients = []
-    for i in range(1, num_patients + 1):
-        assigned_mhwp = mhwp_usernames[(i - 1) % len(mhwp_usernames)]
-        first_name, last_name = random_first_last_name()
-        patients.append(
-            {
-                "username": f"patient{i}",
-                "password": "",
-                "role": "Patient",
-                "isDisabled": False,
-                "information": {
-                    "firstName": first_name,
-                    "lastName": last_name,
-                    "email": f"patient{i}@example.com",
-                    "emergencyContactEmail": f"emergency.patient{i}@example.com",
-                    "gender": random.choice(genders),
-                    "dateOfBirth": random_date_of_birth(),
-                },
-                "assignedMHWP": assigned_mhwp,
-                "moods": generate_mood_entries(random.randint(2, 15)),
-                "journals": generate_journals(random.randint(1, 5)),
-                "appointments": [],
-                "conditions": generate_conditions(),
-                "prescriptions": generate_prescriptions(),
-            }
-        )
-    return patients
+    first_name, last_name = random_first_last_name()
+    return {
+        "username": f"patient{index}",
+        "password": "",
+        "role": "Patient",
+        "isDisabled": False,
+        "information": {
+            "firstName": first_name,
+            "lastName": last_name,
+            "email": f"patient{index}@example.com",
+            "emergencyContactEmail": f"emergency.patient{index}@example.com",
+            "gender": random.choice(genders),
+            "dateOfBirth": random_date_of_birth(),
+        },
+        "assignedMHWP": assigned_mhwp,
+        "moods": generate_mood_entries(random.randint(2, 15), history_days, moods_per_day),
+        "journals": generate_journals(random.randint(1, 5), history_days, journals_per_day),
+        "appointments": [],
+        "conditions": generate_conditions(),
+        "prescriptions": generate_prescriptions(),
+    }
 
 
 def generate_mhwps(num_mhwps):
@@ -379,32 +411,147 @@ def generate_admin():
     }
 
 
-def main():
-    num_patients = 10
-    num_mhwps = 3
-
+class JsonArrayWriter:
+    """Writes the items of a JSON array one at a time, so they never all sit in memory."""
+
+    def __init__(self, file, indent=None, depth=2):
+        self.file = file
+        self.indent = indent
+        self.newline = "\n" + " " * (indent or 0) * depth if indent else ""
+        self.count = 0
+
+    def write(self, item):
+        text = json.dumps(item, indent=self.indent)
+        if self.indent:
+            text = text.replace("\n", self.newline)
+        self.file.write(("," if self.count else "") + self.newline + text)
+        self.count += 1
+
+
+def write_dataset(
+    file_path,
+    num_patients=10,
+    num_mhwps=3,
+    history_days=7,
+    moods_per_day=None,
+    journals_per_day=None,
+    indent=4,
+):
+    """Generates the users and appointments and streams them to a users.json file.
+
+    Patients are written as soon as they are generated and appointments are spooled to a
+    temporary file, so memory stays bounded by one patient's history plus the MHWPs' ID
+    lists. The file is written next to the target and moved into place when complete.
+
+    Returns:
+        tuple: (number of users, number of appointments) written.
+    """
     mhwps = generate_mhwps(num_mhwps)
-    patients = generate_patients(num_patients, [mhwp["username"] for mhwp in mhwps])
-    appointments = generate_appointments(patients, mhwps)
-
-    for patient in patients:
-        assigned_mhwp = patient["assignedMHWP"]
-        for mhwp in mhwps:
-            if mhwp["username"] == assigned_mhwp:
-                mhwp["assignedPatients"].append(patient["username"])
-
-    users = patients + mhwps + [generate_admin()]
-
-    data = {
-        "appointments": appointments,
-        "users": users,
-    }
-
-    os.makedirs("data", exist_ok=True)
-    with open("data/users.json", "w") as file:
-        json.dump(data, file, indent=4)
+    mhwps_by_username = {mhwp["username"]: mhwp for mhwp in mhwps}
+    mhwp_usernames = list(mhwps_by_username)
+    time_slots = get_time_slots()
+    generated_appointments = set()
 
-    print("Dummy data has been generated and saved to 'data/users.json'.")
+    pad = " " * indent if indent else ""
+    newline = "\n" if indent else ""
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{file_path}.tmp"
+
+    with open(temp_path, "w") as file, tempfile.TemporaryFile("w+") as appointment_file:
+        users = JsonArrayWriter(file, indent)
+        appointments = JsonArrayWriter(appointment_file, indent)
+
+        file.write("{" + newline + pad + '"users": [')
+        for i in range(1, num_patients + 1):
+            patient = generate_patient(
+                i,
+                mhwp_usernames[(i - 1) % len(mhwp_usernames)],
+                history_days,
+                moods_per_day,
+                journals_per_day,
+            )
+            mhwp = mhwps_by_username[patient["assignedMHWP"]]
+            mhwp["assignedPatients"].append(patient["username"])
+            for appointment in generate_patient_appointments(
+                patient, mhwp, time_slots, generated_appointments
+            ):
+                appointments.write(appointment)
+            users.write(patient)
+
+        for user in mhwps + [generate_admin()]:
+            users.write(user)
+        file.write(newline + pad + "]," + newline + pad + '"appointments": [')
+
+        appointment_file.seek(0)
+        shutil.copyfileobj(appointment_file, file)
+        file.write(newline + pad + "]" + newline + "}" + newline)
+
+    os.replace(temp_path, file_path)
+    return users.count, appointments.count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generates dummy data for Breeze.")
+    parser.add_argument("--patients", type=int, default=10, help="number of patients (default: 10)")
+    parser.add_argument("--mhwps", type=int, default=3, help="number of MHWPs (default: 3)")
+    parser.add_argument(
+        "--years",
+        type=float,
+        help="years of mood and journal history per patient (default: the last week)",
+    )
+    parser.add_argument(
+        "--moods-per-day",
+        type=float,
+        help="average moods per patient per day (default: 2-15 moods in total)",
+    )
+    parser.add_argument(
+        "--journals-per-day",
+        type=float,
+        help="average journals per patient per day (default: 1-5 journals in total)",
+    )
+    parser.add_argument("--seed", type=int, help="random seed, for reproducible data")
+    parser.add_argument(
+        "--today",
+        type=lambda value: datetime.strptime(value, "%d-%m-%Y").replace(hour=12),
+        help="generate the data as if run at noon on this DD-MM-YYYY date",
+    )
+    parser.add_argument(
+        "--output", default=DEFAULT_OUTPUT_PATH, help=f"output file (default: {DEFAULT_OUTPUT_PATH})"
+    )
+    parser.add_argument(
+        "--indent", type=int, default=4, help="JSON indent, 0 for compact output (default: 4)"
+    )
+    args = parser.parse_args(argv)
+    if args.patients < 0 or args.mhwps < 1:
+        parser.error("--patients must not be negative and --mhwps must be at least 1")
+    return args
+
+
+def main(argv=None):
+    global reference_time
+
+    args = parse_args(argv)
+    if args.seed is not None:
+        random.seed(args.seed)
+    reference_time = args.today or datetime.now().replace(microsecond=0)
+    history_days = max(round(args.years * 365), 1) if args.years else 7
+
+    num_users, num_appointments = write_dataset(
+        args.output,
+        num_patients=args.patients,
+        num_mhwps=args.mhwps,
+        history_days=history_days,
+        moods_per_day=args.moods_per_day,
+        journals_per_day=args.journals_per_day,
+        indent=args.indent or None,
+    )
+
+    print(
+        f"Dummy data has been generated and saved to '{args.output}' "
+        f"({num_users} users, {num_appointments} appointments)."
+    )
 
 
 if __name__ == "__main__":
@@ -1,7 +1,28 @@
+import argparse
+import importlib.util
 import os
-import subprocess
-import sys
 from breeze.app import BreezeApp
+from breeze.services.auth_service import AuthService
+from breeze.utils.instrumentation import (
+    INSTRUMENT_ENV_VAR,
+    enable_from_environment,
+    is_requested_by_environment,
+)
+from breeze.utils.pacing import PACING_ENV_VAR, PACING_POLICIES, set_policy
+
+
+def load_seeder(seeder_script_path):
+    """Imports seeder.py as a module, so it can run in this interpreter."""
+    spec = importlib.util.spec_from_file_location("seeder", seeder_script_path)
+    seeder = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(seeder)
+    return seeder
+
+
+def migrate_passwords(users_file_path):
+    """Hashes every plaintext password in the data file in one batch and saves once."""
+    migrated = AuthService(users_file_path).migrate_plaintext_passwords()
+    print(f"Hashed {migrated} plaintext password(s) in {users_file_path}.")
 
 
 def run_seeder():
@@ -10,15 +31,61 @@ def run_seeder():
 
     if not os.path.exists(users_file_path):
         try:
-            subprocess.run([sys.executable, seeder_script_path], check=True)
+            load_seeder(seeder_script_path).main([])
             print("Seeder script ran successfully.")
-        except subprocess.CalledProcessError as e:
+            # The seeder writes plaintext passwords, so hash them before anyone logs in
+            migrate_passwords(users_file_path)
+        except Exception as e:
             print(f"Error while running seeder.py: {e}")
     else:
         print("users.json already exists.")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Breeze - Mental Health Management System")
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help=f"record timers and counters and write them to a file on exit (or set {INSTRUMENT_ENV_VAR}=1)",
+    )
+    parser.add_argument(
+        "--metrics-file", help="file for the metrics summary (default: breeze_metrics.json)"
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        help="also write the metrics summary every this many seconds",
+    )
+    parser.add_argument(
+        "--profile", metavar="FILE", help="profile the session with cProfile and dump the stats to FILE"
+    )
+    parser.add_argument(
+        "--pacing",
+        choices=PACING_POLICIES,
+        help=f"what pauses after messages do: sleep (default), none or prompt for Enter (or set {PACING_ENV_VAR})",
+    )
+    parser.add_argument(
+        "--pacing-scale", type=float, help="multiplier for pause durations with the sleep policy"
+    )
+    parser.add_argument(
+        "--migrate-passwords",
+        action="store_true",
+        help="hash every plaintext password in data/users.json, then exit",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    if args.instrument or args.profile or is_requested_by_environment():
+        enable_from_environment(args.metrics_file, args.profile, args.metrics_interval)
+    if args.pacing or args.pacing_scale is not None:
+        set_policy(args.pacing or "sleep", args.pacing_scale)
+
+    if args.migrate_passwords:
+        migrate_passwords(os.path.join("data", "users.json"))
+        return
+
     run_seeder()
 
     app = BreezeApp()
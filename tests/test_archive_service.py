@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+
+from breeze.models.appointment_entry import AppointmentEntry
+from breeze.models.mhwp import MHWP
+from breeze.models.patient import Patient
+from breeze.services.archive_service import HistoryArchive, archive_history, make_record
+from breeze.services.auth_service import AuthService
+
+TODAY = datetime.date(2025, 6, 1)
+
+
+@pytest.fixture
+def auth_service(tmp_path):
+    service = AuthService(str(tmp_path / "users.json"))
+    mhwp = MHWP("mhwp1", "secret", "Mia", "Hall", "mia@example.com")
+    patient = Patient("pat1", "secret", "Pat", "Lee", "pat@example.com")
+    service.add_user(mhwp)
+    service.add_user(patient)
+    service.assign_patient_to_mhwp(patient, mhwp)
+
+    patient.add_journal_entry("j1", "Old news", "a rainy walk", "10-03-2023 09:00:00")
+    patient.add_journal_entry("j2", "Older", "a sunny walk", "10-12-2024 09:00:00")
+    patient.add_journal_entry("j3", "Recent", "a rainy day", "20-05-2025 09:00:00")
+    patient.add_mood_entry("m1", "Sad", "rainy", "10-03-2023 09:00:00")
+    patient.add_mood_entry("m2", "Happy", "sunny", "20-05-2025 09:00:00")
+    appointment = AppointmentEntry(
+        "06-01-2025", "10:00 AM", status="confirmed", mhwp_username="mhwp1",
+        patient_username="pat1", appointment_id="a1", summary="Talked about rainy days",
+    )
+    patient.add_appointment(appointment)
+    mhwp.add_appointment(appointment)
+    service.statistics.track_appointment(appointment)
+    return service
+
+
+@pytest.mark.parametrize("compression", ["gzip", "lzma"])
+def test_archive_moves_old_history_and_searches_it(auth_service, tmp_path, compression):
+    archive = HistoryArchive(str(tmp_path / "archive"), compression)
+
+    counts = archive_history(auth_service, archive, days=30, today=TODAY)
+
+    assert counts == {"mood": 1, "journal": 2, "appointment": 1}
+    assert archive.get_years() == [2023, 2024, 2025]
+    patient = auth_service.get_user_by_username("pat1")
+    assert [entry["id"] for entry in patient.get_journal_entries()] == ["j3"]
+    assert [entry["id"] for entry in patient.get_mood_entries()] == ["m2"]
+    assert patient.get_appointments() == []
+    assert auth_service.get_user_by_username("mhwp1").get_appointments() == []
+    assert auth_service.statistics.get_week_counts(datetime.date(2025, 1, 6))["confirmed"] == 0
+
+    # newest first, and only the matching user's records of one kind
+    results = archive.search("journal", "pat1")
+    assert [record["data"]["id"] for record in results] == ["j2", "j1"]
+    assert [record["data"]["id"] for record in archive.search("journal", "pat1", "rainy")] == ["j1"]
+    assert archive.search("journal", "pat1", years={2024})[0]["data"]["title"] == "Older"
+    assert archive.search("journal", "someone else") == []
+    assert archive.search("appointment", "pat1", "rainy")[0]["data"]["appointmentId"] == "a1"
+
+
+def test_archive_appends_streams_and_skips_duplicates(tmp_path):
+    archive = HistoryArchive(str(tmp_path / "archive"))
+    record = make_record("mood", "pat1", "10-03-2023 09:00:00", {"id": "m1", "mood": "Sad"})
+
+    archive.append({2023: [record]})
+    archive.append({2023: [record, make_record("mood", "pat1", "11-03-2023 09:00:00", {"id": "m2", "mood": "Happy"})]})
+
+    assert [record["data"]["id"] for record in archive.iter_records("mood", "pat1")] == ["m1", "m2"]
+
+
+def test_nothing_to_archive_leaves_no_files(auth_service, tmp_path):
+    archive = HistoryArchive(str(tmp_path / "archive"))
+
+    counts = archive_history(auth_service, archive, days=5000, today=TODAY)
+
+    assert counts == {"mood": 0, "journal": 0, "appointment": 0}
+    assert archive.get_files() == []
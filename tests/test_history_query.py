@@ -0,0 +1,64 @@
+import datetime
+
+from breeze.models.patient import Patient
+from breeze.utils.history_query import HistoryQuery, get_journal_query_engine, get_mood_query_engine
+
+
+def make_patient():
+    patient = Patient("pat", "secret")
+    patient.add_journal_entry("j1", "Calm", "calm morning", "01-01-2025 09:00:00")
+    patient.add_journal_entry("j2", "Calm day", "calm calm calm all day", "02-01-2025 09:00:00")
+    patient.add_journal_entry("j3", "Walk", "a calm walk", "03-01-2025 09:00:00")
+    patient.add_journal_entry("j4", "Busy", "a busy day", "04-01-2025 09:00:00")
+    return patient
+
+
+def get_ids(entries):
+    return [entry["id"] for entry in entries]
+
+
+def test_results_without_text_are_oldest_first():
+    # engines only hold their patient weakly, so keep it alive
+    patient = make_patient()
+    engine = get_journal_query_engine(patient)
+
+    assert get_ids(engine.run(HistoryQuery())) == ["j1", "j2", "j3", "j4"]
+
+
+def test_text_results_keep_the_rank_order_with_the_best_match_last():
+    patient = make_patient()
+    engine = get_journal_query_engine(patient)
+
+    results = get_ids(engine.run(HistoryQuery(text="calm")))
+
+    # history pages show the last item first, so the best match is shown first
+    assert results == list(reversed(patient.search_journal_entries("calm")))
+    assert results[-1] == "j2"
+
+
+def test_filters_stack_on_ranked_text_results():
+    patient = make_patient()
+    engine = get_journal_query_engine(patient)
+    query = HistoryQuery(text="calm", start_date=datetime.date(2025, 1, 2))
+
+    assert set(get_ids(engine.run(query))) == {"j2", "j3"}
+    assert get_ids(engine.run(query.with_filter(end_date=datetime.date(2025, 1, 2)))) == ["j2"]
+
+
+def test_mood_and_text_filters_combine():
+    patient = Patient("pat", "secret")
+    patient.add_mood_entry("m1", "Sad", "tired after work", "01-01-2025 09:00:00")
+    patient.add_mood_entry("m2", "Happy", "good day at work", "02-01-2025 09:00:00")
+    engine = get_mood_query_engine(patient)
+
+    assert get_ids(engine.run(HistoryQuery(text="work", mood="Happy"))) == ["m2"]
+
+
+def test_results_follow_history_changes():
+    patient = make_patient()
+    engine = get_journal_query_engine(patient)
+    query = HistoryQuery(text="busy")
+    assert get_ids(engine.run(query)) == ["j4"]
+
+    patient.delete_journal_entry("j4")
+    assert engine.run(query) == []
@@ -0,0 +1,87 @@
+import datetime
+
+from breeze.models.patient import Patient
+from breeze.services.mood_analytics_service import MoodAnalytics
+from breeze.utils.mood_aggregates import MoodAggregates
+
+# Monday 6 January 2025 to Wednesday 5 February 2025
+ENTRIES = [
+    {"id": "m1", "mood": "Very Sad", "date": "06-01-2025 09:00:00"},
+    {"id": "m2", "mood": "Happy", "date": "06-01-2025 18:00:00"},
+    {"id": "m3", "mood": "Neutral", "date": "08-01-2025 09:00:00"},
+    {"id": "m4", "mood": "Very Happy", "date": "05-02-2025 09:00:00"},
+]
+
+
+def test_bucket_counts_per_granularity():
+    aggregates = MoodAggregates(ENTRIES)
+
+    assert aggregates.get_buckets("day") == [
+        (datetime.date(2025, 1, 6), [1, 0, 0, 1, 0]),
+        (datetime.date(2025, 1, 8), [0, 0, 1, 0, 0]),
+        (datetime.date(2025, 2, 5), [0, 0, 0, 0, 1]),
+    ]
+    assert aggregates.get_buckets("week") == [
+        (datetime.date(2025, 1, 6), [1, 0, 1, 1, 0]),
+        (datetime.date(2025, 2, 3), [0, 0, 0, 0, 1]),
+    ]
+    assert aggregates.get_buckets("month") == [
+        (datetime.date(2025, 1, 1), [1, 0, 1, 1, 0]),
+        (datetime.date(2025, 2, 1), [0, 0, 0, 0, 1]),
+    ]
+    assert len(aggregates) == 4
+
+
+def test_remove_empties_and_drops_buckets():
+    aggregates = MoodAggregates(ENTRIES)
+
+    aggregates.remove(ENTRIES[0])
+    assert aggregates.get_buckets("day", end_date=datetime.date(2025, 1, 6)) == [
+        (datetime.date(2025, 1, 6), [0, 0, 0, 1, 0])
+    ]
+
+    aggregates.remove(ENTRIES[3])
+    assert [date for date, _ in aggregates.get_buckets("month")] == [datetime.date(2025, 1, 1)]
+    assert aggregates.get_date_range() == (datetime.date(2025, 1, 6), datetime.date(2025, 1, 8))
+    assert len(aggregates) == 2
+
+
+def test_window_and_last_buckets():
+    aggregates = MoodAggregates(ENTRIES)
+
+    window = aggregates.get_buckets(
+        "day", start_date=datetime.date(2025, 1, 7), end_date=datetime.date(2025, 1, 31)
+    )
+    assert window == [(datetime.date(2025, 1, 8), [0, 0, 1, 0, 0])]
+    assert aggregates.get_buckets("day", last=1) == [(datetime.date(2025, 2, 5), [0, 0, 0, 0, 1])]
+    assert aggregates.get_average("week") == [
+        (datetime.date(2025, 1, 6), (1 + 4 + 3) / 3),
+        (datetime.date(2025, 2, 3), 5.0),
+    ]
+
+
+def test_patient_keeps_aggregates_in_step_with_mood_changes():
+    patient = Patient("pat", "secret")
+    patient.add_mood_entry("m1", "Sad", "", "06-01-2025 09:00:00")
+    patient.add_mood_entry("m1", "Happy", "", "06-01-2025 09:00:00")
+    patient.add_mood_entry("m2", "Neutral", "", "07-01-2025 09:00:00")
+    patient.delete_mood_entry("m2")
+
+    assert patient.get_mood_aggregates().get_buckets("day") == [
+        (datetime.date(2025, 1, 6), [0, 0, 0, 1, 0])
+    ]
+
+
+def test_population_analytics_read_the_aggregates():
+    analytics = MoodAnalytics()
+    analytics.add("a", MoodAggregates(ENTRIES))
+    analytics.add("b", MoodAggregates([{"id": "x", "mood": "Sad", "date": "08-01-2025 12:00:00"}]))
+
+    assert len(analytics) == 5
+    assert analytics.get_distribution() == {
+        "Very Sad": 1, "Sad": 1, "Neutral": 1, "Happy": 1, "Very Happy": 1
+    }
+    assert analytics.get_distribution(datetime.date(2025, 1, 8), datetime.date(2025, 1, 8)) == {
+        "Very Sad": 0, "Sad": 1, "Neutral": 1, "Happy": 0, "Very Happy": 0
+    }
+    assert analytics.get_latest_averages(end_date=datetime.date(2025, 1, 31)) == {"a": 3.0, "b": 2.0}
@@ -0,0 +1,93 @@
+import datetime
+
+import pytest
+
+from breeze.models.appointment_entry import AppointmentEntry
+from breeze.models.mhwp import MHWP
+from breeze.models.patient import Patient
+from breeze.services.auth_service import AuthService
+from breeze.services.statistics_service import AdminStatistics, get_week_start
+
+MONDAY = datetime.date(2025, 1, 6)
+
+
+def make_appointment(date, status="requested", mhwp="mhwp1", patient="pat1"):
+    return AppointmentEntry(
+        date.strftime("%d-%m-%Y"), "10:00 AM", status=status, mhwp_username=mhwp, patient_username=patient
+    )
+
+
+def test_week_counts_follow_status_changes():
+    statistics = AdminStatistics()
+    appointment = make_appointment(MONDAY + datetime.timedelta(days=2))
+    statistics.track_appointment(appointment)
+    statistics.track_appointment(appointment)
+
+    assert statistics.get_week_counts(MONDAY) == {"requested": 1, "confirmed": 0, "cancelled": 0}
+
+    appointment.confirm_appointment()
+    assert statistics.get_week_counts(MONDAY) == {"requested": 0, "confirmed": 1, "cancelled": 0}
+    assert statistics.get_week_counts(MONDAY, "mhwp1")["confirmed"] == 1
+    assert statistics.get_week_counts(MONDAY, "mhwp2")["confirmed"] == 0
+
+    appointment.cancel_appointment()
+    assert statistics.get_week_counts(MONDAY) == {"requested": 0, "confirmed": 0, "cancelled": 1}
+
+
+def test_untracked_appointments_stop_counting():
+    statistics = AdminStatistics()
+    appointment = make_appointment(MONDAY, status="confirmed")
+    statistics.track_appointment(appointment)
+
+    statistics.untrack_appointment(appointment)
+    appointment.cancel_appointment()
+
+    assert statistics.get_week_counts(MONDAY) == {"requested": 0, "confirmed": 0, "cancelled": 0}
+
+
+def test_weekly_breakdown_is_latest_first():
+    statistics = AdminStatistics()
+    statistics.track_appointment(make_appointment(MONDAY - datetime.timedelta(weeks=1)))
+
+    breakdown = statistics.get_weekly_breakdown(2, today=MONDAY + datetime.timedelta(days=3))
+
+    assert [week for week, _ in breakdown] == [MONDAY, MONDAY - datetime.timedelta(weeks=1)]
+    assert breakdown[1][1]["requested"] == 1
+    assert get_week_start(MONDAY + datetime.timedelta(days=6)) == MONDAY
+
+
+@pytest.fixture
+def auth_service(tmp_path):
+    service = AuthService(str(tmp_path / "users.json"))
+    mhwp = MHWP("mhwp1", "secret", "Mia", "Hall", "mia@example.com")
+    patient = Patient("pat1", "secret", "Pat", "Lee", "pat@example.com")
+    service.add_user(mhwp)
+    service.add_user(patient)
+    service.assign_patient_to_mhwp(patient, mhwp)
+    appointment = make_appointment(MONDAY, status="confirmed")
+    patient.add_appointment(appointment)
+    mhwp.add_appointment(appointment)
+    service.statistics.track_appointment(appointment)
+    return service
+
+
+def test_user_totals_follow_disabling_and_removal(auth_service):
+    statistics = auth_service.statistics
+    assert statistics.get_user_totals()["Patient"] == {"active": 1, "disabled": 0}
+
+    auth_service.set_user_disabled(auth_service.get_user_by_username("pat1"), True)
+    assert statistics.get_user_totals()["Patient"] == {"active": 0, "disabled": 1}
+
+    auth_service.remove_user("pat1")
+    assert statistics.get_user_totals()["Patient"] == {"active": 0, "disabled": 0}
+
+
+def test_removing_both_users_untracks_their_appointment(auth_service):
+    statistics = auth_service.statistics
+
+    # the MHWP still holds the appointment, so it is still counted
+    auth_service.remove_user("pat1")
+    assert statistics.get_week_counts(MONDAY)["confirmed"] == 1
+
+    auth_service.remove_user("mhwp1")
+    assert statistics.get_week_counts(MONDAY)["confirmed"] == 0
@@ -0,0 +1,46 @@
+from breeze.models.patient import Patient
+from breeze.utils.text_index import InvertedIndex
+
+
+def test_search_ranks_the_best_match_first():
+    index = InvertedIndex()
+    index.add("once", "calm", "a walk in the park")
+    index.add("often", "calm", "calm calm and calm again")
+    index.add("never", "busy", "a long day at work")
+
+    assert index.search("calm") == ["often", "once"]
+
+
+def test_search_matches_every_token_as_a_prefix():
+    index = InvertedIndex()
+    index.add("a", "Anxiety", "before the exam")
+    index.add("b", "Anxious", "at work")
+
+    assert set(index.search("anx")) == {"a", "b"}
+    assert index.search("anx exam") == ["a"]
+    assert index.search("missing") == []
+
+
+def test_add_replaces_and_remove_forgets_a_document():
+    index = InvertedIndex()
+    index.add("a", "rainy day")
+    index.add("a", "sunny day")
+    assert index.search("rainy") == []
+    assert index.search("sunny") == ["a"]
+
+    index.remove("a")
+    assert index.search("day") == []
+    assert len(index) == 0
+
+
+def test_patient_search_follows_journal_changes():
+    patient = Patient("pat", "secret")
+    patient.add_journal_entry("j1", "Good day", "Went for a run", "01-01-2025 10:00:00")
+    assert patient.search_journal_entries("run") == ["j1"]
+
+    patient.edit_journal_entry("j1", "Stayed in and read", "02-01-2025 10:00:00")
+    assert patient.search_journal_entries("run") == []
+    assert patient.search_journal_entries("read") == ["j1"]
+
+    patient.delete_journal_entry("j1")
+    assert patient.search_journal_entries("good") == []
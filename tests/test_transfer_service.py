@@ -0,0 +1,132 @@
+import csv
+
+import pytest
+
+from breeze.services.auth_service import AuthService
+from breeze.services.transfer_service import APPOINTMENT_FIELDS, USER_FIELDS, TransferService
+from breeze.utils.credential_utils import ITERATIONS_ENV_VAR, verify_password
+
+USERS = [
+    {"role": "mhwp", "username": "mhwp1", "password": "pw", "first_name": "Mia", "last_name": "Hall",
+     "email": "mia@example.com"},
+    {"role": "patient", "username": "pat1", "password": "pw", "first_name": "Pat", "last_name": "Lee",
+     "email": "pat@example.com", "gender": "Female", "date_of_birth": "01-02-1990",
+     "emergency_contact_email": "kin@example.com", "assigned_mhwp": "mhwp1"},
+    # unknown gender and date of birth, and no MHWP: allocated one on import
+    {"role": "patient", "username": "pat2", "password": "pw", "first_name": "Sam", "last_name": "Ray",
+     "email": "sam@example.com"},
+]
+APPOINTMENTS = [
+    {"appointment_id": "a1", "date": "06-01-2025", "time": "10:00 AM", "status": "confirmed",
+     "mhwp_username": "mhwp1", "patient_username": "pat1", "summary": "First session"},
+    {"appointment_id": "a2", "date": "07-01-2025", "time": "10:00 AM", "status": "requested",
+     "mhwp_username": "mhwp1", "patient_username": "pat2"},
+]
+
+
+@pytest.fixture(autouse=True)
+def fast_hashing(monkeypatch):
+    monkeypatch.setenv(ITERATIONS_ENV_VAR, "1000")
+
+
+def write_csv(file_path, fieldnames, records):
+    with open(file_path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(records)
+    return str(file_path)
+
+
+def read_csv(file_path):
+    with open(file_path, newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def make_service(tmp_path, name):
+    return TransferService(AuthService(str(tmp_path / name)), batch_size=2)
+
+
+def test_import_validates_hashes_and_allocates(tmp_path):
+    service = make_service(tmp_path, "users.json")
+    users_file = write_csv(
+        tmp_path / "users.csv",
+        USER_FIELDS,
+        USERS + [{"role": "patient", "username": "bad", "first_name": "No", "last_name": "Email"}],
+    )
+
+    report = service.import_users(users_file)
+
+    assert (report.processed, report.succeeded) == (4, 3)
+    assert report.rejected == [(5, "email is missing or invalid")]
+    auth_service = service.auth_service
+    patient = auth_service.get_user_by_username("pat2")
+    assert patient.get_assigned_mhwp() == "mhwp1"
+    assert verify_password(patient.get_password(), "pw")
+    assert patient.get_password() != "pw"
+
+
+def test_import_rejects_patients_assigned_to_a_disabled_mhwp(tmp_path):
+    service = make_service(tmp_path, "users.json")
+    disabled_mhwp = {"role": "mhwp", "username": "mhwp2", "password": "pw", "first_name": "Dan",
+                     "last_name": "Cole", "email": "dan@example.com", "is_disabled": "True"}
+    patient = dict(USERS[1], username="pat3", email="pat3@example.com", assigned_mhwp="mhwp2")
+
+    # mhwp2 and pat3 land in the same batch, and a later batch checks the saved MHWP
+    report = service.import_users(
+        write_csv(tmp_path / "users.csv", USER_FIELDS, [disabled_mhwp, patient, USERS[0], patient])
+    )
+
+    assert report.succeeded == 2
+    assert report.rejected == [
+        (3, "assigned MHWP 'mhwp2' is disabled"),
+        (5, "assigned MHWP 'mhwp2' is disabled"),
+    ]
+    assert service.auth_service.get_user_by_username("pat3") is None
+
+
+def test_import_rejects_taken_appointment_slots(tmp_path):
+    service = make_service(tmp_path, "users.json")
+    service.import_users(write_csv(tmp_path / "users.csv", USER_FIELDS, USERS))
+    clash = dict(APPOINTMENTS[0], appointment_id="a3", patient_username="pat2")
+
+    report = service.import_appointments(
+        write_csv(tmp_path / "appointments.csv", APPOINTMENT_FIELDS, APPOINTMENTS + [clash])
+    )
+
+    assert report.succeeded == 2
+    assert report.rejected == [(4, "mhwp1 already has an appointment at 06-01-2025 10:00 AM")]
+
+
+def test_csv_export_imports_back_unchanged(tmp_path):
+    source = make_service(tmp_path, "source.json")
+    source.import_users(write_csv(tmp_path / "users.csv", USER_FIELDS, USERS))
+    source.import_appointments(write_csv(tmp_path / "appointments.csv", APPOINTMENT_FIELDS, APPOINTMENTS))
+    source.export_users(str(tmp_path / "exported_users.csv"))
+    source.export_appointments(str(tmp_path / "exported_appointments.csv"))
+
+    target = make_service(tmp_path, "target.json")
+    user_report = target.import_users(str(tmp_path / "exported_users.csv"))
+    appointment_report = target.import_appointments(str(tmp_path / "exported_appointments.csv"))
+
+    assert user_report.rejected == [] and user_report.succeeded == 3
+    assert appointment_report.rejected == [] and appointment_report.succeeded == 2
+    target.export_users(str(tmp_path / "reexported_users.csv"))
+    target.export_appointments(str(tmp_path / "reexported_appointments.csv"))
+    assert read_csv(tmp_path / "reexported_users.csv") == read_csv(tmp_path / "exported_users.csv")
+    assert read_csv(tmp_path / "reexported_appointments.csv") == read_csv(
+        tmp_path / "exported_appointments.csv"
+    )
+    # unknown details are exported empty rather than as placeholders
+    exported_patient = next(row for row in read_csv(tmp_path / "exported_users.csv") if row["username"] == "pat2")
+    assert exported_patient["gender"] == exported_patient["date_of_birth"] == ""
+
+
+def test_jsonl_reports_bad_lines(tmp_path):
+    service = make_service(tmp_path, "users.json")
+    users_file = tmp_path / "users.jsonl"
+    users_file.write_text('{"role": "mhwp", "username": "mhwp1"\n\n[1, 2]\n')
+
+    report = service.import_users(str(users_file))
+
+    assert report.succeeded == 0
+    assert report.rejected == [(1, "line is not a JSON object"), (3, "line is not a JSON object")]